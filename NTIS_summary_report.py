@@ -46,25 +46,20 @@ def run_script(script_name, description):
         return False
 
 def check_new_data():
-    """new_data.json에 신규 데이터가 있는지 확인"""
+    """공고 저장소에 마지막 크롤링의 신규 데이터가 있는지 확인"""
     try:
-        import json
-        if not os.path.exists("output/new_data.json"):
-            print("⚠️ new_data.json 파일이 없습니다.")
-            return False
-        
-        with open("output/new_data.json", 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        from src.utils.announcement_store import AnnouncementStore
+        new_count = AnnouncementStore.from_env().count_new()
         
-        if len(data) == 0:
+        if new_count == 0:
             print("⚠️ 신규 공고가 없습니다.")
             return False
         
-        print(f"✅ 신규 공고 {len(data)}건 발견!")
+        print(f"✅ 신규 공고 {new_count}건 발견!")
         return True
         
     except Exception as e:
-        print(f"❌ new_data.json 확인 실패: {str(e)}")
+        print(f"❌ 신규 공고 확인 실패: {str(e)}")
         return False
 
 def main():
@@ -87,7 +82,7 @@ def main():
         print("\n❌ 크롤링 단계에서 실패했습니다. 프로세스를 중단합니다.")
         return
     
-    # new_data.json 확인
+    # 신규 공고 확인
     print(f"\n{'='*60}")
     print("📊 신규 공고 확인")
     print(f"{'='*60}")
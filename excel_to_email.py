@@ -140,15 +140,22 @@ NTIS에서 신규 공고 {announcement_count}건이 발견되었습니다.
         return False
 
 def count_announcements():
-    """new_data.json에서 공고 개수 확인"""
+    """공고 저장소에서 마지막 크롤링의 신규 공고 개수 확인"""
     try:
-        import json
-        with open("output/new_data.json", 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        return len(data)
+        from src.utils.announcement_store import AnnouncementStore
+        return AnnouncementStore.from_env().count_new()
     except:
         return 0
 
+def mark_emailed():
+    """메일로 보낸 신규 공고를 emailed 단계로 기록"""
+    try:
+        from src.utils.announcement_store import AnnouncementStore, extract_uid
+        store = AnnouncementStore.from_env(import_legacy=False)
+        store.set_stage([extract_uid(a.get("상세_URL", "")) for a in store.new_announcements()], "emailed")
+    except Exception as e:
+        print(f"⚠️ 처리 단계 기록 실패: {str(e)}")
+
 def main():
     """메인 함수"""
     print("=" * 60)
@@ -172,6 +179,7 @@ def main():
     success = send_email(excel_file, announcement_count)
     
     if success:
+        mark_emailed()
         print(f"\n🎉 전송 완료!")
     else:
         print("\n❌ 전송 실패!")
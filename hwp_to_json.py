@@ -11,7 +11,9 @@ import time
 import glob
 import subprocess
 import shutil
+import tempfile
 import uuid
+from concurrent.futures import ProcessPoolExecutor
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
@@ -211,11 +213,11 @@ def parse_hwp_to_text(hwp_file_path):
         abs_hwp_path = os.path.abspath(hwp_file_path)
         print(f"절대경로!!!!!!!!!!: {abs_hwp_path}")
         
-        temp_dir = os.path.join(os.path.dirname(abs_hwp_path), "temp_parse")
-        os.makedirs(temp_dir, exist_ok=True)
+        # 파싱 프로세스끼리 파일이 겹치지 않도록 호출마다 임시 폴더를 따로 만듦
+        temp_dir = tempfile.mkdtemp(prefix="temp_parse_", dir=os.path.dirname(abs_hwp_path))
         
-        temp_hwp = os.path.join(temp_dir, f"temp_{uuid.uuid4().hex[:8]}.hwp")
-        temp_html_dir = os.path.join(temp_dir, f"temp_{uuid.uuid4().hex[:8]}_html")
+        temp_hwp = os.path.join(temp_dir, "temp.hwp")
+        temp_html_dir = os.path.join(temp_dir, "temp_html")
         
         try:
             print(f"   복사 시작: {abs_hwp_path} → {temp_hwp}")
@@ -278,23 +280,224 @@ def parse_hwp_to_text(hwp_file_path):
             }
             
         finally:
-            try:
-                if os.path.exists(temp_hwp):
-                    os.remove(temp_hwp)
-                if os.path.exists(temp_html_dir):
-                    shutil.rmtree(temp_html_dir)
-                if os.path.exists(temp_dir) and not os.listdir(temp_dir):
-                    os.rmdir(temp_dir)
-            except:
-                pass
+            shutil.rmtree(temp_dir, ignore_errors=True)
         
     except Exception as e:
         print(f"파싱 실패: {str(e)}")
         return {"success": False, "error": str(e)}
 
+# 파싱 프로세스별 파서 인스턴스 (프로세스마다 한 번만 초기화)
+_worker_parsers = {}
+
+def _get_worker_parser(file_ext):
+    """현재 프로세스의 PDF/HWPX 파서 반환 (초기화 실패 시 None)"""
+    if file_ext not in _worker_parsers:
+        sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+        try:
+            if file_ext == '.pdf':
+                from src.data_processor.pdf_parser import PDFParser
+                _worker_parsers[file_ext] = PDFParser()
+            else:
+                from src.data_processor.hwpx_parser import HWPXParser
+                _worker_parsers[file_ext] = HWPXParser()
+        except Exception as e:
+            print(f"⚠️ {file_ext} 파서 초기화 실패: {e}")
+            _worker_parsers[file_ext] = None
+    return _worker_parsers[file_ext]
+
+def parse_downloaded_file(downloaded_file):
+    """다운로드된 파일을 형식별로 파싱 (프로세스 풀 작업 단위)
+
+    Returns:
+        dict
+        성공: {"success": True, "full_text": ..., "front_text": ..., "parsed_file": "경로"}
+        실패: {"success": False, "error": "오류 메시지"}
+    """
+    print(f"\n2️⃣ 파일 파싱: {os.path.basename(downloaded_file)}")
+
+    # 파일 확장자 확인
+    file_ext = os.path.splitext(downloaded_file)[1].lower()
+
+    if file_ext == '.pdf':
+        # PDF 파일 처리
+        pdf_parser = _get_worker_parser(file_ext)
+        if pdf_parser:
+            parse_result = pdf_parser.extract_text_from_pdf(downloaded_file)
+        else:
+            parse_result = {"success": False, "error": "PDF 파서가 초기화되지 않음"}
+    elif file_ext == '.hwpx':
+        # HWPX 파일 처리
+        hwpx_parser = _get_worker_parser(file_ext)
+        if hwpx_parser:
+            parse_result = hwpx_parser.extract_text_from_hwpx(downloaded_file)
+        else:
+            parse_result = {"success": False, "error": "HWPX 파서가 초기화되지 않음"}
+    else:
+        # HWP 파일 처리 (기본)
+        parse_result = parse_hwp_to_text(downloaded_file)
+
+    if not parse_result["success"]:
+        return {"success": False, "error": parse_result['error']}
+
+    # 파일 형식에 따른 텍스트 추출
+    full_text = parse_result.get('full_text', '') or ''
+    if file_ext in ('.pdf', '.hwpx'):
+        front_text = parse_result.get('business_overview', '') or full_text[:3000]
+    else:
+        front_text = parse_result.get('front_text', '')
+
+    # 텍스트 파일 저장
+    base_name = os.path.splitext(downloaded_file)[0]
+    output_file = f"{base_name}_parsed.txt"
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write(front_text)
+
+    print(f"   ✅ 파싱 완료: {os.path.basename(output_file)} (전체 {len(full_text)}자, 앞부분 {len(front_text)}자)")
+
+    return {
+        "success": True,
+        "full_text": full_text,
+        "front_text": front_text,
+        "parsed_file": output_file
+    }
+
+def record_summary_result(announcement, front_text, summary_result, near_duplicate_index=None, summary_history=None):
+    """성공한 요약을 유사 공고 인덱스와 요약 이력에 등록"""
+    from src.utils.announcement import extract_uid
+    
+    # 로컬 추출 요약은 다음 실행에서 재사용하지 않음 (API가 복구되면 다시 요약)
+    if not summary_result.get("success") or (summary_result.get("metadata") or {}).get("engine") == "local":
+        return
+    title = announcement.get("공고명", "제목 없음")
+    uid = extract_uid(announcement.get("상세_URL", ""))
+    if near_duplicate_index:
+        near_duplicate_index.add(
+            uid, front_text, summary_result["summary"], title=title,
+            metadata={"model": (summary_result.get("metadata") or {}).get("model", "")}
+        )
+    if summary_history:
+        summary_history.record(uid, title, announcement.get("부처명", ""), front_text, summary_result["summary"])
+
+def reserve_budget(budget_ledger, summarizer, front_text, model_router=None):
+    """
+    요약 요청 전 최악의 경우 토큰/비용 예약 (예약한 (토큰, 비용), 한도를 넘으면 None)
+    model_router가 있으면 상위 모델 재요약까지, 모델마다 빈 항목 보완 요청까지 포함
+    """
+    from src.data_processor.model_router import worst_case_usage
+    
+    if not budget_ledger or not budget_ledger.limited:
+        return (0, 0.0)
+    usage = model_router.worst_case_usage(front_text) if model_router else worst_case_usage(summarizer, front_text)
+    if not budget_ledger.try_reserve(usage["tokens"], usage["cost_usd"]):
+        return None
+    return (usage["tokens"], usage["cost_usd"])
+
+def record_token_usage(budget_ledger, summary_result, reserved=(0, 0.0)):
+    """요약 결과의 토큰 사용량/비용을 장부에 기록하고 예약 해제 (캐시 적중은 0토큰)"""
+    from src.data_processor.model_router import estimate_cost_usd
+    
+    metadata = summary_result.get("metadata") or {}
+    reserved_tokens, reserved_cost = reserved
+    budget_ledger.record(
+        metadata.get("input_tokens", 0), metadata.get("output_tokens", 0),
+        cost_usd=estimate_cost_usd(metadata), reserved_tokens=reserved_tokens, reserved_cost=reserved_cost
+    )
+
+def summarize_announcement(summarizer, announcement, front_text, near_duplicate_index=None,
+                           summary_history=None, retries=3, diff_max_ratio=0.5, defer_short=False,
+                           model_router=None, budget_ledger=None):
+    """
+    공고 1건 요약 (유사 공고 요약 재사용 → 이전 공고 대비 변경분 요약 → 전체 요약 순서로 시도)
+    
+    defer_short가 True이면 전체 요약이 필요한 짧은 공고는 요청하지 않고 {"deferred": True}를 반환
+    (파이프라인 종료 후 summarize_packed로 여러 건을 묶어서 요약)
+    model_router가 있으면 전체 요약은 문서별로 고른 모델로 요청하고 검증 실패 시 상위 모델로 재요약
+    budget_ledger의 일/월 한도를 넘게 되면 요청하지 않고 {"budget_exceeded": True}를 반환
+    """
+    from src.utils.announcement import extract_uid
+    from src.utils.rate_limiter import backoff_delay
+    from src.utils.summary_history import compute_text_changes
+    
+    title = announcement.get("공고명", "제목 없음")
+    uid = extract_uid(announcement.get("상세_URL", ""))
+    
+    # 본문이 거의 같고 금액/날짜도 그대로인 기존 공고(재공고/세부트랙)가 있으면 그 요약을 그대로 사용
+    # (금액/날짜가 바뀐 정정공고는 아래 이전 공고 대비 변경분 요약으로 넘어감)
+    if near_duplicate_index:
+        match = near_duplicate_index.find_similar(front_text, exclude_uid=uid)
+        if match:
+            print(f"   ♻️ 유사 공고 요약 재사용: {match['title'][:40]} (UID {match['uid']}, 유사도 {match['similarity']:.2f})")
+            return {
+                "success": True,
+                "summary": match["summary"],
+                "metadata": {
+                    "model": match["metadata"].get("model", ""),
+                    "input_tokens": 0,
+                    "output_tokens": 0,
+                    "reused_from": match["uid"],
+                    "similarity": round(match["similarity"], 3)
+                }
+            }
+    
+    def request_summary():
+        if model_router:
+            return model_router.summarize(front_text, title, uid=uid)
+        return summarizer.summarize_business_overview(
+            business_overview=front_text,
+            announcement_title=title
+        )
+    full_summary = True
+    
+    # 같은 부처의 제목이 비슷한 이전 공고(정정공고/다음 연도 공고)가 있으면 바뀐 부분만 보내 요약 갱신
+    if summary_history:
+        prior = summary_history.find_prior(title, announcement.get("부처명", ""), exclude_uid=uid)
+        if prior:
+            changes = compute_text_changes(prior["front_text"], front_text)
+            if not changes["added"] and not changes["removed"]:
+                print(f"   ♻️ 이전 공고와 본문 동일, 요약 재사용: {prior['공고명'][:40]} (UID {prior['uid']})")
+                return {
+                    "success": True,
+                    "summary": prior["summary"],
+                    "metadata": {"input_tokens": 0, "output_tokens": 0, "reused_from": prior["uid"]}
+                }
+            if changes["changed_ratio"] <= diff_max_ratio:
+                print(f"   🔀 이전 공고 대비 변경분 요약: {prior['공고명'][:40]} (변경 {changes['changed_ratio']:.0%})")
+                full_summary = False
+                
+                def request_summary():
+                    result = summarizer.summarize_update(prior["summary"], changes, announcement_title=title)
+                    if result.get("metadata"):
+                        result["metadata"]["prior_uid"] = prior["uid"]
+                    return result
+    
+    if defer_short and full_summary and summarizer.is_packable(front_text):
+        print(f"   📦 짧은 공고, 묶음 요약 대기: {title[:40]}")
+        return {"success": False, "deferred": True, "error": "묶음 요약 대기", "summary": None}
+    
+    # 토큰/비용 예산 확인 (재요약/보완 요청까지 포함한 최악의 경우만큼 예약)
+    reserved = reserve_budget(budget_ledger, summarizer, front_text, model_router if full_summary else None)
+    if reserved is None:
+        print(f"   💸 토큰/비용 예산 부족, 요약 보류: {title[:40]}")
+        return {"success": False, "budget_exceeded": True, "error": "토큰/비용 예산 소진", "summary": None}
+    
+    # 요청 한도 초과 시 retry_after 이상 대기 후 재시도
+    for attempt in range(retries + 1):
+        summary_result = request_summary()
+        retry_after = summary_result.get("retry_after")
+        if summary_result.get("success") or retry_after is None or attempt == retries:
+            break
+        delay = backoff_delay(attempt, retry_after)
+        print(f"   ⏳ 요청 한도 초과, {delay:.0f}초 후 재시도 ({attempt + 1}/{retries})")
+        time.sleep(delay)
+    
+    if budget_ledger:
+        record_token_usage(budget_ledger, summary_result, reserved)
+    
+    record_summary_result(announcement, front_text, summary_result, near_duplicate_index, summary_history)
+    return summary_result
+
 def main():
     """메인 함수"""
-    import json
     import sys
     from dotenv import load_dotenv
     
@@ -303,122 +506,399 @@ def main():
     
     # 프로젝트 경로 추가
     sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+    # 동시 실행 설정 (파싱은 CPU 작업이라 프로세스 풀, 요약은 API 대기라 작업자 스레드)
+    parse_workers = int(os.getenv("PARSE_WORKERS", str(os.cpu_count() or 2)))
+    summary_concurrency = int(os.getenv("SUMMARY_CONCURRENCY", "4"))
+    queue_size = int(os.getenv("PIPELINE_QUEUE_SIZE", "4"))
     
-    # PDF 파서 초기화
-    try:
-        from src.data_processor.pdf_parser import PDFParser
-        pdf_parser = PDFParser()
-        print("✅ PDF 파서 초기화 완료")
-    except Exception as e:
-        print(f"⚠️ PDF 파서 초기화 실패: {e}")
-        pdf_parser = None
+    summary_retries = int(os.getenv("SUMMARY_RETRIES", "3"))
+    # 요약 방식: realtime(공고별 즉시 요청) / batch(Message Batches로 일괄 제출)
+    summary_mode = os.getenv("SUMMARY_MODE", "realtime")
+    batch_timeout = float(os.getenv("BATCH_WAIT_TIMEOUT", "3600"))
     
-    # HWPX 파서 초기화
-    try:
-        from src.data_processor.hwpx_parser import HWPXParser
-        hwpx_parser = HWPXParser()
-        print("✅ HWPX 파서 초기화 완료")
-    except Exception as e:
-        print(f"⚠️ HWPX 파서 초기화 실패: {e}")
-        hwpx_parser = None
+    from src.data_processor.stream_pipeline import PipelineStage, StageStats, StreamingPipeline
+    from src.utils.rate_limiter import RateLimiter
+    from src.utils.near_duplicate_index import NearDuplicateIndex
+    
+    # 유사 공고 인덱스 (재공고 등 본문이 거의 같은 공고의 요약 재사용)
+    near_duplicate_index = NearDuplicateIndex(threshold=float(os.getenv("NEAR_DUP_THRESHOLD", "0.85")))
     
-    print("전체 프로세스: new_data.json 기반 모든 공고 처리")
+    # 요약 이력 (정정공고/다음 연도 공고는 이전 요약 + 변경 구절만 보내 갱신)
+    from src.utils.summary_history import SummaryHistory
+    summary_history = SummaryHistory()
+    diff_max_ratio = float(os.getenv("DIFF_MAX_CHANGED_RATIO", "0.5"))
+    
+    # API를 쓸 수 없거나 요약이 실패한 공고는 로컬 추출 요약으로 대체
+    from src.data_processor.local_summarizer import LocalSummarizer
+    local_summarizer = LocalSummarizer() if os.getenv("LOCAL_SUMMARY_FALLBACK", "1") == "1" else None
+    
+    # 일/월 토큰·비용 한도 (예산이 부족하면 마감일이 가까운 공고부터 요약)
+    from src.utils.token_ledger import TokenLedger, deadline_priority
+    budget_ledger = TokenLedger.from_env()
+    # 예산 초과 공고 처리: fallback(로컬 추출 요약) / defer(다음 실행으로 이월)
+    budget_action = os.getenv("BUDGET_EXCEEDED_ACTION", "fallback")
+    
+    # 짧은 공고(표지 위주 HWP 등)는 모아서 한 요청으로 묶어 요약
+    summary_packing = os.getenv("SUMMARY_PACKING", "1") == "1"
+
+    print("전체 프로세스: 마지막 크롤링의 신규 공고 전체 처리")
     print("=" * 60)
     
     # Claude Summarizer 초기화
     try:
         from src.data_processor.claude_summarizer import ClaudeSummarizer
-        summarizer = ClaudeSummarizer()
+        from src.utils.summary_cache import SummaryCache
+        from src.utils.token_estimator import TokenEstimator
+        # 요약 작업자들이 하나의 속도 제한기(RPM/토큰 한도), 요약 캐시, 토큰 추정기를 공유
+        summarizer = ClaudeSummarizer(rate_limiter=RateLimiter.from_env(), cache=SummaryCache.from_env(),
+                                      token_estimator=TokenEstimator.from_env())
         print("✅ Claude API 요약기 초기화 완료")
     except Exception as e:
         print(f"⚠️ Claude API 요약기 초기화 실패: {e}")
         summarizer = None
     
-    # new_data.json 로드
-    new_data_file = "output/new_data.json"
-    if not os.path.exists(new_data_file):
-        print(f"❌ {new_data_file} 파일이 없습니다.")
+    # 문서 길이/구조로 모델을 고르고 검증 실패 시 상위 모델로 재요약
+    model_router = None
+    if summarizer and os.getenv("MODEL_ROUTING", "1") == "1":
+        from src.data_processor.model_router import ModelRouter
+        model_router = ModelRouter.from_env(summarizer)
+    
+    # 공고 저장소에서 마지막 크롤링의 신규 공고 로드 (다운로드/파싱/요약 결과는 공고별로 바로 기록)
+    # --retry-failed: 실패 기록이 남은 공고만 다시 처리
+    from src.utils.announcement_store import STAGES, AnnouncementStore, extract_uid
+    store = AnnouncementStore.from_env()
+    retry_failed = "--retry-failed" in sys.argv[1:]
+    new_data = store.failed_announcements() if retry_failed else store.new_announcements()
+    if not new_data:
+        print(f"❌ 처리할 {'실패' if retry_failed else '신규'} 공고가 없습니다. ({store.db_path})")
         return
     
-    with open(new_data_file, 'r', encoding='utf-8') as f:
-        new_data = json.load(f)
+    print(f"📂 {len(new_data)}개 공고 로드 완료 (처리 단계: {store.stage_counts()})")
+    
+    # 이전 실행에서 예산 부족으로 이월된 공고 (저장소 기록은 분류 dry-run 확인 후)
+    carried_over = [
+        announcement for announcement in budget_ledger.deferred_announcements()
+        if announcement.get("상세_URL") not in {item.get("상세_URL") for item in new_data}
+    ]
+    for announcement in carried_over:
+        announcement["요약_이월"] = True
+    
+    # 다운로드 전 분류: 제외 공고는 다운로드/파싱/요약하지 않고, 키워드 점수가 낮은 공고는 뒤로
+    # --triage-dry-run: 분류 결과와 절감량만 출력하고 종료 (공고 저장소에는 아무것도 기록하지 않음)
+    triage_result = None
+    if os.getenv("TRIAGE", "1") == "1":
+        from src.utils.triage import DEPRIORITIZE, TriageEngine, average_tokens_per_item, print_triage_report
+        triage_result = TriageEngine.from_env().triage(new_data + carried_over)
+        print_triage_report(new_data + carried_over, triage_result,
+                            average_tokens_per_item(summarizer.token_estimator if summarizer else None))
+        if "--triage-dry-run" in sys.argv[1:]:
+            return
+    
+    if carried_over:
+        for announcement in carried_over:
+            store.save_announcement(announcement)
+        # 이번 실행의 신규 공고와 함께 리포트에 포함되도록 같은 실행 번호로 표시
+        store.mark_new([extract_uid(announcement.get("상세_URL", "")) for announcement in carried_over])
+        new_data.extend(carried_over)
+        print(f"📂 예산 부족으로 이월된 공고 {len(carried_over)}개 추가")
     
-    print(f"📂 {len(new_data)}개 공고 로드 완료")
+    # 파싱된 전체 본문을 전문 검색 색인에 바로 추가 (요약에는 앞부분만 쓰므로 본문은 여기서만 보관)
+    search_index = None
+    if os.getenv("SEARCH_INDEX", "1") == "1":
+        from src.utils.search_index import SearchIndex
+        search_index = SearchIndex.from_env()
+    
+    deprioritized = set()
+    if triage_result:
+        for i in triage_result["dropped"]:
+            uid = extract_uid(new_data[i].get("상세_URL", ""))
+            new_data[i]["처리상태"] = f"분류 제외: {', '.join(triage_result['decisions'][i]['reasons'])}"
+            store.update_fields(uid, {"처리상태": new_data[i]["처리상태"]})
+            # 이월된 공고라도 제외되면 (마감 지남 등) 다음 실행에서 다시 가져오지 않음
+            budget_ledger.resolve(uid)
+        deprioritized = {position for position, i in enumerate(triage_result["order"])
+                         if triage_result["decisions"][i]["decision"] == DEPRIORITIZE}
+        new_data = [new_data[i] for i in triage_result["order"]]
+        if not new_data:
+            print("ℹ️ 분류 후 처리할 공고가 없습니다.")
+            budget_ledger.save()
+            return
+
+    # 관련도 순위: 과거 공고로 학습한 TF-IDF 관심 프로필과 가까운 공고부터 처리 (뒤로 미룬 공고는 계속 뒤)
+    # RELEVANCE_TOP_K가 있으면 상위 공고만 다운로드/파싱/요약하고 나머지는 처리상태만 기록
+    if os.getenv("RELEVANCE", "1") == "1":
+        from src.utils.relevance_ranker import RelevanceRanker, print_relevance_report
+        ranker = RelevanceRanker.from_store(store, exclude_crawl_run=None if retry_failed else store.latest_run_id())
+        relevance = ranker.rank(new_data)
+        print(f"📊 관련도 모델: {ranker.get_stats()}")
+        for i, announcement in enumerate(new_data):
+            announcement["관련도"] = round(relevance["scores"][i], 4)
+
+        # 상위 K개는 분류 결과(뒤로 미룬 공고는 뒤)까지 반영한 순서에서 자름
+        order = sorted(relevance["order"], key=lambda i: (i in deprioritized, -relevance["scores"][i]))
+        cut = ranker.top_k or len(order)
+        relevance.update(order=order, selected=order[:cut], skipped=order[cut:])
+        order = relevance["selected"]
+        print_relevance_report(new_data, relevance)
+        for i in relevance["skipped"]:
+            new_data[i]["처리상태"] = f"관련도 순위 밖 (상위 {ranker.top_k}개만 처리)"
+            # 이월된 공고라도 순위 밖이면 다음 실행에서 다시 가져오지 않음
+            budget_ledger.resolve(extract_uid(new_data[i].get("상세_URL", "")))
+        for announcement in new_data:
+            store.update_fields(extract_uid(announcement.get("상세_URL", "")),
+                                {key: announcement[key] for key in ("관련도", "처리상태") if key in announcement})
+
+        deprioritized = {position for position, i in enumerate(order) if i in deprioritized}
+        new_data = [new_data[i] for i in order]
+
+    # 예산 한도가 있으면 마감일이 가까운 공고부터 처리 (결과는 원래 순서로 병합, 뒤로 미룬 공고는 마지막)
+    if budget_ledger.limited:
+        process_order = sorted(range(len(new_data)), key=lambda i: (i in deprioritized, deadline_priority(new_data[i])))
+        print(f"💰 예산 한도 적용: {budget_ledger.get_stats()}")
+    else:
+        process_order = list(range(len(new_data)))
     
     download_path = "output/downloaded_files"
     
-    driver = setup_chrome_driver(download_path)
-    if not driver:
-        return
+    # 이전 실행에서 끝난 단계는 건너뜀 (요약까지 끝난 공고는 그대로, 파싱/다운로드까지 끝난 공고는 그 다음 단계부터)
+    item_states = store.get_states(extract_uid(announcement.get("상세_URL", "")) for announcement in new_data)
+    resume_from = {}
+    for i, announcement in enumerate(new_data):
+        uid = extract_uid(announcement.get("상세_URL", ""))
+        stage = item_states.get(uid, {}).get("stage", "crawled")
+        if STAGES.index(stage) >= STAGES.index("summarized") and announcement.get("ai_요약"):
+            resume_from[i] = {"stage": "summarized"}
+        elif stage == "parsed" and (store.get_parse_result(uid) or {}).get("success"):
+            resume_from[i] = {"stage": "parsed"}
+        elif stage in ("downloaded", "parsed"):
+            attachment = store.get_attachment(uid)
+            if attachment and attachment.get("file_path") and os.path.exists(attachment["file_path"]):
+                resume_from[i] = {"stage": "downloaded", "file_path": attachment["file_path"]}
+    if resume_from:
+        print(f"🔄 이전 실행 이어서 처리: {len(resume_from)}개 공고는 끝난 단계 건너뜀")
+    
+    driver = None
+    if len(resume_from) < len(new_data):
+        driver = setup_chrome_driver(download_path)
+        if not driver:
+            return
     
     try:
-        # ====== 1단계: 모든 공고 다운로드 ======
+        # ====== 다운로드 → 파싱 → AI 요약 (스트리밍 처리) ======
+        # 다운로드가 끝난 첨부파일은 바로 파싱 작업자로, 파싱된 텍스트는 바로 요약 작업자로 넘어감
         print(f"\n{'='*60}")
-        print("📥 1단계: 모든 공고 파일 다운로드")
+        print("📥 공고 파일 다운로드 → 🔍 파싱 → 🤖 AI 요약 (스트리밍 처리)")
         print(f"{'='*60}")
+        print(f"   파싱 프로세스: {parse_workers}개, 요약 동시 실행: {summary_concurrency}개, 대기열 크기: {queue_size}")
         
-        download_map = []  # {announcement, file_path, error} 리스트
+        download_map = [None] * len(new_data)  # 원래 순서 기준 {announcement, file_path, error} 리스트
+        download_stats = StageStats("다운로드")
         
-        for i, announcement in enumerate(new_data, 1):
-            print(f"\n[{i}/{len(new_data)}] {announcement.get('공고명', '제목 없음')[:60]}...")
+        with ProcessPoolExecutor(max_workers=parse_workers) as parse_pool:
+            def parse_stage(idx, file_path):
+                uid = extract_uid(new_data[idx].get("상세_URL", ""))
+                if resume_from.get(idx, {}).get("stage") == "parsed":
+                    # 이전 실행의 파싱 결과 재사용 (저장소와 파싱 파일에는 앞부분만 있으므로 전체 텍스트는 없음,
+                    # 검색 색인은 이전 실행에서 파싱 직후 전체 텍스트로 추가했으므로 다시 추가하지 않음)
+                    stored = store.get_parse_result(uid)
+                    return {"success": True, "parsed_file": stored["parsed_file"], "full_text": None,
+                            "full_text_length": stored["full_text_length"], "front_text": stored["front_text"],
+                            "resumed": True, "error": None}
+                
+                parse_result = parse_pool.submit(parse_downloaded_file, file_path).result()
+                store.upsert_parse_result(uid, parse_result)
+                if parse_result.get("success") and search_index:
+                    try:
+                        search_index.add(uid, new_data[idx], parse_result.get("full_text") or parse_result.get("front_text"))
+                    except Exception as e:
+                        print(f"   ⚠️ 검색 색인 추가 실패: {str(e)}")
+                if parse_result.get("success") and parse_result.get("front_text"):
+                    store.set_stage(uid, "parsed")
+                else:
+                    store.mark_failed(uid, "parsed", parse_result.get("error") or "본문 추출 실패")
+                return parse_result
             
-            url = announcement.get("상세_URL", "")
-            if not url:
-                print("   ⚠️ URL 없음")
-                download_map.append({
-                    "announcement": announcement,
-                    "file_path": None,
-                    "error": "URL 없음"
-                })
-                continue
+            def summarize_stage(idx, parse_result):
+                summary_result = summarize_announcement(
+                    summarizer, new_data[idx], parse_result["front_text"],
+                    near_duplicate_index=near_duplicate_index, summary_history=summary_history,
+                    retries=summary_retries, diff_max_ratio=diff_max_ratio, defer_short=summary_packing,
+                    model_router=model_router, budget_ledger=budget_ledger
+                )
+                uid = extract_uid(new_data[idx].get("상세_URL", ""))
+                if summary_result.get("success"):
+                    # 병합 전에 중단되어도 다음 실행에서 다시 요약하지 않도록 바로 기록
+                    store.upsert_summary(uid, summary_result.get("summary"), summary_result.get("metadata"),
+                                         time.strftime("%Y-%m-%dT%H:%M:%S"))
+                    store.set_stage(uid, "summarized")
+                elif not summary_result.get("deferred") and not summary_result.get("budget_exceeded"):
+                    store.mark_failed(uid, "summarized", summary_result.get("error") or "요약 실패")
+                return summary_result
+            
+            stages = [PipelineStage(
+                "파싱", parse_stage, workers=parse_workers, queue_size=queue_size,
+                forward_if=lambda result: bool(result.get("success") and result.get("front_text"))
+            )]
+            if summarizer and summary_mode != "batch":
+                stages.append(PipelineStage("요약", summarize_stage, workers=summary_concurrency, queue_size=queue_size))
             
-            download_result = download_announcement_file(driver, url, download_path)
+            pipeline = StreamingPipeline(stages).start()
             
-            # 다운로드 결과 확인
-            if not download_result or download_result.get("status") != "success":
-                error_msg = download_result.get("message", "다운로드 실패") if download_result else "다운로드 실패"
-                print(f"   ❌ {error_msg}")
+            try:
+                for position, i in enumerate(process_order, 1):
+                    announcement = new_data[i]
+                    print(f"\n[{position}/{len(new_data)}] {announcement.get('공고명', '제목 없음')[:60]}...")
+                    
+                    url = announcement.get("상세_URL", "")
+                    resumed = resume_from.get(i)
+                    if resumed and resumed["stage"] == "summarized":
+                        print("   ⏭️ 이전 실행에서 요약 완료")
+                        download_map[i] = {"announcement": announcement, "file_path": None, "error": None, "resumed": True}
+                        continue
+                    if resumed:
+                        # 파싱 완료 → 요약부터, 다운로드 완료 → 파싱부터
+                        file_path = resumed.get("file_path") or (store.get_parse_result(extract_uid(url)) or {}).get("parsed_file")
+                        print(f"   ⏭️ 이전 실행에서 {resumed['stage']} 단계 완료 → 다음 단계부터")
+                        download_map[i] = {"announcement": announcement, "file_path": file_path or url, "error": None}
+                        pipeline.submit(i, resumed.get("file_path"))
+                        continue
+                    
+                    if not url:
+                        print("   ⚠️ URL 없음")
+                        download_map[i] = {
+                            "announcement": announcement,
+                            "file_path": None,
+                            "error": "URL 없음"
+                        }
+                        continue
+                    
+                    download_started = time.time()
+                    download_result = download_announcement_file(driver, url, download_path)
+                    download_ok = bool(download_result and download_result.get("status") == "success")
+                    download_stats.record(download_started, time.time(), download_ok)
+                    
+                    # 다운로드 결과 확인
+                    if not download_ok:
+                        error_msg = download_result.get("message", "다운로드 실패") if download_result else "다운로드 실패"
+                        print(f"   ❌ {error_msg}")
+                        
+                        # 예외 상황을 JSON에 기록
+                        if download_result and download_result.get("status") in ["no_attachment", "image_file", "no_announcement"]:
+                            announcement["처리상태"] = error_msg
+                            if download_result.get("status") == "image_file":
+                                announcement["첨부파일명"] = download_result.get("filename", "")
+                            store.update_fields(extract_uid(url), {
+                                key: announcement[key] for key in ("처리상태", "첨부파일명") if key in announcement
+                            })
+                        store.upsert_attachment(
+                            extract_uid(url), None, (download_result or {}).get("status", "error"), error=error_msg,
+                            file_name=(download_result or {}).get("filename", "")
+                        )
+                        store.mark_failed(extract_uid(url), "downloaded", error_msg)
+                        
+                        download_map[i] = {
+                            "announcement": announcement,
+                            "file_path": None,
+                            "error": error_msg
+                        }
+                    else:
+                        downloaded_file = download_result.get("file_path")
+                        print(f"   ✅ 다운로드 성공 → 파싱 대기열 투입")
+                        store.upsert_attachment(extract_uid(url), downloaded_file, "success")
+                        store.set_stage(extract_uid(url), "downloaded")
+                        download_map[i] = {
+                            "announcement": announcement,
+                            "file_path": downloaded_file,
+                            "error": None
+                        }
+                        # 파싱 대기열이 가득 차 있으면 여기서 대기 (백프레셔)
+                        pipeline.submit(i, downloaded_file)
+                    
+                    time.sleep(2)  # 다음 다운로드까지 대기
+                
+                # 브라우저 종료 (다운로드 완료)
+                if driver:
+                    driver.quit()
+                    driver = None
+                print(f"\n✅ 모든 다운로드 완료! ({len([d for d in download_map if d and d['file_path']])}개 성공)")
+                print("   남은 파싱/요약 작업 대기 중...")
+            finally:
+                stage_results = pipeline.close()
+                near_duplicate_index.save()
+                summary_history.save()
+                if summarizer:
+                    summarizer.token_estimator.save()
+        
+        pipeline.print_stats(extra_stats=[download_stats])
+        if summarizer:
+            print(f"📏 토큰 통계: {summarizer.token_estimator.get_stats()}")
+        if model_router:
+            print(f"🧭 모델별 요약 통계: {model_router.get_stats()}")
+        parse_results = stage_results["파싱"]
+        summary_results = stage_results.get("요약", {})
+        
+        # ====== 묶음 요약: 대기시켜 둔 짧은 공고를 여러 건씩 한 요청으로 요약 ======
+        deferred = [idx for idx, result in summary_results.items() if result.get("deferred")]
+        if deferred:
+            print(f"\n📦 짧은 공고 {len(deferred)}건 묶음 요약")
+            uid_to_idx = {}
+            reserved_by_uid = {}
+            pack_items = []
+            for idx in sorted(deferred, key=lambda i: deadline_priority(new_data[i])):
+                uid = extract_uid(new_data[idx].get("상세_URL", ""))
+                if not uid or uid in uid_to_idx:
+                    uid = f"item{idx}"
                 
-                # 예외 상황을 JSON에 기록
-                if download_result and download_result.get("status") in ["no_attachment", "image_file", "no_announcement"]:
-                    announcement["처리상태"] = error_msg
-                    if download_result.get("status") == "image_file":
-                        announcement["첨부파일명"] = download_result.get("filename", "")
+                # 묶음 요약도 마감일이 가까운 공고부터 예산 안에서만 요청
+                front_text = parse_results[idx]["front_text"]
+                reserved = reserve_budget(budget_ledger, summarizer, front_text)
+                if reserved is None:
+                    summary_results[idx] = {"success": False, "budget_exceeded": True,
+                                            "error": "토큰/비용 예산 소진", "summary": None}
+                    continue
                 
-                download_map.append({
-                    "announcement": announcement,
-                    "file_path": None,
-                    "error": error_msg
-                })
-            else:
-                downloaded_file = download_result.get("file_path")
-                print(f"   ✅ 다운로드 성공")
-                download_map.append({
-                    "announcement": announcement,
-                    "file_path": downloaded_file,
-                    "error": None
+                uid_to_idx[uid] = idx
+                reserved_by_uid[uid] = reserved
+                pack_items.append({
+                    "uid": uid,
+                    "title": new_data[idx].get("공고명", ""),
+                    "text": front_text
                 })
             
-            time.sleep(2)  # 다음 다운로드까지 대기
+            for uid, packed_result in summarizer.summarize_packed(pack_items).items():
+                idx = uid_to_idx[uid]
+                summary_results[idx] = packed_result
+                record_token_usage(budget_ledger, packed_result, reserved_by_uid.pop(uid))
+                record_summary_result(new_data[idx], parse_results[idx]["front_text"], packed_result,
+                                      near_duplicate_index, summary_history)
+            for reserved in reserved_by_uid.values():
+                budget_ledger.release(*reserved)
+            near_duplicate_index.save()
+            summary_history.save()
+            summarizer.token_estimator.save()
         
-        # 브라우저 종료 (다운로드 완료)
-        driver.quit()
-        print(f"\n✅ 모든 다운로드 완료! ({len([d for d in download_map if d['file_path']])}개 성공)")
-        
-        # ====== 2단계: 파일 파싱 및 AI 요약 ======
+        # ====== 결과 병합 (원래 순서대로) ======
         print(f"\n{'='*60}")
-        print("🔍 2단계: 파일 파싱 및 AI 요약")
+        print("🧩 처리 결과 병합")
         print(f"{'='*60}")
         
         results = []
         success_count = 0
         
-        for i, item in enumerate(download_map, 1):
+        for idx, item in enumerate(download_map):
             announcement = item["announcement"]
             downloaded_file = item["file_path"]
             title = announcement.get("공고명", "제목 없음")
             
-            print(f"\n[{i}/{len(download_map)}] {title[:60]}...")
+            print(f"\n[{idx + 1}/{len(download_map)}] {title[:60]}...")
+            
+            # 이전 실행에서 요약까지 끝난 공고
+            if item.get("resumed"):
+                print("   ⏭️ 이전 실행 요약 사용")
+                results.append({"공고명": title, "success": True, "ai_summary": announcement.get("ai_요약")})
+                success_count += 1
+                continue
             
             # 다운로드 실패한 경우 스킵
             if not downloaded_file:
@@ -430,115 +910,146 @@ def main():
                 })
                 continue
             
-            try:
-                
-                # 2단계: 파일 파싱 (HWP/PDF/HWPX 구분)
-                print(f"\n2️⃣ 파일 파싱...")
-                print(f"   파싱할 파일 경로: {downloaded_file}")
-                print(f"   파일 존재 여부: {os.path.exists(downloaded_file)}")
-                
-                # 파일 확장자 확인
-                file_ext = os.path.splitext(downloaded_file)[1].lower()
-                
-                if file_ext == '.pdf':
-                    # PDF 파일 처리
-                    if pdf_parser:
-                        parse_result = pdf_parser.extract_text_from_pdf(downloaded_file)
-                    else:
-                        parse_result = {"success": False, "error": "PDF 파서가 초기화되지 않음"}
-                elif file_ext == '.hwpx':
-                    # HWPX 파일 처리
-                    if hwpx_parser:
-                        parse_result = hwpx_parser.extract_text_from_hwpx(downloaded_file)
-                    else:
-                        parse_result = {"success": False, "error": "HWPX 파서가 초기화되지 않음"}
-                else:
-                    # HWP 파일 처리 (기본)
-                    parse_result = parse_hwp_to_text(downloaded_file)
-                
-                if not parse_result["success"]:
-                    print(f"❌ 파싱 실패: {parse_result['error']}")
-                    results.append({
-                        "공고명": title,
-                        "success": False,
-                        "error": f"파싱 실패: {parse_result['error']}"
-                    })
-                    continue
-                
-                # 3단계: 결과 저장
-                print(f"✅ 처리 성공!")
-                
-                # 파일 형식에 따른 텍스트 추출
-                if file_ext == '.pdf':
-                    full_text = parse_result.get('full_text', '')
-                    front_text = parse_result.get('business_overview', '') or full_text[:3000]
-                    print(f"   전체 텍스트: {len(full_text)}자")
-                    print(f"   사업개요: {len(front_text)}자")
-                elif file_ext == '.hwpx':
-                    full_text = parse_result.get('full_text', '')
-                    front_text = parse_result.get('business_overview', '') or full_text[:3000]
-                    print(f"   전체 텍스트: {len(full_text)}자")
-                    print(f"   앞부분 텍스트: {len(front_text)}자")
-                else:
-                    full_text = parse_result.get('full_text', '')
-                    front_text = parse_result.get('front_text', '')
-                    print(f"   전체 텍스트: {len(full_text)}자")
-                    print(f"   앞부분 텍스트: {len(front_text)}자")
-                
-                # 텍스트 파일 저장
-                base_name = os.path.splitext(downloaded_file)[0]
-                output_file = f"{base_name}_parsed.txt"
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    f.write(front_text)
-                print(f"   저장: {os.path.basename(output_file)}")
-                
-                # 4단계: Claude API 요약
-                ai_summary = None
-                if summarizer and front_text:
-                    print(f"\n3️⃣ Claude API 요약...")
-                    try:
-                        summary_result = summarizer.summarize_business_overview(
-                            business_overview=front_text,
-                            announcement_title=title
-                        )
-                        
-                        if summary_result.get("success"):
-                            print(f"   ✅ AI 요약 완료!")
-                            ai_summary = summary_result.get("summary", {})
-                            
-                            # new_data의 해당 항목에 요약 추가
-                            announcement["ai_요약"] = ai_summary
-                            announcement["요약_처리시간"] = time.strftime("%Y-%m-%dT%H:%M:%S")
-                            if summary_result.get("metadata"):
-                                announcement["ai_메타데이터"] = summary_result["metadata"]
-                        else:
-                            print(f"   ⚠️ AI 요약 실패: {summary_result.get('error', '알 수 없는 오류')}")
-                    except Exception as e:
-                        print(f"   ⚠️ AI 요약 중 오류: {str(e)}")
-                
+            parse_result = parse_results.get(idx, {"success": False, "error": "파싱 결과 없음"})
+            if not parse_result["success"]:
+                print(f"   ❌ 파싱 실패: {parse_result['error']}")
                 results.append({
                     "공고명": title,
-                    "success": True,
-                    "hwp_file": downloaded_file,
-                    "parsed_file": output_file,
-                    "text_length": len(parse_result['full_text']),
-                    "ai_summary": ai_summary
+                    "success": False,
+                    "error": f"파싱 실패: {parse_result['error']}"
                 })
+                continue
+            
+            # Claude API 요약 결과 반영
+            ai_summary = None
+            summary_result = summary_results.get(idx)
+            uid = extract_uid(announcement.get("상세_URL", ""))
+            if (summary_result or {}).get("budget_exceeded") and budget_action == "defer":
+                # 예산 부족: 로컬 요약 없이 다음 실행으로 이월
+                budget_ledger.defer(uid, announcement)
+                print("   💸 예산 부족, 다음 실행으로 이월")
+            # 배치 모드는 배치 결과 반영 후에 대체 요약
+            elif local_summarizer and (summary_mode != "batch" or not summarizer) and not (summary_result or {}).get("success"):
+                reason = (summary_result or {}).get("error") or "Claude API 요약기 없음"
+                summary_result = local_summarizer.summarize_business_overview(parse_result["front_text"], title)
+                if summary_result.get("success"):
+                    summary_result["metadata"]["fallback_reason"] = reason
+                    print(f"   🧮 로컬 추출 요약으로 대체 ({reason[:40]})")
+            if summary_result:
+                if summary_result.get("success"):
+                    print(f"   ✅ AI 요약 완료!")
+                    if (summary_result.get("metadata") or {}).get("engine") != "local":
+                        budget_ledger.resolve(uid)
+                    ai_summary = summary_result.get("summary", {})
+                    
+                    # new_data의 해당 항목에 요약 추가
+                    announcement["ai_요약"] = ai_summary
+                    announcement["요약_처리시간"] = time.strftime("%Y-%m-%dT%H:%M:%S")
+                    if summary_result.get("metadata"):
+                        announcement["ai_메타데이터"] = summary_result["metadata"]
+                    store.save_announcement(announcement)
+                else:
+                    print(f"   ⚠️ AI 요약 실패: {summary_result.get('error', '알 수 없는 오류')}")
+            
+            results.append({
+                "공고명": title,
+                "success": True,
+                "hwp_file": downloaded_file,
+                "parsed_file": parse_result["parsed_file"],
+                "text_length": parse_result.get("full_text_length") or len(parse_result["full_text"] or ""),
+                "ai_summary": ai_summary
+            })
+            
+            success_count += 1
+        
+        # ====== 배치 모드: 파싱된 공고를 하나의 Message Batches 작업으로 요약 ======
+        if summarizer and summary_mode == "batch":
+            from src.data_processor.batch_summarizer import BatchSummarizer
+            
+            print(f"\n{'='*60}")
+            print("📦 Message Batches 요약")
+            print(f"{'='*60}")
+            
+            batch_items = []
+            over_budget = set()
+            reserved_by_uid = {}
+            candidates = [idx for idx in range(len(download_map))
+                          if (parse_results.get(idx) or {}).get("success") and parse_results[idx].get("front_text")]
+            for idx in sorted(candidates, key=lambda i: deadline_priority(download_map[i]["announcement"])):
+                announcement = download_map[idx]["announcement"]
+                uid = extract_uid(announcement.get("상세_URL", ""))
+                front_text = parse_results[idx]["front_text"]
                 
-                success_count += 1
-                
-            except Exception as e:
-                print(f"❌ 오류 발생: {str(e)}")
-                results.append({
-                    "공고명": title,
-                    "success": False,
-                    "error": str(e)
+                # 마감일이 가까운 공고부터 예산 안에서만 배치에 포함
+                reserved = reserve_budget(budget_ledger, summarizer, front_text)
+                if reserved is None:
+                    over_budget.add(idx)
+                    if budget_action == "defer":
+                        budget_ledger.defer(uid, announcement)
+                    continue
+                reserved_by_uid[uid] = reserved
+                batch_items.append({
+                    "uid": uid,
+                    "title": announcement.get("공고명", ""),
+                    "text": front_text
                 })
+            if over_budget:
+                print(f"   💸 예산 부족으로 {len(over_budget)}건 배치 제외")
+            
+            # 수집한 결과의 실제 사용량은 BatchSummarizer가 장부에 기록 (이전 실행의 배치 결과 포함)
+            batch_summarizer = BatchSummarizer(summarizer, budget_ledger=budget_ledger)
+            batch_results = batch_summarizer.run(batch_items, timeout=batch_timeout, store=store)
+            batch_pending = bool(batch_summarizer.load_state())
+            for uid, reserved in reserved_by_uid.items():
+                batch_result = batch_results.get(uid)
+                if batch_result and batch_result.get("success"):
+                    budget_ledger.resolve(uid)
+                # 아직 진행 중인 배치는 서버에서 계속 처리되어 과금되므로 이번 실행 동안 예약 유지
+                if batch_result or not batch_pending:
+                    budget_ledger.release(*reserved)
+            if batch_results:
+                applied = batch_summarizer.apply_results(new_data, batch_results, store=store)
+                print(f"   ✅ 배치 요약 {applied}건 반영")
+                
+                # 다음 실행의 유사 공고 재사용을 위해 인덱스에 추가
+                for batch_item in batch_items:
+                    batch_result = batch_results.get(batch_item["uid"], {})
+                    if batch_result.get("success"):
+                        near_duplicate_index.add(
+                            batch_item["uid"], batch_item["text"], batch_result["summary"],
+                            title=batch_item["title"], metadata={"model": batch_result["metadata"]["model"]}
+                        )
+                near_duplicate_index.save()
+            if batch_pending:
+                print("   ℹ️ 배치가 아직 진행 중입니다. 다음 실행에서 이어서 수집하거나 아래 명령으로 결과를 반영하세요.")
+                print("      python -m src.data_processor.batch_summarizer")
             
-            # 다음 공고 처리 전 잠시 대기
-            if i < len(new_data):
-                print(f"\n⏳ 다음 공고까지 3초 대기...")
-                time.sleep(3)
+            # 배치에서 요약되지 않은 공고는 로컬 추출 요약으로 채움 (배치 재개 시 Claude 요약으로 덮어씀)
+            if local_summarizer:
+                local_count = 0
+                for idx, item in enumerate(download_map):
+                    parse_result = parse_results.get(idx)
+                    announcement = item["announcement"]
+                    if announcement.get("ai_요약") or not (parse_result and parse_result.get("success")):
+                        continue
+                    if idx in over_budget and budget_action == "defer":
+                        continue
+                    local_result = local_summarizer.summarize_business_overview(
+                        parse_result["front_text"], announcement.get("공고명", "")
+                    )
+                    if local_result.get("success"):
+                        local_result["metadata"]["fallback_reason"] = "배치 결과 없음"
+                        announcement["ai_요약"] = local_result["summary"]
+                        announcement["요약_처리시간"] = time.strftime("%Y-%m-%dT%H:%M:%S")
+                        announcement["ai_메타데이터"] = local_result["metadata"]
+                        store.save_announcement(announcement)
+                        local_count += 1
+                if local_count:
+                    print(f"   🧮 로컬 추출 요약 {local_count}건으로 대체")
+        
+        if budget_ledger.limited:
+            print(f"\n💰 토큰 예산: {budget_ledger.get_stats()}")
+        budget_ledger.save()
         
         # 처리 결과 요약
         print(f"\n{'='*60}")
@@ -549,14 +1060,8 @@ def main():
         print(f"실패: {len(new_data) - success_count}개")
         print(f"성공률: {success_count/len(new_data)*100:.1f}%")
         
-        # new_data.json 저장 (AI 요약 추가됨)
-        if success_count > 0 or len(new_data) > 0:
-            print(f"\n💾 new_data.json 업데이트 중...")
-            
-            # AI 요약이 추가된 new_data.json 저장
-            with open(new_data_file, 'w', encoding='utf-8') as f:
-                json.dump(new_data, f, ensure_ascii=False, indent=2)
-            print(f"   ✅ new_data.json 업데이트 완료! ({len(new_data)}개)")
+        # 다운로드/파싱/요약 결과는 공고별로 이미 저장소에 기록됨
+        print(f"\n💾 공고 저장소: {store.db_path} {store.get_stats()}")
         
         # 임시 파일 정리
         print(f"\n🧹 임시 파일 정리 중...")
@@ -585,9 +1090,10 @@ def main():
         # 브라우저 자동 종료 (자동화 프로세스용)
         # print("\n브라우저를 열어둡니다. 확인 후 Enter를 누르세요...")
         # input("Press Enter to close...")
-        print("\n브라우저 종료 중...")
-        driver.quit()
-        print("   ✅ 브라우저 종료 완료")
+        if driver:
+            print("\n브라우저 종료 중...")
+            driver.quit()
+            print("   ✅ 브라우저 종료 완료")
 
 if __name__ == "__main__":
     main()
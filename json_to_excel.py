@@ -2,10 +2,9 @@
 # -*- coding: utf-8 -*-
 """
 JSON to Excel 변환기
-new_data.json 파일을 읽어서 Excel 리포트 생성
+공고 저장소에서 마지막 크롤링의 신규 공고(AI 요약 포함)를 읽어서 Excel 리포트 생성
 """
 
-import json
 import os
 import sys
 from datetime import datetime
@@ -19,23 +18,42 @@ if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
 
-def load_new_data(file_path="output/new_data.json"):
-    """new_data.json 파일 로드 (AI 요약이 포함된 신규 데이터)"""
+def load_new_data():
+    """공고 저장소에서 신규 데이터 로드 (AI 요약이 포함된 마지막 크롤링의 신규 공고, 관련도 높은 순)"""
     try:
-        if not os.path.exists(file_path):
-            print(f"❌ {file_path} 파일이 없습니다.")
-            return None
-        
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
+        from src.utils.announcement_store import AnnouncementStore
+
+        data = AnnouncementStore.from_env().new_announcements()
+        data.sort(key=lambda announcement: -(announcement.get("관련도") or 0))
         print(f"📂 {len(data)}개 공고 로드 완료")
         return data
         
     except Exception as e:
-        print(f"❌ 파일 로드 실패: {str(e)}")
+        print(f"❌ 데이터 로드 실패: {str(e)}")
         return None
 
+def mark_reported(announcements):
+    """리포트에 들어간 공고를 reported 단계로 기록"""
+    try:
+        from src.utils.announcement_store import AnnouncementStore, extract_uid
+        
+        AnnouncementStore.from_env(import_legacy=False).set_stage(
+            [extract_uid(announcement.get("상세_URL", "")) for announcement in announcements], "reported"
+        )
+    except Exception as e:
+        print(f"⚠️ 처리 단계 기록 실패: {str(e)}")
+
+def describe_summary_engine(announcement):
+    """요약을 만든 엔진 표시 (로컬 추출 요약 / Claude / 재사용)"""
+    if not announcement.get('ai_요약'):
+        return ''
+    metadata = announcement.get('ai_메타데이터') or {}
+    if metadata.get('engine') == 'local':
+        return '로컬 추출 요약'
+    if metadata.get('reused_from'):
+        return f"Claude (유사 공고 {metadata['reused_from']} 요약 재사용)"
+    return f"Claude ({metadata.get('model', '')})" if metadata.get('model') else 'Claude'
+
 def create_excel_report(announcements, output_file=None):
     """Excel 리포트 생성"""
     try:
@@ -60,7 +78,7 @@ def create_excel_report(announcements, output_file=None):
         # 항목명 (세로로 배치)
         field_names = [
             "공고명", "부처명", "현황", "접수일", "마감일",
-            "사업목적", "지원내용", "지원규모", "신청대상", "주요특징", "전체요약", "처리상태", "상세URL"
+            "사업목적", "지원내용", "지원규모", "신청대상", "주요특징", "전체요약", "처리상태", "상세URL", "요약엔진"
         ]
         
         # 첫 번째 열에 항목명 입력
@@ -104,7 +122,8 @@ def create_excel_report(announcements, output_file=None):
                 ai_summary.get('주요특징', ''),
                 ai_summary.get('전체요약', ''),
                 announcement.get('처리상태', ''),
-                announcement.get('상세_URL', '')
+                announcement.get('상세_URL', ''),
+                describe_summary_engine(announcement)
             ]
             
             for row_idx, value in enumerate(values, 2):
@@ -132,6 +151,9 @@ def create_excel_report(announcements, output_file=None):
                         cell.font = Font(name='맑은 고딕', size=10, color='0563C1', underline='single')
                         cell.value = "바로가기"
                         cell.alignment = Alignment(horizontal='center', vertical='center')
+                elif row_idx == 15:  # 요약엔진
+                    if value == '로컬 추출 요약':
+                        cell.fill = PatternFill(start_color='FFF3CD', end_color='FFF3CD', fill_type='solid')
             
             # 열 너비 조정
             ws.column_dimensions[get_column_letter(col_idx)].width = 50
@@ -173,7 +195,7 @@ def main():
     print("JSON to Excel 변환기")
     print("=" * 60)
     
-    # 1. new_data.json 로드
+    # 1. 신규 공고 로드
     announcements = load_new_data()
     if not announcements:
         print("처리할 데이터가 없습니다.")
@@ -183,6 +205,7 @@ def main():
     filepath = create_excel_report(announcements)
     
     if filepath:
+        mark_reported(announcements)
         print(f"\n🎉 변환 완료!")
         print(f"Excel 파일을 확인하세요: {filepath}")
     else:
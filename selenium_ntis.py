@@ -2,7 +2,6 @@ import os
 import sys
 import time
 import json
-import re
 from datetime import datetime
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
@@ -22,6 +21,8 @@ if sys.platform == 'win32':
 # 프로젝트 src 경로 추가
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
+from utils.announcement import Announcement, extract_uid, sort_latest_first
+
 # 설정 파일 import
 try:
     from utils.config_reader import get_search_keywords, get_ui_selector, get_page_unit_target_value
@@ -29,14 +30,6 @@ except ImportError as e:
     print(f"⚠️ 모듈 import 실패: {e}")
     print("   기본 설정으로 진행합니다.")
 
-def extract_uid_from_url(url):
-    """상세_URL에서 roRndUid 추출"""
-    try:
-        match = re.search(r'roRndUid=(\d+)', url)
-        return match.group(1) if match else ""
-    except Exception:
-        return ""
-
 def crawl_announcement_list(driver, target_count=30):
     """
     NTIS 검색 결과에서 공고 리스트를 크롤링합니다.
@@ -63,7 +56,7 @@ def crawl_announcement_list(driver, target_count=30):
             print("   ⚠️ 검색 결과가 없습니다.")
             return []
 
-        # 3. 모든 행의 데이터를 파싱하여 리스트에 저장
+        # 3. 모든 행의 데이터를 파싱하여 리스트에 저장 (uid/날짜는 여기서 한 번만 해석)
         print("\n2️⃣ 모든 공고 정보 임시 추출 중...")
         all_rows_data = []
         for i, row in enumerate(rows):
@@ -80,7 +73,7 @@ def crawl_announcement_list(driver, target_count=30):
                     "접수일": cells[5].text.strip(),
                     "마감일": cells[6].text.strip(),
                 }
-                all_rows_data.append(item_data)
+                all_rows_data.append(Announcement.from_dict(item_data))
             except Exception as e:
                 print(f"   ❌ {i+1}번째 행 추출 중 오류 발생: {str(e)}")
                 continue
@@ -88,18 +81,11 @@ def crawl_announcement_list(driver, target_count=30):
         # 4. '접수일'을 기준으로 데이터를 내림차순 정렬 (최신 공고가 위로 오도록)
         print("\n3️⃣ 접수일 기준으로 데이터 정렬 중...")
         
-        def parse_date_for_sort(date_str):
-            """정렬을 위한 날짜 파싱 (YYYY.MM.DD 형식)"""
-            try:
-                return datetime.strptime(date_str, "%Y.%m.%d")
-            except:
-                return datetime.min  # 파싱 실패시 가장 오래된 날짜로 처리
-        
-        sorted_data = sorted(all_rows_data, key=lambda x: parse_date_for_sort(x['접수일']), reverse=True)
+        sorted_data = sort_latest_first(all_rows_data)  # 날짜를 해석할 수 없으면 가장 오래된 날짜로 처리
         print("   ✅ 접수일 기준 내림차순 정렬 완료!")
         
         # 5. 목표 개수만큼 최종 데이터 선택
-        final_data = sorted_data[:target_count]
+        final_data = [announcement.to_dict() for announcement in sorted_data[:target_count]]
 
         print(f"\n4️⃣ 크롤링 완료! (성공: {len(final_data)}개)")
         
@@ -359,69 +345,43 @@ def main():
             print("\n📊 데이터 관리 시작...")
             os.makedirs("output", exist_ok=True)
             
-            # 기존 old_data.json 로드
-            existing_data = []
-            old_data_file = "output/old_data.json"
-            if os.path.exists(old_data_file):
-                with open(old_data_file, "r", encoding="utf-8") as f:
-                    existing_data = json.load(f)
-            print(f"   📂 기존 데이터: {len(existing_data)}개")
+            # 공고 저장소 (처음 실행 시 기존 old_data.json / new_data.json 가져오기)
+            from utils.announcement_store import AnnouncementStore
+            from utils.seen_index import SeenUidIndex
+            from utils.change_tracker import ChangeTracker
+            store = AnnouncementStore.from_env()
             
-            # 기존 데이터의 roRndUid 추출
-            existing_uids = set()
-            for item in existing_data:
-                uid = extract_uid_from_url(item.get("상세_URL", ""))
-                if uid:
-                    existing_uids.add(uid)
+            # 한 번이라도 처리한 공고 이력 (표시용 30개 목록과 별개, 기간 제한 없음)
+            seen_index = SeenUidIndex.from_env()
+            print(f"   📂 처리 이력: {len(seen_index)}개")
             
-            # 신규 항목 찾기
+            # 신규 항목 찾기 (마감일 연장 등으로 다시 검색된 오래된 공고는 제외)
+            crawled_uids = [extract_uid(item.get("상세_URL", "")) for item in crawled_data]
+            new_uids = set(seen_index.unseen(crawled_uids))
             new_items = []
-            for item in crawled_data:
-                uid = extract_uid_from_url(item.get("상세_URL", ""))
-                if uid and uid not in existing_uids:
+            for item, uid in zip(crawled_data, crawled_uids):
+                if uid in new_uids:
                     new_items.append(item)
+                    new_uids.discard(uid)
             
             print(f"   🆕 신규 항목: {len(new_items)}개")
             print(f"   🔄 중복 항목: {len(crawled_data) - len(new_items)}개")
             
-            # 신규 항목이 있으면 처리
-            if new_items:
-                # 기존 + 신규 합치기
-                all_items = existing_data + new_items
-                
-                # 접수일 기준 내림차순 정렬
-                def parse_date_for_sort(date_str):
-                    try:
-                        return datetime.strptime(date_str, "%Y.%m.%d")
-                    except:
-                        return datetime.min
-                
-                sorted_items = sorted(all_items, key=lambda x: parse_date_for_sort(x.get("접수일", "")), reverse=True)
-                
-                # 최신 30개만 유지
-                final_items = sorted_items[:30]
-                
-                # old_data.json 업데이트 (전체 30개 저장)
-                with open(old_data_file, "w", encoding="utf-8") as f:
-                    json.dump(final_items, f, ensure_ascii=False, indent=2)
-                print(f"   💾 전체 데이터 저장: output/old_data.json ({len(final_items)}개)")
-                
-                # 신규 항목만 별도 저장
-                with open("output/new_data.json", "w", encoding="utf-8") as f:
-                    json.dump(new_items, f, ensure_ascii=False, indent=2)
-                print(f"   🆕 신규 데이터 저장: output/new_data.json ({len(new_items)}개)")
-                
-            else:
-                print("   ℹ️ 신규 항목이 없어 데이터 업데이트를 건너뜁니다.")
-                # 신규 항목이 없어도 old_data.json은 업데이트 (크롤링된 최신 30개)
-                with open(old_data_file, "w", encoding="utf-8") as f:
-                    json.dump(crawled_data[:30], f, ensure_ascii=False, indent=2)
-                print(f"   💾 전체 데이터 업데이트: output/old_data.json ({len(crawled_data[:30])}개)")
-                
-                # new_data.json은 빈 배열로 초기화
-                with open("output/new_data.json", "w", encoding="utf-8") as f:
-                    json.dump([], f, ensure_ascii=False, indent=2)
-                print(f"   🆕 신규 데이터 없음: output/new_data.json (0개)")
+            # 이미 알고 있는 공고의 현황/마감일/공고명 변경 감지 (저장소에 덮어쓰기 전에 비교)
+            change_tracker = ChangeTracker.from_env()
+            detection = change_tracker.detect(crawled_data)
+            
+            # 크롤링 목록 upsert + 신규 항목을 이번 실행 번호로 표시 (다음 단계는 이 실행의 신규 공고만 처리)
+            run_id = store.record_crawl_run(keyword, crawled_data, new_items)
+            change_tracker.commit(detection, crawl_run=run_id)
+            if detection["events"]:
+                print(f"   🔁 기존 공고 변경: {len(detection['events'])}건 (비교 {detection['compared']}개)")
+                for event in detection["events"][:10]:
+                    print(f"      [{event['type']}] {event['공고명'][:40]} - {event['detail']}")
+            seen_index.add_many(crawled_uids)
+            print(f"   💾 저장소 업데이트: {store.db_path} (실행 #{run_id}, 목록 {len(crawled_data)}개, 신규 {len(new_items)}개)")
+            if not new_items:
+                print("   ℹ️ 신규 항목이 없습니다.")
             
             print(f"\n📋 최종 요약:")
             print(f"   - 크롤링 항목: {len(crawled_data)}개")
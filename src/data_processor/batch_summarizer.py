@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Message Batches 기반 대량 요약기
+백필/재요약처럼 공고가 많을 때 요청을 하나의 배치 작업으로 제출 (custom_id = roRndUid)
+배치 상태를 파일에 저장하므로 프로세스가 재시작되어도 이어서 결과를 수집할 수 있음
+"""
+
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Callable, Dict, Iterator, List, Optional
+
+try:
+    from src.data_processor.claude_summarizer import ClaudeSummarizer
+    from src.data_processor.model_router import estimate_cost_usd
+    from src.utils.announcement import extract_uid
+    from src.utils.announcement_store import AnnouncementStore
+    from src.utils.token_ledger import TokenLedger
+except ImportError:
+    # 스크립트로 직접 실행한 경우 (python src/data_processor/batch_summarizer.py) 프로젝트 루트를 경로에 추가
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+    from src.data_processor.claude_summarizer import ClaudeSummarizer
+    from src.data_processor.model_router import estimate_cost_usd
+    from src.utils.announcement import extract_uid
+    from src.utils.announcement_store import AnnouncementStore
+    from src.utils.token_ledger import TokenLedger
+
+
+class AnthropicBatchClient:
+    """Anthropic Message Batches API 클라이언트 (제출/상태 조회/결과 조회)"""
+
+    def __init__(self, client):
+        self.client = client
+
+    def submit(self, requests: List[Dict]) -> str:
+        """배치 제출 후 batch_id 반환"""
+        batch = self.client.messages.batches.create(requests=requests)
+        return batch.id
+
+    def status(self, batch_id: str) -> Dict:
+        """배치 진행 상태 조회 ("in_progress" / "canceling" / "ended")"""
+        batch = self.client.messages.batches.retrieve(batch_id)
+        counts = batch.request_counts
+        return {
+            "status": batch.processing_status,
+            "succeeded": counts.succeeded,
+            "errored": counts.errored,
+            "processing": counts.processing,
+            "expired": counts.expired,
+            "canceled": counts.canceled
+        }
+
+    def results(self, batch_id: str) -> Iterator[Dict]:
+        """배치 결과를 {"custom_id", "type", "message", "error"} 형태로 반환"""
+        for entry in self.client.messages.batches.results(batch_id):
+            result = entry.result
+            yield {
+                "custom_id": entry.custom_id,
+                "type": result.type,
+                "message": getattr(result, "message", None),
+                "error": str(getattr(result, "error", "")) if result.type != "succeeded" else None
+            }
+
+
+class LocalBatchClient:
+    """테스트용 로컬 배치 클라이언트 (API 호출 없이 responder로 응답 생성)"""
+
+    def __init__(self, responder: Callable[[Dict], object], polls_until_done: int = 1):
+        """
+        Args:
+            responder: 요청 params를 받아 응답 메시지(content/usage 속성)를 반환하는 함수
+            polls_until_done: 몇 번 조회해야 "ended"가 되는지 (폴링 흐름 테스트용)
+        """
+        self.responder = responder
+        self.polls_until_done = polls_until_done
+        self.batches = {}
+
+    def submit(self, requests: List[Dict]) -> str:
+        batch_id = f"local_batch_{len(self.batches) + 1}"
+        self.batches[batch_id] = {"requests": requests, "polls": 0}
+        return batch_id
+
+    def status(self, batch_id: str) -> Dict:
+        batch = self.batches[batch_id]
+        batch["polls"] += 1
+        done = batch["polls"] >= self.polls_until_done
+        total = len(batch["requests"])
+        return {
+            "status": "ended" if done else "in_progress",
+            "succeeded": total if done else 0,
+            "errored": 0,
+            "processing": 0 if done else total,
+            "expired": 0,
+            "canceled": 0
+        }
+
+    def results(self, batch_id: str) -> Iterator[Dict]:
+        for request in self.batches[batch_id]["requests"]:
+            yield {
+                "custom_id": request["custom_id"],
+                "type": "succeeded",
+                "message": self.responder(request["params"]),
+                "error": None
+            }
+
+
+def make_local_message(text: str, input_tokens: int = 0, output_tokens: int = 0):
+    """LocalBatchClient용 응답 메시지 생성"""
+    return SimpleNamespace(
+        content=[SimpleNamespace(type="text", text=text)],
+        usage=SimpleNamespace(input_tokens=input_tokens, output_tokens=output_tokens)
+    )
+
+
+class BatchSummarizer:
+    """ClaudeSummarizer의 요청 형식을 그대로 사용하는 배치 요약기"""
+
+    def __init__(self, summarizer: ClaudeSummarizer, batch_client=None,
+                 state_file: str = "output/summary_batch_state.json", poll_interval: float = 60,
+                 budget_ledger=None):
+        """
+        초기화
+
+        Args:
+            summarizer: 프롬프트 생성/응답 파싱에 사용할 요약기
+            batch_client: 제출/조회 클라이언트 (없으면 Anthropic API 사용, 테스트 시 LocalBatchClient)
+            state_file: 진행 중인 배치 정보 저장 파일
+            poll_interval: 상태 조회 간격 (초)
+            budget_ledger: 결과를 수집할 때 실제 사용량을 기록할 TokenLedger (이전 실행의 배치 포함)
+        """
+        self.summarizer = summarizer
+        if batch_client is None and summarizer.client is not None:
+            batch_client = AnthropicBatchClient(summarizer.client)
+        self.batch_client = batch_client
+        self.state_file = state_file
+        self.poll_interval = poll_interval
+        self.budget_ledger = budget_ledger
+
+    def load_state(self) -> Optional[Dict]:
+        """진행 중인 배치 정보 로드"""
+        if not os.path.exists(self.state_file):
+            return None
+        with open(self.state_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def save_state(self, state: Optional[Dict]):
+        """배치 정보 저장 (None이면 삭제)"""
+        if state is None:
+            if os.path.exists(self.state_file):
+                os.remove(self.state_file)
+            return
+        os.makedirs(os.path.dirname(self.state_file) or ".", exist_ok=True)
+        with open(self.state_file, 'w', encoding='utf-8') as f:
+            json.dump(state, f, ensure_ascii=False, indent=2)
+
+    def submit(self, items: List[Dict]) -> Optional[str]:
+        """
+        공고 목록을 하나의 배치로 제출
+
+        Args:
+            items: [{"uid": roRndUid, "title": 공고명, "text": 사업개요 원문}, ...]
+        """
+        if not self.batch_client:
+            print("❌ 배치 클라이언트가 초기화되지 않음")
+            return None
+
+        requests = []
+        input_lengths = {}
+        for item in items:
+            uid = str(item.get("uid", ""))
+            if not uid or uid in input_lengths:
+                continue  # custom_id는 배치 안에서 고유해야 함
+            if self.summarizer._validate_input(item.get("text", "")):
+                continue
+            requests.append({
+                "custom_id": uid,
+                "params": self.summarizer._build_request(item["text"], item.get("title", ""))
+            })
+            input_lengths[uid] = len(item["text"])
+
+        if not requests:
+            print("⚠️ 배치로 요약할 공고가 없습니다.")
+            return None
+
+        batch_id = self.batch_client.submit(requests)
+        self.save_state({
+            "batch_id": batch_id,
+            "submitted_at": datetime.now().strftime("%Y-%m-%dT%H:%M:%S"),
+            "model": self.summarizer.model,
+            "input_lengths": input_lengths
+        })
+        print(f"📦 배치 제출 완료: {batch_id} ({len(requests)}건)")
+        return batch_id
+
+    def wait(self, batch_id: str, timeout: Optional[float] = None) -> bool:
+        """배치가 끝날 때까지 폴링 (timeout 초과 시 False, 상태 파일은 유지)"""
+        started = time.time()
+        while True:
+            status = self.batch_client.status(batch_id)
+            print(f"   ⏳ 배치 상태: {status['status']} (완료 {status['succeeded']}, 오류 {status['errored']}, 진행 {status['processing']})")
+            if status["status"] == "ended":
+                return True
+            if timeout is not None and time.time() - started + self.poll_interval > timeout:
+                print(f"   ⚠️ 대기 시간 초과, 다음 실행에서 이어서 수집합니다: {batch_id}")
+                return False
+            time.sleep(self.poll_interval)
+
+    def collect(self, batch_id: str) -> Dict[str, Dict]:
+        """배치 결과를 roRndUid별 요약 결과 dict로 변환"""
+        state = self.load_state() or {}
+        input_lengths = state.get("input_lengths", {})
+        results = {}
+
+        for entry in self.batch_client.results(batch_id):
+            uid = entry["custom_id"]
+            if entry["type"] != "succeeded" or entry["message"] is None:
+                results[uid] = {
+                    "success": False,
+                    "error": f"배치 요청 실패 ({entry['type']}): {entry.get('error') or ''}",
+                    "summary": None
+                }
+                continue
+
+            result = self.summarizer._build_result(entry["message"], 0.0, input_lengths.get(uid, 0))
+            if result.get("metadata"):
+                result["metadata"]["batch_id"] = batch_id
+                self._record_usage(result["metadata"])
+            results[uid] = result
+
+        succeeded = len([r for r in results.values() if r["success"]])
+        print(f"✅ 배치 결과 수집: 성공 {succeeded}건 / 전체 {len(results)}건")
+        return results
+
+    def _record_usage(self, metadata: Dict):
+        """배치 결과 1건의 실제 사용량을 장부에 기록 (배치 할인 반영, 예약은 호출 측에서 해제)"""
+        if self.budget_ledger is None:
+            return
+        self.budget_ledger.record(metadata.get("input_tokens", 0), metadata.get("output_tokens", 0),
+                                  cost_usd=estimate_cost_usd(metadata))
+
+    def apply_results(self, announcements: List[Dict], results: Dict[str, Dict], store=None) -> int:
+        """roRndUid 기준으로 요약 결과를 공고 목록에 반영하고 반영 건수 반환 (store가 있으면 요약도 저장)"""
+        applied = 0
+        for announcement in announcements:
+            uid = extract_uid(announcement.get("상세_URL", ""))
+            result = results.get(uid)
+            if not result or not result.get("success"):
+                continue
+            announcement["ai_요약"] = result.get("summary", {})
+            announcement["요약_처리시간"] = time.strftime("%Y-%m-%dT%H:%M:%S")
+            if result.get("metadata"):
+                announcement["ai_메타데이터"] = result["metadata"]
+            if store is not None:
+                store.save_announcement(announcement)
+            applied += 1
+        return applied
+
+    def run(self, items: List[Dict], timeout: Optional[float] = None,
+            store: Optional[AnnouncementStore] = None) -> Dict[str, Dict]:
+        """
+        제출 → 대기 → 수집 (시간 안에 끝나지 않으면 빈 결과, 상태 파일로 재개 가능)
+
+        이전 실행에서 끝나지 않은 배치가 있으면 새로 제출하기 전에 그 배치부터 기다려 수집
+        (이번 목록에 없는 공고의 결과는 store가 있으면 공고 저장소에 바로 반영),
+        이전 배치에서 요약된 공고는 다시 제출하지 않음
+        """
+        started = time.time()
+        results = {}
+        state = self.load_state()
+        if state and state.get("batch_id"):
+            batch_id = state["batch_id"]
+            print(f"🔄 이전 실행의 배치부터 수집: {batch_id} (제출: {state.get('submitted_at', '')})")
+            if not self.wait(batch_id, timeout=timeout):
+                return {}
+            results = self.collect(batch_id)
+            self.save_state(None)
+
+            uids = {str(item.get("uid", "")) for item in items}
+            leftover = {uid: result for uid, result in results.items() if uid not in uids}
+            if leftover and store is not None:
+                announcements = [store.get_announcement(uid) for uid in leftover]
+                applied = self.apply_results([a for a in announcements if a], leftover, store=store)
+                print(f"💾 이전 배치 요약 {applied}건 공고 저장소에 반영")
+            results = {uid: result for uid, result in results.items() if uid in uids}
+
+            items = [item for item in items if not results.get(str(item.get("uid", "")), {}).get("success")]
+            if not items:
+                return results
+            if timeout is not None:
+                timeout = max(0.0, timeout - (time.time() - started))
+
+        batch_id = self.submit(items)
+        if not batch_id or not self.wait(batch_id, timeout=timeout):
+            return results
+        results.update(self.collect(batch_id))
+        self.save_state(None)
+        return results
+
+    def resume(self, store: Optional[AnnouncementStore] = None, timeout: Optional[float] = None) -> int:
+        """저장된 배치가 있으면 끝날 때까지 기다린 뒤 결과를 공고 저장소에 반영 (사용량은 budget_ledger에 기록)"""
+        state = self.load_state()
+        if not state:
+            print("ℹ️ 진행 중인 배치가 없습니다.")
+            return 0
+
+        batch_id = state["batch_id"]
+        print(f"🔄 배치 재개: {batch_id} (제출: {state.get('submitted_at', '')})")
+        if not self.wait(batch_id, timeout=timeout):
+            return 0
+
+        results = self.collect(batch_id)
+
+        store = store or AnnouncementStore.from_env()
+        announcements = [store.get_announcement(uid) for uid in results]
+        applied = self.apply_results([a for a in announcements if a], results, store=store)
+
+        self.save_state(None)
+        print(f"💾 {store.db_path}에 배치 요약 {applied}건 반영")
+        return applied
+
+
+def main():
+    """진행 중인 배치 결과를 공고 저장소에 반영"""
+    print("Message Batches 요약 재개")
+    print("=" * 50)
+
+    budget_ledger = TokenLedger.from_env()
+    batch_summarizer = BatchSummarizer(ClaudeSummarizer(), budget_ledger=budget_ledger)
+    if not batch_summarizer.batch_client:
+        print("❌ ANTHROPIC_API_KEY가 설정되지 않아 배치를 조회할 수 없습니다.")
+        return
+    batch_summarizer.resume()
+    budget_ledger.save()
+
+
+if __name__ == "__main__":
+    main()
@@ -6,28 +6,128 @@ Anthropic Claude를 사용하여 사업개요를 구조화된 요약으로 변
 """
 
 import anthropic
+import asyncio
 import os
 import time
 import re
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Tuple
 import json
+import sys
+from types import SimpleNamespace
 from dotenv import load_dotenv
 
+try:
+    from src.utils.rate_limiter import RateLimiter, backoff_delay
+    from src.utils.summary_cache import SummaryCache
+    from src.utils.token_estimator import TokenEstimator
+except ImportError:
+    # 스크립트로 직접 실행한 경우 (python src/data_processor/claude_summarizer.py) 프로젝트 루트를 경로에 추가
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+    from src.utils.rate_limiter import RateLimiter, backoff_delay
+    from src.utils.summary_cache import SummaryCache
+    from src.utils.token_estimator import TokenEstimator
+
 # .env 파일 로드
 load_dotenv()
 
+# 모든 공고에 공통인 요약 지시문 (system 프롬프트로 보내 공고 본문과 분리)
+SUMMARY_INSTRUCTIONS = """당신은 정부 R&D 사업공고의 사업개요를 명확하고 구조화된 형태로 요약하는 전문가입니다.
+사용자가 공고제목과 사업개요 원문을 주면 아래 요구사항에 따라 요약해주세요.
+
+요약 요구사항:
+1. 10-20줄 분량으로 작성
+2. 다음 구조로 정리:
+   - 사업목적: 이 사업이 추진되는 핵심 목적
+   - 지원내용: 구체적으로 무엇을 지원하는지
+   - 지원규모: 예산, 기간, 선정규모 등
+   - 신청대상: 누가 신청할 수 있는지
+   - 주요특징: 이 사업만의 특별한 점
+
+3. 전문용어는 이해하기 쉽게 설명
+4. 핵심 내용만 간결하게 정리
+5. 불필요한 절차적 내용은 제외
+6. 결과는 record_summary 도구로 항목별로 제출하고, 원문에 정보가 없는 항목은 "공고문에 명시되지 않음"으로 작성"""
+
+# 토큰 예산에 맞춰 입력을 잘랐을 때 끝에 붙이는 표시 (모델에게도 뒷부분이 생략됐음을 알림)
+TRUNCATION_MARK = "(이하 원문 생략)"
+
+# 구조화 요약 항목과 설명 (도구 입력 스키마로 사용)
+SUMMARY_FIELDS = {
+    "사업목적": "이 사업이 추진되는 핵심 목적",
+    "지원내용": "구체적으로 무엇을 지원하는지",
+    "지원규모": "예산, 기간, 선정규모 등",
+    "신청대상": "누가 신청할 수 있는지",
+    "주요특징": "이 사업만의 특별한 점"
+}
+
+SUMMARY_TOOL_NAME = "record_summary"
+REPAIR_TOOL_NAME = "fill_missing_fields"
+PACK_TOOL_NAME = "record_summaries"
+
+
+def build_summary_tool(name: str = SUMMARY_TOOL_NAME, fields: Optional[List[str]] = None) -> Dict:
+    """요약 항목을 문자열 필드로 받는 도구 정의 생성 (fields가 없으면 전체 항목)"""
+    fields = fields or list(SUMMARY_FIELDS)
+    return {
+        "name": name,
+        "description": "정부 R&D 사업공고 사업개요의 구조화된 요약을 항목별로 기록합니다.",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                field: {"type": "string", "description": SUMMARY_FIELDS[field]}
+                for field in fields
+            },
+            "required": fields
+        }
+    }
+
+def build_pack_tool() -> Dict:
+    """여러 공고의 요약을 공고 ID와 함께 배열로 받는 도구 정의 생성"""
+    item_schema = build_summary_tool()["input_schema"]
+    return {
+        "name": PACK_TOOL_NAME,
+        "description": "여러 정부 R&D 사업공고의 구조화된 요약을 공고 ID별로 기록합니다.",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "summaries": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "id": {"type": "string", "description": "입력에 표시된 공고 ID (그대로 기재)"},
+                            **item_schema["properties"]
+                        },
+                        "required": ["id"] + item_schema["required"]
+                    }
+                }
+            },
+            "required": ["summaries"]
+        }
+    }
+
 class ClaudeSummarizer:
     """Claude API 기반 사업공고 요약기"""
     
-    def __init__(self, api_key: Optional[str] = None):
+    # 프롬프트 템플릿 버전 (프롬프트/응답 형식을 바꾸면 올려서 기존 캐시 무효화)
+    PROMPT_VERSION = "3"
+    
+    def __init__(self, api_key: Optional[str] = None, rate_limiter: Optional[RateLimiter] = None,
+                 cache: Optional[SummaryCache] = None, token_estimator: Optional[TokenEstimator] = None,
+                 base_url: Optional[str] = None):
         """
         초기화
         
         Args:
             api_key: Claude API 키 (없으면 환경변수에서 가져오기)
+            rate_limiter: 여러 요청이 공유하는 속도 제한기 (없으면 제한 없이 호출)
+            cache: 요약 결과 캐시 (없으면 매번 API 호출)
+            token_estimator: 토큰 추정기 (없으면 저장하지 않는 기본 추정기)
+            base_url: API 주소 (로컬 테스트 서버 연결용, 없으면 ANTHROPIC_BASE_URL 또는 기본 주소)
         """
         # API 키 설정
         self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
+        self.base_url = base_url or os.getenv("ANTHROPIC_BASE_URL") or None
         
         if not self.api_key:
             print("⚠️ Claude API 키가 설정되지 않았습니다.")
@@ -35,42 +135,49 @@ class ClaudeSummarizer:
             self.client = None
         else:
             try:
-                self.client = anthropic.Anthropic(api_key=self.api_key)
-                print("✅ Claude API 클라이언트 초기화 완료")
+                self.client = anthropic.Anthropic(api_key=self.api_key, base_url=self.base_url)
+                print(f"✅ Claude API 클라이언트 초기화 완료{f' ({self.base_url})' if self.base_url else ''}")
             except Exception as e:
                 print(f"❌ Claude API 클라이언트 초기화 실패: {str(e)}")
                 self.client = None
         
         # 요약 설정
         self.model = "claude-3-haiku-20240307"  # 빠르고 비용 효율적
-        self.max_tokens = 1000  # 요약 최대 길이
+        self.max_tokens = 1000  # 출력 통계가 쌓이기 전 기본 요약 최대 길이
+        self.max_output_tokens = 2000  # 통계 기반으로 늘릴 수 있는 상한
         self.temperature = 0.3  # 일관성 있는 요약을 위해 낮은 값
         
-        # 토큰 제한 (입력 텍스트)
-        self.max_input_chars = 8000  # 약 2000 토큰
+        # 토큰 제한 (입력 텍스트, 문장 경계에서 자름)
+        self.max_input_tokens = 3000
+        self.token_estimator = token_estimator or TokenEstimator(stats_file=None)
+        
+        # 짧은 공고 묶음 요약 (공고당 토큰 상한, 한 요청당 최대 공고 수)
+        self.pack_item_max_tokens = 800
+        self.max_pack_items = 6
+        
+        # 속도 제한 (동시 요청 간 공유)
+        self.rate_limiter = rate_limiter
+        
+        # 요약 결과 캐시
+        self.cache = cache
         
         print("Claude 요약기 초기화 완료")
     
+    def _create_system_prompt(self) -> List[Dict]:
+        """고정 지시문 system 블록
+
+        지시문+도구 정의를 합쳐도 모델의 최소 캐시 길이(Haiku 2048토큰)에 못 미쳐
+        cache_control을 붙여도 캐시되지 않으므로 지정하지 않음
+        """
+        return [{"type": "text", "text": SUMMARY_INSTRUCTIONS}]
+    
     def _create_summary_prompt(self, business_overview: str, announcement_title: str = "") -> str:
-        """요약 프롬프트 생성"""
+        """요약 프롬프트 생성 (공고마다 달라지는 부분만 포함, 지시문은 system 블록)"""
         
-        prompt = f"""다음은 정부 R&D 사업공고의 사업개요입니다. 이 내용을 명확하고 구조화된 형태로 요약해주세요.
+        prompt = f"""다음은 정부 R&D 사업공고의 사업개요입니다.
 
 공고제목: {announcement_title}
 
-요약 요구사항:
-1. 10-20줄 분량으로 작성
-2. 다음 구조로 정리:
-   - 사업목적: 이 사업이 추진되는 핵심 목적
-   - 지원내용: 구체적으로 무엇을 지원하는지
-   - 지원규모: 예산, 기간, 선정규모 등
-   - 신청대상: 누가 신청할 수 있는지
-   - 주요특징: 이 사업만의 특별한 점
-
-3. 전문용어는 이해하기 쉽게 설명
-4. 핵심 내용만 간결하게 정리
-5. 불필요한 절차적 내용은 제외
-
 사업개요 원문:
 {business_overview}
 
@@ -78,22 +185,51 @@ class ClaudeSummarizer:
 
         return prompt
     
-    def _clean_input_text(self, text: str) -> str:
-        """입력 텍스트 전처리"""
+    def _clean_input_text(self, text: str, budget_tokens: Optional[int] = None) -> str:
+        """입력 텍스트 전처리 (토큰 예산을 넘으면 문장 경계에서 자르고 생략 표시)"""
         if not text:
             return ""
         
-        # 길이 제한
-        if len(text) > self.max_input_chars:
-            text = text[:self.max_input_chars] + "..."
-            print(f"입력 텍스트가 길어서 {self.max_input_chars}자로 제한됨")
-        
-        # 불필요한 문자 정리
+        text = self._normalize_text(text)
+        budget_tokens = budget_tokens or self.max_input_tokens
+        truncated, was_cut = self.token_estimator.truncate_to_budget(text, budget_tokens)
+        if was_cut:
+            print(f"입력 텍스트가 길어서 {budget_tokens:,} 토큰 예산에 맞춰 {len(text):,}자 → {len(truncated):,}자로 줄임")
+            truncated += f" {TRUNCATION_MARK}"
+        return truncated
+    
+    def _normalize_text(self, text: str) -> str:
+        """불필요한 문자 정리"""
         text = re.sub(r'\s+', ' ', text)  # 연속 공백 제거
         text = re.sub(r'\n{3,}', '\n\n', text)  # 연속 줄바꿈 제한
-        text = text.strip()
-        
-        return text
+        return text.strip()
+    
+    def _cache_key(self, business_overview: str, model: Optional[str] = None) -> str:
+        """캐시 키 (제목은 제외: 재공고처럼 제목만 다른 동일 본문도 적중)"""
+        cleaned = self._normalize_text(business_overview)
+        return SummaryCache.make_key(model or self.model, self.PROMPT_VERSION, self.temperature, cleaned)
+    
+    def _is_cacheable(self, result: Dict) -> bool:
+        """성공한 결과만 캐시"""
+        return bool(result.get("success"))
+    
+    def _from_cache(self, cached: Dict, elapsed_time: float) -> Dict:
+        """캐시된 결과를 반환 형식으로 변환 (토큰 사용량 0, 원래 사용량은 cached_usage에 보존)"""
+        result = dict(cached)
+        metadata = dict(cached.get("metadata") or {})
+        metadata["cached_usage"] = {
+            "input_tokens": metadata.get("input_tokens", 0),
+            "output_tokens": metadata.get("output_tokens", 0)
+        }
+        metadata.update({
+            "input_tokens": 0,
+            "output_tokens": 0,
+            "processing_time": elapsed_time,
+            "cache_hit": True
+        })
+        result["metadata"] = metadata
+        print(f"⚡ 요약 캐시 적중 ({elapsed_time * 1e6:.0f}µs, 토큰 사용 없음)")
+        return result
     
     def _parse_summary_response(self, response_text: str) -> Dict:
         """Claude 응답을 구조화된 형태로 파싱"""
@@ -138,93 +274,356 @@ class ClaudeSummarizer:
                 "전체요약": response_text.strip()
             }
     
-    def summarize_business_overview(self, business_overview: str, announcement_title: str = "") -> Dict:
-        """사업개요 요약 실행"""
-        try:
-            if not self.client:
-                return {
-                    "success": False,
-                    "error": "Claude API 클라이언트가 초기화되지 않음",
-                    "summary": None
-                }
-            
-            if not business_overview or len(business_overview.strip()) < 50:
-                return {
-                    "success": False,
-                    "error": "요약할 내용이 너무 짧거나 없음",
-                    "summary": None
+    def _estimate_tokens(self, text: str) -> int:
+        """텍스트 토큰 수 추정 (usage/count_tokens로 보정된 추정기 사용)"""
+        return self.token_estimator.estimate(text)
+    
+    def _validate_input(self, business_overview: str) -> Optional[Dict]:
+        """요약 가능 여부 확인 (불가능하면 실패 결과 반환)"""
+        if not business_overview or len(business_overview.strip()) < 50:
+            return {
+                "success": False,
+                "error": "요약할 내용이 너무 짧거나 없음",
+                "summary": None
+            }
+        return None
+    
+    def _build_request(self, business_overview: str, announcement_title: str = "",
+                       model: Optional[str] = None) -> Dict:
+        """messages.create 요청 파라미터 생성 (model이 없으면 기본 모델)"""
+        # 입력 텍스트 전처리
+        cleaned_text = self._clean_input_text(business_overview)
+        
+        # 프롬프트 생성
+        prompt = self._create_summary_prompt(cleaned_text, announcement_title)
+        
+        return {
+            "model": model or self.model,
+            "max_tokens": self._output_budget(),
+            "temperature": self.temperature,
+            "system": self._create_system_prompt(),
+            "messages": [
+                {
+                    "role": "user",
+                    "content": prompt
                 }
+            ],
+            **self._tool_params()
+        }
+    
+    def _tool_params(self) -> Dict:
+        """요약 도구 정의 + 도구 사용 강제 (응답을 스키마에 맞는 JSON으로 받기)"""
+        return {
+            "tools": [build_summary_tool()],
+            "tool_choice": {"type": "tool", "name": SUMMARY_TOOL_NAME}
+        }
+    
+    def _output_budget(self) -> int:
+        """최근 출력 토큰 분포로 정한 max_tokens"""
+        return self.token_estimator.suggest_max_tokens(default=self.max_tokens, maximum=self.max_output_tokens)
+    
+    def estimate_call_budget(self, business_overview: str, announcement_title: str = "",
+                             model: Optional[str] = None) -> List[Tuple[int, int]]:
+        """
+        공고 1건 요약의 최악의 경우 호출별 (입력, 출력) 토큰
+        실제로 보낼 요청(system 프롬프트/도구 정의 포함, max_tokens는 출력 통계로 늘린 값)과 빈 항목 보완 요청
+        """
+        request = self._build_request(business_overview, announcement_title, model=model)
+        repair_request = self._build_repair_request(request, SimpleNamespace(content=[]), list(SUMMARY_FIELDS))
+        return [
+            (self._estimate_request_tokens(request), request["max_tokens"]),
+            # 보완 요청 입력에는 이전 응답(최대 출력)도 포함됨
+            (self._estimate_request_tokens(repair_request) + request["max_tokens"], repair_request["max_tokens"])
+        ]
+    
+    def _request_text(self, request: Dict) -> str:
+        """토큰 추정용으로 요청의 system/도구/메시지 텍스트를 이어 붙임"""
+        parts = [block["text"] for block in request.get("system", [])]
+        if request.get("tools"):
+            parts.append(json.dumps(request["tools"], ensure_ascii=False))
+        for message in request["messages"]:
+            content = message["content"]
+            parts.append(content if isinstance(content, str) else json.dumps(content, ensure_ascii=False))
+        return "\n".join(parts)
+    
+    def _estimate_request_tokens(self, request: Dict) -> int:
+        """요청 파라미터의 입력 토큰 수 추정"""
+        return self._estimate_tokens(self._request_text(request))
+    
+    def calibrate_token_estimator(self, request: Dict) -> Optional[int]:
+        """count_tokens API로 요청의 실제 입력 토큰 수를 세어 추정기 보정 (실패 시 None)"""
+        if not self.client:
+            return None
+        params = {key: request[key] for key in ("model", "system", "messages", "tools", "tool_choice") if key in request}
+        try:
+            counted = self.client.messages.count_tokens(**params)
+        except Exception as e:
+            print(f"⚠️ 토큰 수 확인 실패: {str(e)}")
+            return None
+        self.token_estimator.observe(self.token_estimator.raw_estimate(self._request_text(request)), counted.input_tokens)
+        print(f"📏 토큰 추정 보정: 실제 {counted.input_tokens:,} 토큰 (보정계수 {self.token_estimator.scale:.2f})")
+        return counted.input_tokens
+    
+    def _record_usage(self, request: Dict, response, input_length: int):
+        """호출 1건의 실제 토큰 사용량을 추정기 통계에 기록"""
+        usage = getattr(response, "usage", None)
+        if usage is None:
+            return
+        # 프롬프트 캐시를 쓰면 input_tokens에는 캐시되지 않은 부분만 포함됨
+        actual_input = (getattr(usage, 'input_tokens', 0) or 0) \
+            + (getattr(usage, 'cache_read_input_tokens', 0) or 0) \
+            + (getattr(usage, 'cache_creation_input_tokens', 0) or 0)
+        prompt = request["messages"][0]["content"]
+        self.token_estimator.record_call(
+            self.token_estimator.raw_estimate(self._request_text(request)),
+            actual_input,
+            getattr(usage, 'output_tokens', 0) or 0,
+            request["max_tokens"],
+            stop_reason=getattr(response, "stop_reason", "") or "",
+            input_chars=input_length,
+            truncated=isinstance(prompt, str) and TRUNCATION_MARK in prompt
+        )
+    
+    def _compose_full_summary(self, fields: Dict) -> Dict:
+        """항목별 요약에 전체요약(항목을 이어 붙인 텍스트) 추가"""
+        summary = {field: (fields.get(field) or "").strip() for field in SUMMARY_FIELDS}
+        summary["전체요약"] = "\n".join(
+            f"- {field}: {value}" for field, value in summary.items() if value
+        )
+        return summary
+    
+    def _find_tool_use(self, response, tool_name: str = SUMMARY_TOOL_NAME):
+        """응답에서 지정한 도구 호출 블록 찾기"""
+        for block in response.content or []:
+            if getattr(block, "type", "") == "tool_use" and getattr(block, "name", "") == tool_name:
+                return block
+        return None
+    
+    def _extract_summary(self, response):
+        """
+        응답에서 구조화 요약 추출 (도구 호출 입력 우선, 텍스트 응답이면 정규식 파싱)
+        
+        Returns:
+            (요약 dict, 원문 응답 텍스트) 또는 (None, "")
+        """
+        tool_use = self._find_tool_use(response)
+        if tool_use is not None and isinstance(tool_use.input, dict):
+            fields = {
+                field: value if isinstance(value, str) else ""
+                for field, value in tool_use.input.items()
+            }
+            return self._compose_full_summary(fields), json.dumps(tool_use.input, ensure_ascii=False)
+        
+        texts = [block.text for block in response.content or [] if getattr(block, "type", "text") == "text"]
+        if texts:
+            summary_text = "\n".join(texts)
+            return self._parse_summary_response(summary_text), summary_text
+        return None, ""
+    
+    def _missing_fields(self, summary: Optional[Dict]) -> List[str]:
+        """비어 있는 요약 항목 목록"""
+        if not summary:
+            return []
+        return [field for field in SUMMARY_FIELDS if not (summary.get(field) or "").strip()]
+    
+    def _build_result(self, response, elapsed_time: float, input_length: int) -> Dict:
+        """API 응답을 요약 결과 dict로 변환"""
+        parsed_summary, summary_text = self._extract_summary(response) if response.content else (None, "")
+        if parsed_summary is not None:
+            # 토큰 사용량 정보 (있는 경우)
+            input_tokens = getattr(response.usage, 'input_tokens', 0)
+            output_tokens = getattr(response.usage, 'output_tokens', 0)
+            cache_read_tokens = getattr(response.usage, 'cache_read_input_tokens', 0) or 0
+            cache_write_tokens = getattr(response.usage, 'cache_creation_input_tokens', 0) or 0
             
-            print(f"Claude API 요약 시작...")
-            print(f"입력 텍스트: {len(business_overview)}자")
-            
-            # 입력 텍스트 전처리
-            cleaned_text = self._clean_input_text(business_overview)
-            
-            # 프롬프트 생성
-            prompt = self._create_summary_prompt(cleaned_text, announcement_title)
+            print(f"✅ Claude API 요약 완료!")
+            print(f"   처리 시간: {elapsed_time:.1f}초")
+            print(f"   입력 토큰: {input_tokens:,} (캐시 읽기 {cache_read_tokens:,}, 캐시 쓰기 {cache_write_tokens:,})")
+            print(f"   출력 토큰: {output_tokens:,}")
+            print(f"   요약 길이: {len(summary_text)}자")
             
+            return {
+                "success": True,
+                "summary": parsed_summary,
+                "raw_response": summary_text,
+                "metadata": {
+                    # 실제로 응답한 모델 (모델 라우팅으로 기본 모델과 다를 수 있음)
+                    "model": getattr(response, "model", None) or self.model,
+                    "input_tokens": input_tokens,
+                    "output_tokens": output_tokens,
+                    "cache_read_input_tokens": cache_read_tokens,
+                    "cache_creation_input_tokens": cache_write_tokens,
+                    "processing_time": elapsed_time,
+                    "input_length": input_length,
+                    "output_length": len(summary_text)
+                }
+            }
+        else:
+            return {
+                "success": False,
+                "error": "Claude API에서 빈 응답을 받음",
+                "summary": None
+            }
+    
+    def _retry_after_seconds(self, error: Exception) -> Optional[float]:
+        """API 오류 응답의 retry-after 헤더 값(초) 추출"""
+        try:
+            value = error.response.headers.get("retry-after")
+            return float(value) if value is not None else None
+        except Exception:
+            return None
+    
+    def _settle_response(self, reserved_input: int, reserved_output: int, response=None):
+        """
+        요청 1건의 속도 제한기 예약 정리 (모든 종료 경로에서 한 번만 호출)
+        응답이 없으면(오류) 예약분을 모두 반환하고, 응답이 있으면 실제 usage로 보정
+        """
+        if not self.rate_limiter:
+            return
+        usage = getattr(response, "usage", None)
+        self.rate_limiter.settle(reserved_input, reserved_output,
+                                 getattr(usage, 'input_tokens', 0) or 0, getattr(usage, 'output_tokens', 0) or 0)
+    
+    def summarize_business_overview(self, business_overview: str, announcement_title: str = "",
+                                    model: Optional[str] = None) -> Dict:
+        """사업개요 요약 실행 (캐시가 있으면 먼저 조회, model로 이번 요청의 모델 지정 가능)"""
+        if not self.cache or not self.client or self._validate_input(business_overview):
+            return self._request_summary(business_overview, announcement_title, model)
+        
+        start_time = time.perf_counter()
+        result, hit = self.cache.get_or_compute(
+            self._cache_key(business_overview, model),
+            lambda: self._request_summary(business_overview, announcement_title, model),
+            cacheable=self._is_cacheable
+        )
+        if hit:
+            return self._from_cache(result, time.perf_counter() - start_time)
+        return result
+    
+    def _request_summary(self, business_overview: str, announcement_title: str = "",
+                         model: Optional[str] = None) -> Dict:
+        """Claude API로 사업개요 요약 요청"""
+        if not self.client:
+            return {
+                "success": False,
+                "error": "Claude API 클라이언트가 초기화되지 않음",
+                "summary": None
+            }
+        
+        invalid = self._validate_input(business_overview)
+        if invalid:
+            return invalid
+        
+        print(f"Claude API 요약 시작...")
+        print(f"입력 텍스트: {len(business_overview)}자")
+        
+        request = self._build_request(business_overview, announcement_title, model)
+        if not self.token_estimator.calibrated and self.calibrate_token_estimator(request):
+            # 보정된 추정치로 입력 예산을 다시 맞춤
+            request = self._build_request(business_overview, announcement_title, model)
+        return self._send_request(request, len(business_overview))
+    
+    def _create_update_prompt(self, prior_summary: Dict, changes: Dict, announcement_title: str = "") -> str:
+        """이전 요약 + 변경 구절로 요약 갱신 프롬프트 생성"""
+        sections = ["사업목적", "지원내용", "지원규모", "신청대상", "주요특징"]
+        prior_lines = "\n".join(f"- {section}: {prior_summary.get(section, '') or '(없음)'}" for section in sections)
+        added = self._clean_input_text("\n".join(changes.get("added", [])))
+        removed = self._clean_input_text("\n".join(changes.get("removed", [])), self.max_input_tokens // 2)
+        
+        prompt = f"""다음은 이전 정부 R&D 사업공고의 요약과, 새 공고문에서 이전 공고 대비 바뀐 부분입니다. 바뀐 내용을 반영하여 요약을 갱신해주세요.
+
+공고제목: {announcement_title}
+
+이전 요약:
+{prior_lines}
+
+새 공고문에서 추가되거나 바뀐 부분:
+{added or '(없음)'}
+
+이전 공고문에서 삭제되거나 바뀌기 전 부분:
+{removed or '(없음)'}
+
+요약 요구사항:
+1. 바뀌지 않은 내용은 이전 요약을 그대로 유지
+2. 바뀐 예산, 기간, 대상, 일정 등은 새 값으로 반영
+3. 사업목적, 지원내용, 지원규모, 신청대상, 주요특징 항목으로 정리하여 record_summary 도구로 제출
+
+위 내용을 바탕으로 갱신된 구조화 요약을 작성해주세요."""
+
+        return prompt
+    
+    def summarize_update(self, prior_summary: Dict, changes: Dict, announcement_title: str = "") -> Dict:
+        """
+        이전 공고 요약과 변경 구절만 보내 요약 갱신 (정정공고/다음 연도 공고용)
+        
+        Args:
+            prior_summary: 이전 공고의 구조화 요약
+            changes: compute_text_changes() 결과 {"added", "removed", "changed_ratio"}
+            announcement_title: 새 공고 제목
+        """
+        if not self.client:
+            return {
+                "success": False,
+                "error": "Claude API 클라이언트가 초기화되지 않음",
+                "summary": None
+            }
+        
+        print(f"Claude API 요약 갱신 시작... (변경 구절 {len(changes.get('added', []))}개)")
+        
+        prompt = self._create_update_prompt(prior_summary, changes, announcement_title)
+        request = {
+            "model": self.model,
+            "max_tokens": self._output_budget(),
+            "temperature": self.temperature,
+            "messages": [{"role": "user", "content": prompt}],
+            **self._tool_params()
+        }
+        result = self._send_request(request, len(prompt))
+        if result.get("metadata"):
+            result["metadata"]["mode"] = "diff"
+            result["metadata"]["changed_ratio"] = round(changes.get("changed_ratio", 0.0), 3)
+        return result
+    
+    def _send_request(self, request: Dict, input_length: int) -> Dict:
+        """요청 전송 (속도 제한 대기 → API 호출 → 결과 변환)"""
+        # 속도 제한 대기
+        reserved_input = self._estimate_request_tokens(request)
+        if self.rate_limiter:
+            self.rate_limiter.acquire(reserved_input, request["max_tokens"])
+        response = None
+        
+        try:
             # Claude API 호출
             start_time = time.time()
             
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=self.max_tokens,
-                temperature=self.temperature,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ]
-            )
+            try:
+                response = self.client.messages.create(**request)
+            finally:
+                # 성공/실패와 관계없이 예약량 정리 (실패하면 전부 반환)
+                self._settle_response(reserved_input, request["max_tokens"], response)
             
             elapsed_time = time.time() - start_time
             
             # 응답 처리
-            if response.content and len(response.content) > 0:
-                summary_text = response.content[0].text
-                
-                # 구조화된 파싱
-                parsed_summary = self._parse_summary_response(summary_text)
-                
-                # 토큰 사용량 정보 (있는 경우)
-                input_tokens = getattr(response.usage, 'input_tokens', 0)
-                output_tokens = getattr(response.usage, 'output_tokens', 0)
-                
-                print(f"✅ Claude API 요약 완료!")
-                print(f"   처리 시간: {elapsed_time:.1f}초")
-                print(f"   입력 토큰: {input_tokens:,}")
-                print(f"   출력 토큰: {output_tokens:,}")
-                print(f"   요약 길이: {len(summary_text)}자")
-                
-                return {
-                    "success": True,
-                    "summary": parsed_summary,
-                    "raw_response": summary_text,
-                    "metadata": {
-                        "model": self.model,
-                        "input_tokens": input_tokens,
-                        "output_tokens": output_tokens,
-                        "processing_time": elapsed_time,
-                        "input_length": len(business_overview),
-                        "output_length": len(summary_text)
-                    }
-                }
-            else:
-                return {
-                    "success": False,
-                    "error": "Claude API에서 빈 응답을 받음",
-                    "summary": None
-                }
+            result = self._build_result(response, elapsed_time, input_length)
+            self._record_usage(request, response, input_length)
+            
+            # 빈 항목이 있으면 그 항목만 짧게 다시 요청
+            missing = self._missing_fields(result.get("summary"))
+            if missing:
+                result = self._repair_missing_fields(request, response, result, missing)
+            return result
                 
         except anthropic.RateLimitError as e:
             print(f"⚠️ Claude API 요청 한도 초과: {str(e)}")
+            retry_after = self._retry_after_seconds(e) or 60
+            if self.rate_limiter:
+                self.rate_limiter.pause(retry_after)
             return {
                 "success": False,
                 "error": f"API 요청 한도 초과: {str(e)}",
                 "summary": None,
-                "retry_after": 60  # 60초 후 재시도 권장
+                "retry_after": retry_after  # 서버가 알려준 재시도 대기 시간 (없으면 60초)
             }
             
         except anthropic.APIError as e:
@@ -243,6 +642,241 @@ class ClaudeSummarizer:
                 "summary": None
             }
     
+    def _build_repair_request(self, request: Dict, response, missing: List[str]) -> Dict:
+        """빈 항목만 채우도록 이전 대화에 이어 붙이는 보완 요청 생성"""
+        instruction = (f"다음 항목이 비어 있습니다: {', '.join(missing)}. "
+                       f"원문에서 해당 내용을 찾아 이 항목만 채워주세요. "
+                       f"원문에 정보가 없으면 \"공고문에 명시되지 않음\"으로 작성하세요.")
+        
+        tool_use = self._find_tool_use(response)
+        if tool_use is not None:
+            assistant_content = [{"type": "tool_use", "id": tool_use.id, "name": tool_use.name, "input": tool_use.input}]
+            follow_up = [{"type": "tool_result", "tool_use_id": tool_use.id, "content": instruction}]
+        else:
+            raw_text = "\n".join(getattr(block, "text", "") for block in response.content or [])
+            assistant_content = [{"type": "text", "text": raw_text or "(빈 응답)"}]
+            follow_up = [{"type": "text", "text": instruction}]
+        
+        repair_request = {key: value for key, value in request.items() if key not in ("messages", "tools", "tool_choice")}
+        repair_request.update({
+            "max_tokens": min(self.max_tokens, 100 * len(missing) + 100),
+            "messages": request["messages"] + [
+                {"role": "assistant", "content": assistant_content},
+                {"role": "user", "content": follow_up}
+            ],
+            # 대화 기록의 record_summary 호출을 위해 원래 도구도 함께 전달
+            "tools": [build_summary_tool(), build_summary_tool(REPAIR_TOOL_NAME, missing)],
+            "tool_choice": {"type": "tool", "name": REPAIR_TOOL_NAME}
+        })
+        return repair_request
+    
+    def _merge_repair(self, result: Dict, repair_response, missing: List[str], elapsed_time: float) -> Dict:
+        """보완 응답의 항목을 기존 요약에 채우고 토큰 사용량 합산"""
+        tool_use = self._find_tool_use(repair_response, REPAIR_TOOL_NAME)
+        filled = {}
+        if tool_use is not None and isinstance(tool_use.input, dict):
+            filled = {
+                field: tool_use.input[field].strip() for field in missing
+                if isinstance(tool_use.input.get(field), str) and tool_use.input[field].strip()
+            }
+        
+        summary = dict(result["summary"])
+        summary.update(filled)
+        result["summary"] = self._compose_full_summary(summary)
+        
+        metadata = result.setdefault("metadata", {})
+        usage = repair_response.usage
+        metadata["input_tokens"] = metadata.get("input_tokens", 0) + getattr(usage, 'input_tokens', 0)
+        metadata["output_tokens"] = metadata.get("output_tokens", 0) + getattr(usage, 'output_tokens', 0)
+        metadata["processing_time"] = metadata.get("processing_time", 0.0) + elapsed_time
+        metadata["repaired_fields"] = list(filled)
+        
+        still_missing = [field for field in missing if field not in filled]
+        print(f"🔧 빈 항목 보완: {len(filled)}/{len(missing)}개 채움"
+              + (f" (여전히 비어 있음: {', '.join(still_missing)})" if still_missing else ""))
+        return result
+    
+    def _repair_missing_fields(self, request: Dict, response, result: Dict, missing: List[str]) -> Dict:
+        """빈 항목 보완 요청 (실패해도 원래 결과 유지)"""
+        print(f"🔧 빈 항목 보완 요청: {', '.join(missing)}")
+        repair_request = self._build_repair_request(request, response, missing)
+        reserved_input = self._estimate_request_tokens(repair_request)
+        if self.rate_limiter:
+            self.rate_limiter.acquire(reserved_input, repair_request["max_tokens"])
+        repair_response = None
+        try:
+            start_time = time.time()
+            repair_response = self.client.messages.create(**repair_request)
+            elapsed_time = time.time() - start_time
+        except anthropic.APIError as e:
+            print(f"⚠️ 빈 항목 보완 실패: {str(e)}")
+            return result
+        finally:
+            self._settle_response(reserved_input, repair_request["max_tokens"], repair_response)
+        
+        return self._merge_repair(result, repair_response, missing, elapsed_time)
+    
+    def is_packable(self, business_overview: str) -> bool:
+        """다른 짧은 공고와 묶어서 요약할 만큼 짧은지 여부"""
+        if self._validate_input(business_overview):
+            return False
+        return self._estimate_tokens(self._normalize_text(business_overview)) <= self.pack_item_max_tokens
+    
+    def _plan_packs(self, items: List[Dict]) -> List[List[Dict]]:
+        """입력 토큰 예산과 최대 공고 수 안에서 짧은 공고를 순서대로 묶기"""
+        packs, current, used = [], [], 0
+        for item in items:
+            cost = self._estimate_tokens(self._normalize_text(item["text"])) + self._estimate_tokens(item.get("title", ""))
+            if current and (used + cost > self.max_input_tokens or len(current) >= self.max_pack_items):
+                packs.append(current)
+                current, used = [], 0
+            current.append(item)
+            used += cost
+        if current:
+            packs.append(current)
+        return packs
+    
+    def _build_pack_request(self, items: List[Dict]) -> Dict:
+        """공고 여러 건을 ID와 함께 한 요청으로 묶은 요청 파라미터 생성"""
+        sections = "\n\n".join(
+            f"[공고 ID: {item['uid']}]\n공고제목: {item.get('title', '')}\n사업개요 원문:\n{self._normalize_text(item['text'])}"
+            for item in items
+        )
+        prompt = f"""다음은 정부 R&D 사업공고 {len(items)}건의 사업개요입니다.
+
+{sections}
+
+각 공고를 따로 요약하여, 공고 ID를 그대로 적고 record_summaries 도구로 한 번에 제출해주세요."""
+        
+        return {
+            "model": self.model,
+            "max_tokens": min(self._output_budget() * len(items), 4096),
+            "temperature": self.temperature,
+            "system": self._create_system_prompt(),
+            "messages": [{"role": "user", "content": prompt}],
+            "tools": [build_pack_tool()],
+            "tool_choice": {"type": "tool", "name": PACK_TOOL_NAME}
+        }
+    
+    def _split_pack_response(self, response, items: List[Dict], elapsed_time: float) -> Dict[str, Dict]:
+        """묶음 응답을 공고 ID별 요약 결과로 분리 (토큰 사용량은 입력 길이 비율로 나눔)"""
+        tool_use = self._find_tool_use(response, PACK_TOOL_NAME)
+        entries = tool_use.input.get("summaries", []) if tool_use is not None and isinstance(tool_use.input, dict) else []
+        
+        usage = response.usage
+        total_chars = sum(len(item["text"]) for item in items) or 1
+        item_by_uid = {str(item["uid"]): item for item in items}
+        
+        results = {}
+        for entry in entries:
+            if not isinstance(entry, dict) or str(entry.get("id", "")) not in item_by_uid:
+                continue
+            item = item_by_uid[str(entry["id"])]
+            share = len(item["text"]) / total_chars
+            summary = self._compose_full_summary({
+                field: value for field, value in entry.items() if field in SUMMARY_FIELDS and isinstance(value, str)
+            })
+            results[str(entry["id"])] = {
+                "success": True,
+                "summary": summary,
+                "raw_response": json.dumps(entry, ensure_ascii=False),
+                "metadata": {
+                    "model": self.model,
+                    "input_tokens": round((getattr(usage, 'input_tokens', 0) or 0) * share),
+                    "output_tokens": round((getattr(usage, 'output_tokens', 0) or 0) * share),
+                    "cache_read_input_tokens": round((getattr(usage, 'cache_read_input_tokens', 0) or 0) * share),
+                    "cache_creation_input_tokens": round((getattr(usage, 'cache_creation_input_tokens', 0) or 0) * share),
+                    "processing_time": elapsed_time,
+                    "input_length": len(item["text"]),
+                    "output_length": len(summary["전체요약"]),
+                    "packed_with": len(items)
+                }
+            }
+        return results
+    
+    def _send_pack(self, items: List[Dict]) -> Dict[str, Dict]:
+        """묶음 요청 1건 전송 (실패하면 빈 dict → 호출 측에서 개별 요청으로 전환)"""
+        request = self._build_pack_request(items)
+        reserved_input = self._estimate_request_tokens(request)
+        if self.rate_limiter:
+            self.rate_limiter.acquire(reserved_input, request["max_tokens"])
+        response = None
+        try:
+            start_time = time.time()
+            response = self.client.messages.create(**request)
+            elapsed_time = time.time() - start_time
+        except anthropic.RateLimitError as e:
+            print(f"⚠️ 묶음 요약 요청 한도 초과, 개별 요청으로 전환: {str(e)}")
+            if self.rate_limiter:
+                self.rate_limiter.pause(self._retry_after_seconds(e) or 60)
+            return {}
+        except anthropic.APIError as e:
+            print(f"⚠️ 묶음 요약 실패, 개별 요청으로 전환: {str(e)}")
+            return {}
+        finally:
+            self._settle_response(reserved_input, request["max_tokens"], response)
+        
+        self._record_usage(request, response, sum(len(item["text"]) for item in items))
+        
+        results = self._split_pack_response(response, items, elapsed_time)
+        print(f"📦 묶음 요약 완료: {len(results)}/{len(items)}건 ({elapsed_time:.1f}초, "
+              f"입력 {getattr(response.usage, 'input_tokens', 0):,} / 출력 {getattr(response.usage, 'output_tokens', 0):,} 토큰)")
+        return results
+    
+    def summarize_packed(self, items: List[Dict]) -> Dict[str, Dict]:
+        """
+        짧은 공고 여러 건을 묶어서 요약 (응답에 없거나 빈 항목이 있는 공고, 긴 공고는 개별 요청)
+        
+        Args:
+            items: [{"uid": roRndUid, "title": 공고명, "text": 사업개요 원문}, ...]
+        
+        Returns:
+            {roRndUid: 요약 결과}
+        """
+        results = {}
+        packable, singles = [], []
+        seen = set()
+        
+        for item in items:
+            uid = str(item.get("uid", ""))
+            text = item.get("text", "")
+            if not uid or uid in seen:
+                continue
+            seen.add(uid)
+            if self.cache and self.client and not self._validate_input(text):
+                start_time = time.perf_counter()
+                cached = self.cache.get(self._cache_key(text))
+                if cached is not None:
+                    results[uid] = self._from_cache(cached, time.perf_counter() - start_time)
+                    continue
+            if self.client and self.is_packable(text):
+                packable.append(item)
+            else:
+                singles.append(item)
+        
+        for pack in self._plan_packs(packable):
+            if len(pack) == 1:
+                singles.extend(pack)
+                continue
+            
+            print(f"📦 묶음 요약 요청: {len(pack)}건")
+            packed = self._send_pack(pack)
+            for item in pack:
+                uid = str(item["uid"])
+                result = packed.get(uid)
+                if not result or self._missing_fields(result["summary"]):
+                    singles.append(item)
+                    continue
+                results[uid] = result
+                if self.cache:
+                    self.cache.put(self._cache_key(item["text"]), result)
+        
+        if singles:
+            print(f"   개별 요약 요청: {len(singles)}건")
+        for item in singles:
+            results[str(item["uid"])] = self.summarize_business_overview(item.get("text", ""), item.get("title", ""))
+        return results
+    
     def create_fallback_summary(self, business_overview: str, max_length: int = 500) -> str:
         """API 실패 시 대체 요약 생성 (단순 텍스트 자르기)"""
         try:
@@ -272,6 +906,205 @@ class ClaudeSummarizer:
             print(f"대체 요약 생성 실패: {str(e)}")
             return business_overview[:200] + "..." if business_overview else "요약 생성 실패"
 
+class AsyncClaudeSummarizer(ClaudeSummarizer):
+    """AsyncAnthropic 기반 비동기 요약기 (토큰 버킷 속도 제한 + 재시도 + 동시 실행 제한)"""
+    
+    # 재시도할 서버 상태 코드 (429는 RateLimitError로 따로 처리)
+    RETRYABLE_STATUS = (500, 502, 503, 504, 529)
+    
+    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None,
+                 max_concurrency: int = 4, rate_limiter: Optional[RateLimiter] = None,
+                 max_retries: int = 5, cache: Optional[SummaryCache] = None,
+                 token_estimator: Optional[TokenEstimator] = None):
+        """
+        초기화
+        
+        Args:
+            api_key: Claude API 키 (없으면 환경변수에서 가져오기)
+            base_url: API 주소 (로컬 테스트 서버 연결용, 없으면 ANTHROPIC_BASE_URL 또는 기본 주소)
+            max_concurrency: 동시에 진행할 최대 요청 수
+            rate_limiter: 공유 속도 제한기 (없으면 환경변수 기준으로 생성)
+            max_retries: 429/529 등 일시적 오류 재시도 횟수
+            cache: 요약 결과 캐시 (없으면 매번 API 호출)
+            token_estimator: 토큰 추정기 (없으면 저장하지 않는 기본 추정기)
+        """
+        super().__init__(api_key=api_key, rate_limiter=rate_limiter or RateLimiter.from_env(), cache=cache,
+                         token_estimator=token_estimator, base_url=base_url)
+        
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        # 인스턴스 전체가 공유하는 동시 실행 제한 (이벤트 루프가 바뀌면 새로 생성)
+        self._semaphore = None
+        self._semaphore_loop = None
+        
+        if self.api_key:
+            # 재시도는 속도 제한기와 함께 직접 처리하므로 SDK 자체 재시도는 끔
+            self.async_client = anthropic.AsyncAnthropic(
+                api_key=self.api_key, base_url=self.base_url, max_retries=0
+            )
+        else:
+            self.async_client = None
+    
+    def _concurrency_semaphore(self) -> asyncio.Semaphore:
+        """현재 이벤트 루프에서 쓸 인스턴스 공용 세마포어"""
+        loop = asyncio.get_running_loop()
+        if self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+    
+    async def summarize_business_overview_async(self, business_overview: str, announcement_title: str = "",
+                                                semaphore: Optional[asyncio.Semaphore] = None) -> Dict:
+        """사업개요 비동기 요약 (캐시가 있으면 먼저 조회)"""
+        if not self.cache or not self.async_client or self._validate_input(business_overview):
+            return await self._request_summary_async(business_overview, announcement_title, semaphore)
+        
+        start_time = time.perf_counter()
+        result, hit = await self.cache.get_or_compute_async(
+            self._cache_key(business_overview),
+            lambda: self._request_summary_async(business_overview, announcement_title, semaphore),
+            cacheable=self._is_cacheable
+        )
+        if hit:
+            return self._from_cache(result, time.perf_counter() - start_time)
+        return result
+    
+    async def _request_summary_async(self, business_overview: str, announcement_title: str = "",
+                                     semaphore: Optional[asyncio.Semaphore] = None) -> Dict:
+        """비동기 요약 요청 (한도 초과 시 retry-after + 지수 백오프로 재시도)"""
+        if not self.async_client:
+            return {
+                "success": False,
+                "error": "Claude API 클라이언트가 초기화되지 않음",
+                "summary": None
+            }
+        
+        invalid = self._validate_input(business_overview)
+        if invalid:
+            return invalid
+        
+        request = self._build_request(business_overview, announcement_title)
+        reserved_input = self._estimate_request_tokens(request)
+        semaphore = semaphore or self._concurrency_semaphore()
+        last_error = ""
+        retry_after = None
+        
+        for attempt in range(self.max_retries + 1):
+            await self.rate_limiter.acquire_async(reserved_input, request["max_tokens"])
+            response = None
+            
+            try:
+                async with semaphore:
+                    start_time = time.time()
+                    try:
+                        response = await self.async_client.messages.create(**request)
+                    finally:
+                        # 어떤 경로로 끝나든 예약량 정리 (실패한 요청은 토큰을 쓰지 않았으므로 전부 반환)
+                        self._settle_response(reserved_input, request["max_tokens"], response)
+                    elapsed_time = time.time() - start_time
+                
+                result = self._build_result(response, elapsed_time, len(business_overview))
+                result.setdefault("metadata", {})["attempts"] = attempt + 1
+                self._record_usage(request, response, len(business_overview))
+                
+                missing = self._missing_fields(result.get("summary"))
+                if missing:
+                    result = await self._repair_missing_fields_async(request, response, result, missing, semaphore)
+                return result
+            
+            except anthropic.RateLimitError as e:
+                retry_after = self._retry_after_seconds(e)
+                last_error = f"API 요청 한도 초과: {str(e)}"
+                # 같은 한도를 공유하는 다른 요청도 retry-after 동안 대기
+                self.rate_limiter.pause(retry_after or backoff_delay(attempt))
+            
+            except anthropic.APIStatusError as e:
+                if e.status_code not in self.RETRYABLE_STATUS:
+                    print(f"❌ Claude API 오류: {str(e)}")
+                    return {
+                        "success": False,
+                        "error": f"Claude API 오류: {str(e)}",
+                        "summary": None
+                    }
+                retry_after = self._retry_after_seconds(e)
+                last_error = f"Claude API 일시적 오류({e.status_code}): {str(e)}"
+                if e.status_code == 529:
+                    # 서버 과부하는 모든 요청에 해당하므로 함께 대기
+                    self.rate_limiter.pause(retry_after or backoff_delay(attempt))
+            
+            except anthropic.APIConnectionError as e:
+                retry_after = None
+                last_error = f"Claude API 연결 오류: {str(e)}"
+            
+            if attempt < self.max_retries:
+                delay = backoff_delay(attempt, retry_after)
+                print(f"⚠️ {last_error[:80]} → {delay:.1f}초 후 재시도 ({attempt + 1}/{self.max_retries})")
+                # 이 요청만 백오프 (다른 요청은 429/529일 때만 함께 멈춤)
+                await asyncio.sleep(delay)
+        
+        return {
+            "success": False,
+            "error": last_error,
+            "summary": None,
+            "retry_after": retry_after or 60
+        }
+    
+    async def _repair_missing_fields_async(self, request: Dict, response, result: Dict, missing: List[str],
+                                           semaphore: asyncio.Semaphore) -> Dict:
+        """_repair_missing_fields의 비동기 버전 (재시도 없이 한 번만 시도)"""
+        print(f"🔧 빈 항목 보완 요청: {', '.join(missing)}")
+        repair_request = self._build_repair_request(request, response, missing)
+        reserved_input = self._estimate_request_tokens(repair_request)
+        await self.rate_limiter.acquire_async(reserved_input, repair_request["max_tokens"])
+        repair_response = None
+        try:
+            async with semaphore:
+                start_time = time.time()
+                repair_response = await self.async_client.messages.create(**repair_request)
+                elapsed_time = time.time() - start_time
+        except anthropic.APIError as e:
+            print(f"⚠️ 빈 항목 보완 실패: {str(e)}")
+            return result
+        finally:
+            self._settle_response(reserved_input, repair_request["max_tokens"], repair_response)
+        
+        return self._merge_repair(result, repair_response, missing, elapsed_time)
+    
+    async def summarize_many(self, items: List[Dict]) -> List[Dict]:
+        """
+        여러 공고를 동시에 요약 (입력 순서대로 결과 반환)
+        한 공고에서 예상하지 못한 예외가 나도 나머지 결과는 유지하고 그 공고만 실패 결과로 반환
+        
+        Args:
+            items: [{"business_overview": ..., "announcement_title": ...}, ...]
+        """
+        semaphore = self._concurrency_semaphore()
+        tasks = [
+            self.summarize_business_overview_async(
+                item.get("business_overview", ""),
+                item.get("announcement_title", ""),
+                semaphore=semaphore
+            )
+            for item in items
+        ]
+        results = []
+        for item, result in zip(items, await asyncio.gather(*tasks, return_exceptions=True)):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result  # 취소/인터럽트는 그대로 전달
+                print(f"❌ 요약 처리 중 오류: {item.get('announcement_title', '')[:40]} - {str(result)}")
+                result = {
+                    "success": False,
+                    "error": f"요약 처리 오류: {str(result)}",
+                    "summary": None
+                }
+            results.append(result)
+        return results
+    
+    def summarize_many_sync(self, items: List[Dict]) -> List[Dict]:
+        """summarize_many의 동기 실행 래퍼"""
+        return asyncio.run(self.summarize_many(items))
+
 def main():
     """테스트용 메인 함수"""
     print("Claude 요약기 테스트")
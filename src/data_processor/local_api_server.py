@@ -0,0 +1,497 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+로컬 Claude API 테스트 서버
+API 키/네트워크 없이 요약기의 동시 실행, 한도 초과 처리, 처리량을 시험하기 위한 Messages/Batches API 대역
+- POST /v1/messages, /v1/messages/count_tokens, /v1/messages/batches
+- GET /v1/messages/batches/{id}, /v1/messages/batches/{id}/results, /stats (서버 통계)
+- 응답 지연: 로그정규분포(중앙값/95백분위) + 출력 토큰 생성 시간
+- 429(요청 한도)/529(과부하) 확률 주입, RPM/입력 TPM 한도 초과 시 retry-after와 함께 429
+- 입력/출력/캐시 토큰 계산, 도구(record_summary 등) 요청에는 로컬 추출 요약으로 만든 tool_use 응답
+
+사용 예:
+    ANTHROPIC_BASE_URL=http://127.0.0.1:8765 ANTHROPIC_API_KEY=local python hwp_to_json.py
+"""
+
+import hashlib
+import json
+import math
+import os
+import random
+import re
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+
+from .claude_summarizer import PACK_TOOL_NAME, SUMMARY_FIELDS
+from .local_summarizer import NOT_SPECIFIED, LocalSummarizer
+from ..utils.rate_limiter import TokenBucket
+from ..utils.token_estimator import TokenEstimator
+
+# 프롬프트에서 공고 원문을 찾는 표시 (ClaudeSummarizer 프롬프트 형식)
+_OVERVIEW_MARK = "사업개요 원문:"
+_PACK_SECTION = re.compile(r'\[공고 ID: ([^\]]+)\]\n공고제목: ([^\n]*)\n사업개요 원문:\n(.*?)(?=\n\n\[공고 ID: |\n\n각 공고를|\Z)', re.S)
+
+
+class LocalClaudeServer:
+    """Messages/Batches API를 흉내 내는 로컬 HTTP 서버"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency_median: float = 1.5,
+                 latency_p95: float = 4.0, output_tokens_per_second: float = 0.0,
+                 rate_limit_rate: float = 0.0, overloaded_rate: float = 0.0,
+                 requests_per_minute: float = 0, input_tokens_per_minute: float = 0,
+                 missing_field_rate: float = 0.0, batch_seconds: float = 5.0,
+                 min_cache_tokens: int = 2048, cache_ttl: float = 300, seed: Optional[int] = None):
+        """
+        초기화
+
+        Args:
+            host: 바인드 주소
+            port: 포트 (0이면 빈 포트 자동 선택)
+            latency_median: 응답 지연 중앙값 (초)
+            latency_p95: 응답 지연 95백분위 (초, 중앙값 이하이면 고정 지연)
+            output_tokens_per_second: 출력 토큰 생성 속도 (0이면 출력 길이와 무관)
+            rate_limit_rate: 무작위 429 응답 비율
+            overloaded_rate: 무작위 529 응답 비율 (배치에서는 errored 결과 비율)
+            requests_per_minute: 분당 요청 한도 (0이면 제한 없음, 넘으면 429)
+            input_tokens_per_minute: 분당 입력 토큰 한도 (0이면 제한 없음, 넘으면 429)
+            missing_field_rate: 요약 항목을 비워서 보내는 비율 (빈 항목 보완 요청 시험용)
+            batch_seconds: 배치 제출 후 완료까지 걸리는 시간 (초)
+            min_cache_tokens: 프롬프트 캐시가 적용되는 최소 접두부 토큰 수
+            cache_ttl: 프롬프트 캐시 유지 시간 (초)
+            seed: 난수 시드 (재현용)
+        """
+        self.host = host
+        self.port = port
+        self.latency_median = latency_median
+        self.latency_p95 = latency_p95
+        self.output_tokens_per_second = output_tokens_per_second
+        self.rate_limit_rate = rate_limit_rate
+        self.overloaded_rate = overloaded_rate
+        self.missing_field_rate = missing_field_rate
+        self.batch_seconds = batch_seconds
+        self.min_cache_tokens = min_cache_tokens
+        self.cache_ttl = cache_ttl
+
+        self.requests_bucket = TokenBucket(requests_per_minute)
+        self.input_bucket = TokenBucket(input_tokens_per_minute)
+        self.estimator = TokenEstimator(stats_file=None)
+        self.extractor = LocalSummarizer()
+        self.random = random.Random(seed)
+
+        self.prompt_cache = {}  # 접두부 해시 -> 만료 시각
+        self.batches = {}       # batch_id -> {"created", "requests", "results"}
+        self.stats = {
+            "요청": 0, "성공": 0, "429": 0, "529": 0, "입력토큰": 0, "출력토큰": 0,
+            "캐시읽기토큰": 0, "캐시쓰기토큰": 0, "최대동시요청": 0, "지연합계": 0.0
+        }
+        self.in_flight = 0
+        self._lock = threading.Lock()
+        self._httpd = None
+        self._thread = None
+
+    @classmethod
+    def from_env(cls) -> "LocalClaudeServer":
+        """
+        환경변수로 생성
+        LOCAL_API_PORT, LOCAL_API_LATENCY_MEDIAN, LOCAL_API_LATENCY_P95, LOCAL_API_OTPS,
+        LOCAL_API_429_RATE, LOCAL_API_529_RATE, LOCAL_API_RPM, LOCAL_API_ITPM, LOCAL_API_MISSING_RATE
+        """
+        return cls(
+            port=int(os.getenv("LOCAL_API_PORT", "8765")),
+            latency_median=float(os.getenv("LOCAL_API_LATENCY_MEDIAN", "1.5")),
+            latency_p95=float(os.getenv("LOCAL_API_LATENCY_P95", "4.0")),
+            output_tokens_per_second=float(os.getenv("LOCAL_API_OTPS", "0")),
+            rate_limit_rate=float(os.getenv("LOCAL_API_429_RATE", "0")),
+            overloaded_rate=float(os.getenv("LOCAL_API_529_RATE", "0")),
+            requests_per_minute=float(os.getenv("LOCAL_API_RPM", "0")),
+            input_tokens_per_minute=float(os.getenv("LOCAL_API_ITPM", "0")),
+            missing_field_rate=float(os.getenv("LOCAL_API_MISSING_RATE", "0"))
+        )
+
+    # ====== 서버 실행 ======
+
+    @property
+    def base_url(self) -> str:
+        """ClaudeSummarizer(base_url=...)에 넘길 주소"""
+        return f"http://{self.host}:{self.port}"
+
+    def start(self) -> str:
+        """백그라운드 스레드에서 서버 시작 후 base_url 반환"""
+        handler = type("LocalClaudeHandler", (_Handler,), {"owner": self})
+        self._httpd = ThreadingHTTPServer((self.host, self.port), handler)
+        self._httpd.daemon_threads = True
+        self.port = self._httpd.server_address[1]
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self.base_url
+
+    def stop(self):
+        """서버 종료"""
+        if self._httpd:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    # ====== 토큰 계산 ======
+
+    def _content_text(self, content) -> str:
+        """메시지 content(문자열 또는 블록 목록)의 텍스트"""
+        if isinstance(content, str):
+            return content
+        parts = []
+        for block in content or []:
+            if block.get("type") == "text":
+                parts.append(block.get("text", ""))
+            elif block.get("type") == "tool_use":
+                parts.append(json.dumps(block.get("input", {}), ensure_ascii=False))
+            elif block.get("type") == "tool_result":
+                parts.append(self._content_text(block.get("content", "")))
+        return "\n".join(parts)
+
+    def _count_input(self, params: Dict) -> Tuple[int, int, str]:
+        """
+        입력 토큰 수 계산
+
+        Returns:
+            (전체 입력 토큰, 캐시 대상 접두부 토큰, 접두부 해시)
+        """
+        system = params.get("system") or []
+        if isinstance(system, str):
+            system = [{"type": "text", "text": system}]
+        tools_text = json.dumps(params.get("tools") or [], ensure_ascii=False)
+
+        # tools → system 순서의 접두부 중 cache_control이 붙은 마지막 블록까지가 캐시 대상
+        prefix_text = tools_text
+        cached_text = ""
+        for block in system:
+            prefix_text += block.get("text", "")
+            if block.get("cache_control"):
+                cached_text = prefix_text
+        messages_text = "\n".join(self._content_text(message.get("content")) for message in params.get("messages", []))
+
+        total = self.estimator.estimate(tools_text + "".join(block.get("text", "") for block in system) + messages_text)
+        prefix_tokens = self.estimator.estimate(cached_text) if cached_text else 0
+        prefix_hash = hashlib.sha256(f"{params.get('model')}|{cached_text}".encode("utf-8")).hexdigest() if cached_text else ""
+        return total, prefix_tokens, prefix_hash
+
+    def _usage(self, params: Dict) -> Dict:
+        """입력 usage (캐시 적중/기록 반영)"""
+        total, prefix_tokens, prefix_hash = self._count_input(params)
+        usage = {"input_tokens": total, "cache_creation_input_tokens": 0, "cache_read_input_tokens": 0}
+        if not prefix_hash or prefix_tokens < self.min_cache_tokens:
+            return usage
+
+        now = time.monotonic()
+        with self._lock:
+            hit = self.prompt_cache.get(prefix_hash, 0) > now
+            self.prompt_cache[prefix_hash] = now + self.cache_ttl
+        usage["input_tokens"] = total - prefix_tokens
+        usage["cache_read_input_tokens" if hit else "cache_creation_input_tokens"] = prefix_tokens
+        return usage
+
+    # ====== 응답 생성 ======
+
+    def _overview_text(self, params: Dict) -> Tuple[str, str]:
+        """마지막 사용자 메시지에서 (공고제목, 원문) 추출"""
+        users = [message for message in params.get("messages", []) if message.get("role") == "user"]
+        prompt = self._content_text(users[0].get("content")) if users else ""
+        title_match = re.search(r'공고제목: (.*)', prompt)
+        title = title_match.group(1).strip() if title_match else ""
+        if _OVERVIEW_MARK in prompt:
+            prompt = prompt.split(_OVERVIEW_MARK, 1)[1]
+        return title, prompt
+
+    def _summary_fields(self, text: str, title: str, fields: List[str]) -> Dict:
+        """로컬 추출 요약으로 요청된 항목 채우기 (missing_field_rate 비율로 한 항목 비움)"""
+        result = self.extractor.summarize_business_overview(text, title)
+        summary = result.get("summary") or {}
+        values = {field: summary.get(field) or NOT_SPECIFIED for field in fields}
+        if len(fields) > 1 and self.random.random() < self.missing_field_rate:
+            values[self.random.choice(fields)] = ""
+        return values
+
+    def _tool_input(self, params: Dict, tool: Dict) -> Dict:
+        """강제 도구 호출에 맞는 입력 생성"""
+        title, text = self._overview_text(params)
+        if tool["name"] == PACK_TOOL_NAME:
+            summaries = []
+            for uid, item_title, item_text in _PACK_SECTION.findall(self._content_text(params["messages"][0]["content"])):
+                summaries.append({"id": uid, **self._summary_fields(item_text, item_title, list(SUMMARY_FIELDS))})
+            return {"summaries": summaries}
+
+        fields = [field for field in tool.get("input_schema", {}).get("properties", {}) if field in SUMMARY_FIELDS]
+        return self._summary_fields(text, title, fields or list(SUMMARY_FIELDS))
+
+    def _truncate_input(self, tool_input: Dict, max_tokens: int) -> Dict:
+        """max_tokens를 넘는 도구 입력은 앞 항목부터 예산 안에서만 남김"""
+        kept, used = {}, 0
+        for key, value in tool_input.items():
+            cost = self.estimator.estimate(json.dumps({key: value}, ensure_ascii=False))
+            if used + cost > max_tokens:
+                break
+            kept[key] = value
+            used += cost
+        return kept
+
+    def build_message(self, params: Dict) -> Dict:
+        """요청 params에 대한 Messages API 응답 본문"""
+        usage = self._usage(params)
+        max_tokens = int(params.get("max_tokens", 1024))
+        tool_choice = params.get("tool_choice") or {}
+        tools = {tool["name"]: tool for tool in params.get("tools") or []}
+
+        if tool_choice.get("type") == "tool" and tool_choice.get("name") in tools:
+            tool_input = self._tool_input(params, tools[tool_choice["name"]])
+            output_tokens = self.estimator.estimate(json.dumps(tool_input, ensure_ascii=False)) + 20
+            stop_reason = "tool_use"
+            if output_tokens > max_tokens:
+                tool_input = self._truncate_input(tool_input, max_tokens - 20)
+                output_tokens, stop_reason = max_tokens, "max_tokens"
+            content = [{"type": "tool_use", "id": f"toolu_{uuid.uuid4().hex[:24]}",
+                        "name": tool_choice["name"], "input": tool_input}]
+        else:
+            title, text = self._overview_text(params)
+            fields = self._summary_fields(text, title, list(SUMMARY_FIELDS))
+            body = "\n".join(f"{field}: {value}" for field, value in fields.items())
+            output_tokens = self.estimator.estimate(body)
+            stop_reason = "end_turn"
+            if output_tokens > max_tokens:
+                body = body[:int(len(body) * max_tokens / output_tokens)]
+                output_tokens, stop_reason = max_tokens, "max_tokens"
+            content = [{"type": "text", "text": body}]
+
+        usage["output_tokens"] = output_tokens
+        return {
+            "id": f"msg_{uuid.uuid4().hex[:24]}",
+            "type": "message",
+            "role": "assistant",
+            "model": params.get("model", ""),
+            "content": content,
+            "stop_reason": stop_reason,
+            "stop_sequence": None,
+            "usage": usage
+        }
+
+    def _sample_latency(self, output_tokens: int = 0) -> float:
+        """응답 지연 시간 (로그정규분포 + 출력 토큰 생성 시간)"""
+        latency = self.latency_median
+        if self.latency_p95 > self.latency_median > 0:
+            sigma = math.log(self.latency_p95 / self.latency_median) / 1.645
+            latency = self.random.lognormvariate(math.log(self.latency_median), sigma)
+        if self.output_tokens_per_second > 0:
+            latency += output_tokens / self.output_tokens_per_second
+        return latency
+
+    def _admit(self, params: Dict) -> Optional[Tuple[int, str, str, float]]:
+        """
+        한도/장애 주입 판정
+
+        Returns:
+            거절할 경우 (상태 코드, 오류 유형, 메시지, retry-after 초), 통과하면 None
+        """
+        input_tokens = self._count_input(params)[0]
+        now = time.monotonic()
+        with self._lock:
+            wait = self.requests_bucket.reserve(1, now)
+            if wait > 0:
+                self.requests_bucket.refund(1, now)
+                return 429, "rate_limit_error", "Number of request tokens has exceeded your per-minute rate limit (RPM)", wait
+            wait = self.input_bucket.reserve(input_tokens, now)
+            if wait > 0:
+                self.input_bucket.refund(min(input_tokens, self.input_bucket.capacity), now)
+                self.requests_bucket.refund(1, now)
+                return 429, "rate_limit_error", "Number of input tokens has exceeded your per-minute rate limit", wait
+
+        roll = self.random.random()
+        if roll < self.rate_limit_rate:
+            return 429, "rate_limit_error", "Injected rate limit error", self.random.uniform(1, 5)
+        if roll < self.rate_limit_rate + self.overloaded_rate:
+            return 529, "overloaded_error", "Overloaded", 0
+        return None
+
+    def handle_message(self, params: Dict) -> Tuple[int, Dict, Dict]:
+        """POST /v1/messages 처리 → (상태 코드, 본문, 추가 헤더)"""
+        with self._lock:
+            self.stats["요청"] += 1
+            self.in_flight += 1
+            self.stats["최대동시요청"] = max(self.stats["최대동시요청"], self.in_flight)
+        try:
+            rejected = self._admit(params)
+            if rejected:
+                status, error_type, message, retry_after = rejected
+                time.sleep(min(0.2, self.latency_median))
+                with self._lock:
+                    self.stats[str(status)] += 1
+                headers = {"retry-after": str(max(1, math.ceil(retry_after)))} if retry_after else {}
+                return status, {"type": "error", "error": {"type": error_type, "message": message}}, headers
+
+            message = self.build_message(params)
+            latency = self._sample_latency(message["usage"]["output_tokens"])
+            time.sleep(latency)
+            with self._lock:
+                usage = message["usage"]
+                self.stats["성공"] += 1
+                self.stats["입력토큰"] += usage["input_tokens"]
+                self.stats["출력토큰"] += usage["output_tokens"]
+                self.stats["캐시읽기토큰"] += usage["cache_read_input_tokens"]
+                self.stats["캐시쓰기토큰"] += usage["cache_creation_input_tokens"]
+                self.stats["지연합계"] += latency
+            return 200, message, {}
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    # ====== 배치 ======
+
+    def _batch_body(self, batch_id: str) -> Dict:
+        """배치 상태 본문 (완료 시간이 지나면 결과 생성)"""
+        with self._lock:
+            batch = self.batches[batch_id]
+        ended = time.time() - batch["created"] >= self.batch_seconds
+        if ended and batch["results"] is None:
+            results = []
+            for request in batch["requests"]:
+                if self.random.random() < self.overloaded_rate:
+                    result = {"type": "errored", "error": {"type": "error",
+                                                           "error": {"type": "overloaded_error", "message": "Overloaded"}}}
+                else:
+                    result = {"type": "succeeded", "message": self.build_message(request["params"])}
+                results.append({"custom_id": request["custom_id"], "result": result})
+            batch["results"] = results
+
+        total = len(batch["requests"])
+        errored = sum(1 for entry in batch["results"] or [] if entry["result"]["type"] == "errored")
+        created = datetime.fromtimestamp(batch["created"], tz=timezone.utc)
+        return {
+            "id": batch_id,
+            "type": "message_batch",
+            "processing_status": "ended" if ended else "in_progress",
+            "request_counts": {
+                "processing": 0 if ended else total,
+                "succeeded": total - errored if ended else 0,
+                "errored": errored,
+                "canceled": 0,
+                "expired": 0
+            },
+            "created_at": created.isoformat(),
+            "expires_at": (created + timedelta(hours=24)).isoformat(),
+            "ended_at": (created + timedelta(seconds=self.batch_seconds)).isoformat() if ended else None,
+            "cancel_initiated_at": None,
+            "archived_at": None,
+            "results_url": f"{self.base_url}/v1/messages/batches/{batch_id}/results" if ended else None
+        }
+
+    def create_batch(self, body: Dict) -> Dict:
+        """POST /v1/messages/batches 처리"""
+        batch_id = f"msgbatch_{uuid.uuid4().hex[:24]}"
+        with self._lock:
+            self.batches[batch_id] = {"created": time.time(), "requests": body.get("requests", []), "results": None}
+        return self._batch_body(batch_id)
+
+    def get_stats(self) -> Dict:
+        """서버 통계"""
+        with self._lock:
+            stats = dict(self.stats)
+        total_latency = stats.pop("지연합계")
+        stats["평균지연"] = round(total_latency / stats["성공"], 2) if stats["성공"] else 0.0
+        return stats
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """요청 경로별 분기 (owner는 start()에서 LocalClaudeServer로 지정)"""
+
+    owner: LocalClaudeServer = None
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass  # 요청마다 로그를 찍지 않음
+
+    def _send_json(self, status: int, body: Dict, headers: Optional[Dict] = None):
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("request-id", f"req_{uuid.uuid4().hex[:24]}")
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _not_found(self):
+        self._send_json(404, {"type": "error", "error": {"type": "not_found_error", "message": self.path}})
+
+    def _read_body(self) -> Dict:
+        length = int(self.headers.get("Content-Length", 0))
+        return json.loads(self.rfile.read(length) or b"{}")
+
+    def do_POST(self):
+        path = self.path.split("?")[0]
+        body = self._read_body()
+        if path == "/v1/messages":
+            self._send_json(*self.owner.handle_message(body))
+        elif path == "/v1/messages/count_tokens":
+            self._send_json(200, {"input_tokens": self.owner._count_input(body)[0]})
+        elif path == "/v1/messages/batches":
+            self._send_json(200, self.owner.create_batch(body))
+        else:
+            self._not_found()
+
+    def do_GET(self):
+        path = self.path.split("?")[0]
+        match = re.fullmatch(r'/v1/messages/batches/([\w-]+)(/results)?', path)
+        if path == "/stats":
+            self._send_json(200, self.owner.get_stats())
+        elif match and match.group(1) in self.owner.batches:
+            batch = self.owner._batch_body(match.group(1))
+            if not match.group(2):
+                self._send_json(200, batch)
+                return
+            if batch["processing_status"] != "ended":
+                self._not_found()
+                return
+            lines = "\n".join(json.dumps(entry, ensure_ascii=False)
+                              for entry in self.owner.batches[match.group(1)]["results"])
+            data = (lines + "\n").encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/binary")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+        else:
+            self._not_found()
+
+
+def main():
+    """로컬 테스트 서버 실행 (Ctrl+C로 종료)"""
+    server = LocalClaudeServer.from_env()
+    base_url = server.start()
+    print("🧪 로컬 Claude API 테스트 서버")
+    print("=" * 50)
+    print(f"주소: {base_url}")
+    print(f"지연: 중앙값 {server.latency_median}초 / p95 {server.latency_p95}초, "
+          f"429 {server.rate_limit_rate:.0%}, 529 {server.overloaded_rate:.0%}")
+    print(f"연결: ANTHROPIC_BASE_URL={base_url} ANTHROPIC_API_KEY=local")
+    try:
+        while True:
+            time.sleep(60)
+            print(f"📊 {server.get_stats()}")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+        print(f"종료: {server.get_stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+로컬 추출 요약기
+API 없이 사업개요 원문에서 문장을 골라 ClaudeSummarizer와 같은 5개 항목으로 요약
+- 소제목(목적/지원내용/지원규모/신청대상 등)을 찾아 항목별 구간 분리
+- 문장 중요도: TF-IDF(글자 bigram) 코사인 유사도 그래프 위의 TextRank
+- 금액/기간/선정규모/신청자격은 정규식으로 직접 추출
+"""
+
+import re
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from ..utils.summary_history import split_passages
+
+NOT_SPECIFIED = "공고문에 명시되지 않음"
+
+# 항목별 소제목/핵심어
+FIELD_KEYWORDS = {
+    "사업목적": ["사업목적", "목적", "추진배경", "배경", "필요성", "사업개요", "추진목표", "목표"],
+    "지원내용": ["지원내용", "사업내용", "지원분야", "연구내용", "지원과제", "과제내용", "지원항목", "주요내용"],
+    "지원규모": ["지원규모", "지원예산", "사업비", "총사업비", "정부출연금", "지원기간", "연구기간", "사업기간", "선정규모", "예산"],
+    "신청대상": ["신청대상", "지원대상", "신청자격", "참여자격", "주관기관", "자격요건", "대상"],
+    "주요특징": ["주요특징", "특징", "우대", "가점", "중점", "차별"]
+}
+
+# 소제목 줄 (번호/기호 + 핵심어로 시작하는 짧은 줄)
+_HEADING_PREFIX = r'^\s*(?:[0-9]{1,2}\s*[.)]|[가-하]\s*[.)]|\(?[0-9]{1,2}\)|[ⅠⅡⅢⅣⅤⅥ]+\s*\.?|[□■○●◦▪▶◆◇※\-•])?\s*'
+
+AMOUNT_PATTERN = re.compile(
+    r'(?:(?:총|최대|최소|연간?|년|과제당|기관당|개인당|기업당|1인당|과제별)\s*){0,2}'
+    r'\d[\d,]*(?:\.\d+)?\s*(?:조|억|천만|백만|만)\s*(?:\d[\d,]*\s*(?:천만|백만|만)\s*)?원(?:\s*(?:내외|이내|규모))?'
+)
+_PERIOD_PATTERN = re.compile(
+    r'\d{4}\s*[.\-년]\s*\d{1,2}\s*[.\-월]?\s*(?:\d{1,2}\s*일?)?\s*[~～\-]\s*'
+    r'(?:\d{4}\s*[.\-년]\s*)?\d{1,2}\s*[.\-월]?\s*(?:\d{1,2}\s*일?)?'
+    r'|\d+\s*(?:년|개월)\s*(?:간|이내|내외)'
+    r'|\d+\s*(?:년|개월)\s*\(\s*\d+\s*\+\s*\d+\s*\)'
+)
+_COUNT_PATTERN = re.compile(r'\d+\s*(?:개|건|명|개사)\s*(?:내외|이내)?\s*(?:과제|기관|기업|팀|명)?\s*(?:선정|지원|내외)')
+_ELIGIBILITY_PATTERN = re.compile(
+    r'(?:중소|중견|대)?기업|대학|출연연|연구기관|연구소|비영리|법인|컨소시엄|박사|연구자|스타트업|창업'
+)
+
+
+class LocalSummarizer:
+    """TextRank + 정규식 기반 로컬 추출 요약기 (네트워크 사용 없음)"""
+
+    ENGINE = "local"
+    MODEL = "local-textrank"
+
+    def __init__(self, sentences_per_field: int = 2, max_sentence_chars: int = 200, damping: float = 0.85):
+        """
+        초기화
+
+        Args:
+            sentences_per_field: 항목별로 고를 최대 문장 수
+            max_sentence_chars: 요약에 넣을 문장 최대 길이 (넘으면 자름)
+            damping: TextRank 감쇠 계수
+        """
+        self.sentences_per_field = sentences_per_field
+        self.max_sentence_chars = max_sentence_chars
+        self.damping = damping
+
+    def _is_heading(self, line: str) -> Optional[str]:
+        """소제목 줄이면 해당 항목명 반환"""
+        stripped = line.strip()
+        if not stripped or len(stripped) > 30:
+            return None
+        for field, keywords in FIELD_KEYWORDS.items():
+            for keyword in keywords:
+                # "우대사항", "지원대상 및 자격"처럼 뒤에 짧은 말이 붙은 소제목도 허용
+                if re.match(_HEADING_PREFIX + re.escape(keyword) + r'[가-힣]{0,4}(?:\s*및\s*[가-힣]{1,6})?\s*(?:[:：]|$)', stripped):
+                    return field
+        return None
+
+    def split_sections(self, text: str) -> Dict[str, str]:
+        """소제목 기준으로 항목별 구간 분리 (소제목 앞부분은 "서두")"""
+        sections = {"서두": []}
+        current = "서두"
+        for line in (text or "").split('\n'):
+            field = self._is_heading(line)
+            if field:
+                current = field
+                sections.setdefault(current, [])
+                # "지원대상: 중소기업" 처럼 소제목 줄에 내용이 붙은 경우
+                rest = re.split(r'[:：]', line, maxsplit=1)
+                if len(rest) == 2 and rest[1].strip():
+                    sections[current].append(rest[1].strip())
+                continue
+            sections.setdefault(current, []).append(line)
+        return {field: "\n".join(lines).strip() for field, lines in sections.items() if "".join(lines).strip()}
+
+    def _features(self, sentence: str) -> List[str]:
+        """문장 특징어 (한글은 글자 bigram, 영문/숫자는 단어)"""
+        features = []
+        for token in re.findall(r'[가-힣]+|[A-Za-z]+|\d+', sentence):
+            if re.match(r'[가-힣]', token):
+                features.extend(token[i:i + 2] for i in range(max(1, len(token) - 1)))
+            else:
+                features.append(token.lower())
+        return features
+
+    def tfidf_matrix(self, sentences: List[str]) -> np.ndarray:
+        """문장별 L2 정규화 TF-IDF 행렬"""
+        vocab = {}
+        rows = []
+        for sentence in sentences:
+            counts = {}
+            for feature in self._features(sentence):
+                index = vocab.setdefault(feature, len(vocab))
+                counts[index] = counts.get(index, 0) + 1
+            rows.append(counts)
+
+        matrix = np.zeros((len(sentences), max(1, len(vocab))), dtype=np.float64)
+        for row, counts in enumerate(rows):
+            for index, count in counts.items():
+                matrix[row, index] = count
+
+        document_freq = np.count_nonzero(matrix, axis=0)
+        idf = np.log((1 + len(sentences)) / (1 + document_freq)) + 1.0
+        matrix *= idf
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
+
+    def textrank(self, sentences: List[str], iterations: int = 50, tolerance: float = 1e-6) -> np.ndarray:
+        """코사인 유사도 그래프 위 PageRank 점수"""
+        count = len(sentences)
+        if count == 0:
+            return np.zeros(0)
+        if count == 1:
+            return np.ones(1)
+
+        matrix = self.tfidf_matrix(sentences)
+        similarity = matrix @ matrix.T
+        np.fill_diagonal(similarity, 0.0)
+        row_sums = similarity.sum(axis=1, keepdims=True)
+        # 다른 문장과 겹치는 단어가 없는 문장은 모든 문장으로 균등 전이
+        transition = np.where(row_sums > 0, similarity / np.where(row_sums > 0, row_sums, 1.0), 1.0 / count)
+
+        scores = np.full(count, 1.0 / count)
+        for _ in range(iterations):
+            updated = (1 - self.damping) / count + self.damping * transition.T @ scores
+            if np.abs(updated - scores).sum() < tolerance:
+                scores = updated
+                break
+            scores = updated
+        return scores
+
+    def _clip(self, sentence: str) -> str:
+        sentence = re.sub(_HEADING_PREFIX, '', sentence).strip()
+        if len(sentence) > self.max_sentence_chars:
+            return sentence[:self.max_sentence_chars].rstrip() + "..."
+        return sentence
+
+    def _top_sentences(self, candidates: List[int], sentences: List[str], scores: np.ndarray,
+                       used: set, limit: int) -> List[str]:
+        """점수 순으로 고른 뒤 원문 순서로 정렬한 문장"""
+        ranked = sorted((i for i in candidates if i not in used and len(sentences[i]) >= 8),
+                        key=lambda i: -scores[i])[:limit]
+        used.update(ranked)
+        return [self._clip(sentences[i]) for i in sorted(ranked)]
+
+    def _unique(self, values: List[str]) -> List[str]:
+        seen, unique = set(), []
+        for value in values:
+            value = re.sub(r'\s+', ' ', value).strip()
+            if value and value not in seen:
+                seen.add(value)
+                unique.append(value)
+        return unique
+
+    def extract_scale(self, text: str) -> str:
+        """금액/기간/선정규모 정규식 추출"""
+        amounts = self._unique(AMOUNT_PATTERN.findall(text))[:4]
+        periods = self._unique(_PERIOD_PATTERN.findall(text))[:2]
+        counts = self._unique(_COUNT_PATTERN.findall(text))[:2]
+        parts = []
+        if amounts:
+            parts.append("금액: " + ", ".join(amounts))
+        if periods:
+            parts.append("기간: " + ", ".join(periods))
+        if counts:
+            parts.append("선정: " + ", ".join(counts))
+        return " / ".join(parts)
+
+    def summarize_business_overview(self, business_overview: str, announcement_title: str = "") -> Dict:
+        """사업개요 로컬 요약 (ClaudeSummarizer와 같은 반환 형식, metadata.engine = "local")"""
+        start_time = time.perf_counter()
+        if not business_overview or len(business_overview.strip()) < 50:
+            return {
+                "success": False,
+                "error": "요약할 내용이 너무 짧거나 없음",
+                "summary": None
+            }
+
+        sections = self.split_sections(business_overview)
+        sentences = split_passages(business_overview)
+        scores = self.textrank(sentences)
+        index_of = {}
+        for i, sentence in enumerate(sentences):
+            index_of.setdefault(sentence, []).append(i)
+
+        def section_indices(field: str) -> List[int]:
+            return [i for passage in split_passages(sections.get(field, "")) for i in index_of.get(passage, [])]
+
+        def keyword_indices(field: str) -> List[int]:
+            return [i for i, sentence in enumerate(sentences)
+                    if any(keyword in sentence for keyword in FIELD_KEYWORDS[field])]
+
+        used = set()
+        summary = {}
+        for field in ("사업목적", "지원내용", "신청대상"):
+            candidates = section_indices(field) or keyword_indices(field)
+            if field == "신청대상" and not candidates:
+                candidates = [i for i, sentence in enumerate(sentences) if _ELIGIBILITY_PATTERN.search(sentence)
+                              and re.search(r'신청|지원|참여', sentence)]
+            if field == "사업목적" and not candidates:
+                candidates = section_indices("서두")
+            summary[field] = " ".join(self._top_sentences(candidates, sentences, scores, used, self.sentences_per_field))
+
+        scale_text = sections.get("지원규모", "") or business_overview
+        summary["지원규모"] = self.extract_scale(scale_text) or self.extract_scale(business_overview) or \
+            " ".join(self._top_sentences(keyword_indices("지원규모"), sentences, scores, used, 1))
+
+        # 주요특징: 특징 소제목이 있으면 그 구간, 없으면 아직 쓰지 않은 문장 중 점수 상위
+        candidates = section_indices("주요특징") or keyword_indices("주요특징") or list(range(len(sentences)))
+        summary["주요특징"] = " ".join(self._top_sentences(candidates, sentences, scores, used, self.sentences_per_field))
+
+        for field in FIELD_KEYWORDS:
+            summary[field] = summary.get(field) or NOT_SPECIFIED
+        summary = {field: summary[field] for field in FIELD_KEYWORDS}
+        summary["전체요약"] = "\n".join(f"- {field}: {value}" for field, value in summary.items())
+
+        elapsed_time = time.perf_counter() - start_time
+        return {
+            "success": True,
+            "summary": summary,
+            "metadata": {
+                "engine": self.ENGINE,
+                "model": self.MODEL,
+                "input_tokens": 0,
+                "output_tokens": 0,
+                "processing_time": elapsed_time,
+                "input_length": len(business_overview),
+                "output_length": len(summary["전체요약"])
+            }
+        }
+
+
+if __name__ == "__main__":
+    # 테스트 코드
+    print("🧪 로컬 추출 요약기 테스트")
+    print("=" * 50)
+
+    sample = """
+    2025년도 최고급 AI 해외인재 유치지원 사업 공고
+    1. 사업목적
+    AI 기술의 해외 우수 인재를 국내로 유치하여 AI 분야의 기술 경쟁력을 강화하고자 합니다.
+    국내 연구 생태계에 글로벌 연구 역량을 이식하고 공동연구를 활성화합니다.
+    2. 지원내용
+    최고급 AI 해외인재를 대상으로 연구개발비, 정착지원금, 연구환경 조성비 등을 종합적으로 지원합니다.
+    유치기관은 인재별 맞춤형 연구실 구축과 공동연구 네트워크를 제공합니다.
+    3. 지원규모
+    총 100억원, 개인당 최대 5억원 내외, 3년간 지원 (2025.04.01 ~ 2027.12.31), 10명 내외 선정
+    4. 신청대상
+    AI 분야 박사학위 소지자 또는 동등 경력자로, 해외 거주 경험이 있는 연구자와 이를 유치하려는 대학, 출연연
+    5. 우대사항
+    국제 공동연구 실적 보유자 및 글로벌 빅테크 연구 경력자는 가점을 부여합니다.
+    """
+
+    summarizer = LocalSummarizer()
+    result = summarizer.summarize_business_overview(sample, "2025년도 최고급 AI 해외인재 유치지원 사업")
+    for field, value in result["summary"].items():
+        if field != "전체요약":
+            print(f"{field}: {value}")
+
+    started = time.perf_counter()
+    long_text = "\n".join([sample] * 20)
+    for _ in range(20):
+        summarizer.summarize_business_overview(long_text)
+    print(f"\n평균 처리 시간 ({len(long_text):,}자): {(time.perf_counter() - started) / 20 * 1000:.1f}ms")
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+요약 모델 라우터
+문서 길이/구조로 공고별 시작 모델을 고르고, 요약 결과 검증에 실패하면 상위 모델로 올려 다시 요약
+- 검증: 5개 항목 존재, 핵심 항목 기재, 원문에 금액이 있으면 지원규모에 금액 포함
+- 라우팅 결정/비용/지연 시간을 output/routing_log.jsonl에 한 줄씩 기록
+"""
+
+import json
+import os
+import re
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from .claude_summarizer import ClaudeSummarizer, SUMMARY_FIELDS
+from .local_summarizer import AMOUNT_PATTERN, NOT_SPECIFIED, LocalSummarizer
+
+# 모델 단계 (100만 토큰당 USD 가격, 아래로 갈수록 비싸고 강한 모델)
+DEFAULT_TIERS = [
+    {"model": "claude-3-haiku-20240307", "input_price": 0.25, "output_price": 1.25},
+    {"model": "claude-3-5-haiku-20241022", "input_price": 0.80, "output_price": 4.00},
+    {"model": "claude-3-5-sonnet-20241022", "input_price": 3.00, "output_price": 15.00}
+]
+
+
+def usage_cost(metadata: Dict, tier: Dict) -> float:
+    """토큰 사용량으로 비용(USD) 계산 (캐시 읽기 0.1배, 캐시 쓰기 1.25배, 배치 요청은 50% 할인)"""
+    input_cost = (metadata.get("input_tokens", 0)
+                  + metadata.get("cache_read_input_tokens", 0) * 0.1
+                  + metadata.get("cache_creation_input_tokens", 0) * 1.25) * tier["input_price"]
+    cost = (input_cost + metadata.get("output_tokens", 0) * tier["output_price"]) / 1_000_000
+    return cost * 0.5 if metadata.get("batch_id") else cost
+
+
+def estimate_cost_usd(metadata: Optional[Dict], tiers: Optional[List[Dict]] = None) -> float:
+    """요약 결과 metadata의 비용 (라우터가 계산한 cost_usd가 있으면 그대로, 없으면 모델 가격표로 계산)"""
+    metadata = metadata or {}
+    if "cost_usd" in metadata:
+        return metadata["cost_usd"]
+    tiers = tiers or DEFAULT_TIERS
+    tier = next((tier for tier in tiers if tier["model"] == metadata.get("model")), tiers[0])
+    return usage_cost(metadata, tier)
+
+
+def worst_case_usage(summarizer: ClaudeSummarizer, text: str, tiers: Optional[List[Dict]] = None) -> Dict:
+    """
+    요청 전 예산 예약량 ({"tokens", "cost_usd"})
+    tiers의 모델을 차례로 모두 시도하고 모델마다 빈 항목 보완 요청까지 보내는 최악의 경우
+    (tiers가 없으면 요약기 기본 모델 한 단계만)
+    """
+    if not tiers:
+        price_table = DEFAULT_TIERS
+        tiers = [next((tier for tier in price_table if tier["model"] == summarizer.model), price_table[-1])]
+    tokens = 0
+    cost = 0.0
+    for tier in tiers:
+        for input_tokens, output_tokens in summarizer.estimate_call_budget(text, model=tier["model"]):
+            tokens += input_tokens + output_tokens
+            cost += usage_cost({"input_tokens": input_tokens, "output_tokens": output_tokens}, tier)
+    return {"tokens": tokens, "cost_usd": cost}
+
+
+class ModelRouter:
+    """공고별 모델 선택 + 검증 실패 시 상위 모델로 재요약"""
+
+    def __init__(self, summarizer: ClaudeSummarizer, tiers: Optional[List[Dict]] = None,
+                 log_file: Optional[str] = "output/routing_log.jsonl", long_doc_tokens: int = 2000,
+                 min_sections: int = 2):
+        """
+        초기화
+
+        Args:
+            summarizer: 실제 요청을 보낼 요약기
+            tiers: 모델 단계 목록 [{"model", "input_price", "output_price"}, ...] (싼 모델부터)
+            log_file: 라우팅 로그 파일 (None이면 기록하지 않음)
+            long_doc_tokens: 이 토큰 수를 넘는 긴 문서는 두 번째 단계부터 시작
+            min_sections: 긴 문서 중 소제목 구간이 이보다 적으면(구조가 약하면) 두 번째 단계부터 시작
+        """
+        self.summarizer = summarizer
+        self.tiers = tiers or DEFAULT_TIERS
+        self.log_file = log_file
+        self.long_doc_tokens = long_doc_tokens
+        self.min_sections = min_sections
+        self.section_detector = LocalSummarizer()
+        self.stats = {}  # model -> {"요청", "검증실패", "비용", "지연"}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls, summarizer: ClaudeSummarizer) -> "ModelRouter":
+        """
+        환경변수로 생성
+        - SUMMARY_MODEL_TIERS: "모델:입력가격:출력가격,..." (없으면 기본 단계)
+        - ROUTING_LOG_FILE: 라우팅 로그 파일
+        """
+        tiers = None
+        spec = os.getenv("SUMMARY_MODEL_TIERS", "")
+        if spec:
+            tiers = []
+            for entry in spec.split(","):
+                model, input_price, output_price = entry.strip().split(":")
+                tiers.append({"model": model, "input_price": float(input_price), "output_price": float(output_price)})
+        return cls(summarizer, tiers=tiers, log_file=os.getenv("ROUTING_LOG_FILE", "output/routing_log.jsonl"))
+
+    def choose_tier(self, text: str) -> Dict:
+        """시작 단계 선택 ({"tier", "reason", "tokens", "sections"})"""
+        tokens = self.summarizer._estimate_tokens(self.summarizer._normalize_text(text))
+        sections = len([name for name in self.section_detector.split_sections(text) if name != "서두"])
+
+        if len(self.tiers) > 1 and tokens > self.summarizer.max_input_tokens:
+            reason = "입력 예산 초과 문서"
+            tier = 1
+        elif len(self.tiers) > 1 and tokens > self.long_doc_tokens and sections < self.min_sections:
+            reason = "소제목이 적은 긴 문서"
+            tier = 1
+        else:
+            reason = "기본"
+            tier = 0
+        return {"tier": tier, "reason": reason, "tokens": tokens, "sections": sections}
+
+    def validate(self, result: Dict, text: str) -> List[str]:
+        """요약 결과 검증 (문제 목록, 비어 있으면 통과)"""
+        if not result.get("success"):
+            return [f"요약 실패: {result.get('error', '')[:60]}"]
+
+        summary = result.get("summary") or {}
+        problems = [f"{field} 누락" for field in SUMMARY_FIELDS if not (summary.get(field) or "").strip()]
+        for field in ("사업목적", "지원내용"):
+            if NOT_SPECIFIED in (summary.get(field) or ""):
+                problems.append(f"{field} 미기재")
+        if AMOUNT_PATTERN.search(text) and not re.search(r'\d\s*(?:조|억|천만|백만|만)?\s*원', summary.get("지원규모") or ""):
+            problems.append("지원규모 금액 누락")
+        return problems
+
+    def worst_case_usage(self, text: str) -> Dict:
+        """시작 단계부터 마지막 단계까지 모두 올라가는 경우의 예산 예약량"""
+        return worst_case_usage(self.summarizer, text, self.tiers[self.choose_tier(text)["tier"]:])
+
+    def estimate_cost(self, metadata: Dict, tier: Dict) -> float:
+        """토큰 사용량으로 비용(USD) 계산"""
+        return usage_cost(metadata, tier)
+
+    def _log(self, record: Dict):
+        """라우팅 결정 1건 기록"""
+        if not self.log_file:
+            return
+        with self._lock:
+            os.makedirs(os.path.dirname(self.log_file) or ".", exist_ok=True)
+            with open(self.log_file, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def _update_stats(self, model: str, cost: float, latency: float, failed: bool):
+        with self._lock:
+            stats = self.stats.setdefault(model, {"요청": 0, "검증실패": 0, "비용": 0.0, "지연": 0.0})
+            stats["요청"] += 1
+            stats["검증실패"] += int(failed)
+            stats["비용"] += cost
+            stats["지연"] += latency
+
+    def summarize(self, business_overview: str, announcement_title: str = "", uid: str = "") -> Dict:
+        """시작 단계 모델로 요약하고, 검증에 실패하면 다음 단계 모델로 재요약"""
+        decision = self.choose_tier(business_overview)
+        tier_index = decision["tier"]
+        attempts = []
+        total_input = total_output = 0
+        total_cost = 0.0
+
+        while True:
+            tier = self.tiers[tier_index]
+            started = time.perf_counter()
+            result = self.summarizer.summarize_business_overview(business_overview, announcement_title, model=tier["model"])
+            latency = time.perf_counter() - started
+
+            metadata = result.get("metadata") or {}
+            cost = self.estimate_cost(metadata, tier)
+            problems = self.validate(result, business_overview)
+            total_input += metadata.get("input_tokens", 0)
+            total_output += metadata.get("output_tokens", 0)
+            total_cost += cost
+            attempts.append({"model": tier["model"], "cost_usd": round(cost, 6), "problems": problems})
+            self._update_stats(tier["model"], cost, latency, bool(problems))
+
+            # 한도 초과/API 오류는 모델 문제가 아니므로 올리지 않음 (호출 측 재시도에 맡김)
+            escalate = bool(problems) and result.get("success") and tier_index + 1 < len(self.tiers)
+            self._log({
+                "time": datetime.now().strftime("%Y-%m-%dT%H:%M:%S"),
+                "uid": uid,
+                "title": announcement_title[:60],
+                "model": tier["model"],
+                "tier": tier_index,
+                "reason": decision["reason"] if len(attempts) == 1 else "검증 실패로 상위 모델",
+                "input_tokens_estimate": decision["tokens"],
+                "sections": decision["sections"],
+                "input_tokens": metadata.get("input_tokens", 0),
+                "output_tokens": metadata.get("output_tokens", 0),
+                "cache_hit": bool(metadata.get("cache_hit")),
+                "cost_usd": round(cost, 6),
+                "latency": round(latency, 3),
+                "problems": problems,
+                "escalated": escalate
+            })
+
+            if not escalate:
+                break
+            print(f"   ⤴️ 요약 검증 실패({', '.join(problems)}) → {self.tiers[tier_index + 1]['model']}로 재요약")
+            tier_index += 1
+
+        if result.get("metadata") is not None:
+            # 이전 단계 시도까지 포함한 총 사용량
+            result["metadata"].update({
+                "input_tokens": total_input,
+                "output_tokens": total_output,
+                "cost_usd": round(total_cost, 6),
+                "routing": {"start_reason": decision["reason"], "attempts": attempts}
+            })
+        return result
+
+    def get_stats(self) -> Dict:
+        """모델별 요청 수/검증 실패/비용/평균 지연 시간"""
+        with self._lock:
+            return {
+                model: {
+                    "요청": stats["요청"],
+                    "검증실패": stats["검증실패"],
+                    "비용_USD": round(stats["비용"], 4),
+                    "평균_지연": round(stats["지연"] / stats["요청"], 2) if stats["요청"] else 0.0
+                }
+                for model, stats in self.stats.items()
+            }
+
+
+if __name__ == "__main__":
+    # 테스트 코드 (API 호출 없이 가짜 요약기로 라우팅 흐름 확인)
+    import tempfile
+
+    class FakeSummarizer(ClaudeSummarizer):
+        def summarize_business_overview(self, business_overview, announcement_title="", model=None):
+            # 가장 싼 모델은 지원규모 금액을 빠뜨린다고 가정
+            scale = "미정" if model == DEFAULT_TIERS[0]["model"] else "총 100억원, 3년간"
+            return {
+                "success": True,
+                "summary": {"사업목적": "AI 인재 유치", "지원내용": "연구비 지원", "지원규모": scale,
+                            "신청대상": "박사급 연구자", "주요특징": "정착 지원"},
+                "metadata": {"model": model, "input_tokens": 1500, "output_tokens": 400}
+            }
+
+    print("🧪 모델 라우터 테스트")
+    print("=" * 50)
+
+    router = ModelRouter(FakeSummarizer(api_key=""), log_file=os.path.join(tempfile.mkdtemp(), "routing_log.jsonl"))
+    text = "1. 사업목적\nAI 해외 인재 유치\n2. 지원규모\n총 100억원, 개인당 최대 5억원을 3년간 지원합니다."
+    result = router.summarize(text, "AI 해외인재 유치지원", uid="1246080")
+    print(f"최종 모델: {result['metadata']['model']}, 시도: {[a['model'] for a in result['metadata']['routing']['attempts']]}")
+    print(f"총 비용: ${result['metadata']['cost_usd']:.5f}")
+    print(f"통계: {router.get_stats()}")
+    with open(router.log_file, encoding='utf-8') as f:
+        print(f"로그 {len(f.readlines())}줄 기록")
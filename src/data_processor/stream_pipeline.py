@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+스트리밍 처리 파이프라인
+다운로드 → 파싱 → 요약 단계를 크기가 제한된 큐로 연결하여 단계별로 겹쳐서 실행
+"""
+
+import queue
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Any
+
+# 작업자 종료 신호
+_STOP = object()
+
+
+class StageStats:
+    """단계별 처리량 카운터"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.processed = 0
+        self.failed = 0
+        self.busy_time = 0.0
+        self.max_queue_depth = 0
+        self.first_started = None
+        self.last_finished = None
+        self._lock = threading.Lock()
+
+    def record(self, started: float, finished: float, success: bool):
+        """작업 1건의 처리 결과 기록"""
+        with self._lock:
+            self.processed += 1
+            if not success:
+                self.failed += 1
+            self.busy_time += finished - started
+            if self.first_started is None or started < self.first_started:
+                self.first_started = started
+            if self.last_finished is None or finished > self.last_finished:
+                self.last_finished = finished
+
+    def observe_queue(self, depth: int):
+        """큐 적재량 최대값 갱신"""
+        with self._lock:
+            self.max_queue_depth = max(self.max_queue_depth, depth)
+
+    def summary(self) -> Dict:
+        """처리량 요약 반환"""
+        with self._lock:
+            wall_time = 0.0
+            if self.first_started is not None and self.last_finished is not None:
+                wall_time = self.last_finished - self.first_started
+            return {
+                "단계": self.name,
+                "처리": self.processed,
+                "실패": self.failed,
+                "평균_처리시간": self.busy_time / self.processed if self.processed else 0.0,
+                "분당_처리량": self.processed / wall_time * 60 if wall_time > 0 else 0.0,
+                "최대_대기열": self.max_queue_depth
+            }
+
+
+class PipelineStage:
+    """제한된 입력 큐와 작업자 스레드로 구성된 파이프라인 단계"""
+
+    def __init__(self, name: str, handler: Callable[[Any, Any], Dict], workers: int = 1,
+                 queue_size: int = 8, forward_if: Optional[Callable[[Dict], bool]] = None):
+        """
+        초기화
+
+        Args:
+            name: 단계 이름 (로그 및 결과 구분용)
+            handler: handler(key, payload) -> 결과 dict
+            workers: 작업자 스레드 수
+            queue_size: 입력 큐 최대 크기 (가득 차면 앞 단계가 대기 = 백프레셔)
+            forward_if: 결과를 다음 단계로 넘길지 판단 (기본: result["success"])
+        """
+        self.name = name
+        self.handler = handler
+        self.workers = max(1, workers)
+        self.queue = queue.Queue(maxsize=max(1, queue_size))
+        self.forward_if = forward_if or (lambda result: bool(result and result.get("success")))
+        self.next_stage = None
+        self.results = {}
+        self.stats = StageStats(name)
+        self._threads = []
+        self._results_lock = threading.Lock()
+
+    def start(self):
+        """작업자 스레드 시작"""
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._run, name=f"{self.name}-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def put(self, key, payload):
+        """작업 추가 (큐가 가득 차면 자리가 날 때까지 대기)"""
+        self.queue.put((key, payload))
+        self.stats.observe_queue(self.queue.qsize())
+
+    def stop(self):
+        """남은 작업을 모두 처리한 뒤 작업자 종료"""
+        for _ in self._threads:
+            self.queue.put(_STOP)
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def _run(self):
+        """작업자 루프"""
+        while True:
+            entry = self.queue.get()
+            if entry is _STOP:
+                break
+
+            key, payload = entry
+            started = time.time()
+            try:
+                result = self.handler(key, payload)
+            except Exception as e:
+                result = {"success": False, "error": f"{self.name} 단계 오류: {str(e)}"}
+            finished = time.time()
+
+            self.stats.record(started, finished, bool(result and result.get("success")))
+            with self._results_lock:
+                self.results[key] = result
+
+            if self.next_stage is not None and self.forward_if(result):
+                self.next_stage.put(key, result)
+
+
+class StreamingPipeline:
+    """여러 단계를 순서대로 연결한 생산자/소비자 파이프라인"""
+
+    def __init__(self, stages: List[PipelineStage]):
+        self.stages = stages
+        for current, following in zip(stages, stages[1:]):
+            current.next_stage = following
+
+    def start(self):
+        """모든 단계의 작업자 시작"""
+        for stage in self.stages:
+            stage.start()
+        return self
+
+    def submit(self, key, payload):
+        """첫 단계에 작업 투입"""
+        self.stages[0].put(key, payload)
+
+    def close(self) -> Dict[str, Dict]:
+        """앞 단계부터 차례로 비우고 종료한 뒤 단계별 결과 반환"""
+        for stage in self.stages:
+            stage.stop()
+        return {stage.name: stage.results for stage in self.stages}
+
+    def get_stats(self) -> List[Dict]:
+        """단계별 처리량 요약 목록"""
+        return [stage.stats.summary() for stage in self.stages]
+
+    def print_stats(self, extra_stats: Optional[List[StageStats]] = None):
+        """단계별 처리량 출력 (파이프라인 밖에서 측정한 단계는 extra_stats로 전달)"""
+        print("\n📈 단계별 처리량")
+        all_stats = [stats.summary() for stats in (extra_stats or [])] + self.get_stats()
+        for stats in all_stats:
+            print(f"   {stats['단계']}: {stats['처리']}건 (실패 {stats['실패']}건), "
+                  f"평균 {stats['평균_처리시간']:.1f}초, 분당 {stats['분당_처리량']:.1f}건, "
+                  f"최대 대기열 {stats['최대_대기열']}")
+
+
+if __name__ == "__main__":
+    # 테스트 코드
+    print("🧪 스트리밍 파이프라인 테스트")
+    print("=" * 50)
+
+    def slow_parse(key, payload):
+        time.sleep(0.2)
+        return {"success": True, "text": f"{payload} 파싱됨"}
+
+    def slow_summarize(key, payload):
+        time.sleep(0.3)
+        return {"success": True, "summary": payload["text"].replace("파싱됨", "요약됨")}
+
+    pipeline = StreamingPipeline([
+        PipelineStage("파싱", slow_parse, workers=2, queue_size=2),
+        PipelineStage("요약", slow_summarize, workers=3, queue_size=2)
+    ]).start()
+
+    started = time.time()
+    for i in range(10):
+        time.sleep(0.1)  # 다운로드 시뮬레이션
+        pipeline.submit(i, f"공고{i}")
+    outputs = pipeline.close()
+
+    print(f"전체 소요: {time.time() - started:.1f}초 (순차 실행 시 {10 * 0.6:.1f}초)")
+    print(f"요약 결과: {[outputs['요약'][i]['summary'] for i in range(10)]}")
+    pipeline.print_stats()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+요약기 부하 테스트
+로컬 Claude API 테스트 서버에 AsyncClaudeSummarizer로 공고를 동시에 요약시켜 동시 실행 수별 처리량(공고/분) 측정
+
+사용 예:
+    python -m src.data_processor.summarizer_load_test [공고 수] [동시 실행 수 목록]
+    python -m src.data_processor.summarizer_load_test 60 1,2,4,8,16
+
+환경변수로 서버 조건 조정: LOCAL_API_LATENCY_MEDIAN, LOCAL_API_LATENCY_P95, LOCAL_API_429_RATE,
+LOCAL_API_529_RATE, LOCAL_API_RPM, LOCAL_API_ITPM, LOCAL_API_MISSING_RATE (LOCAL_API_PORT는 0으로 자동 선택)
+ANTHROPIC_RPM/ITPM/OTPM은 요약기 쪽 속도 제한기에 적용 (기본 50 RPM / 출력 10,000 TPM이 처리량 상한이 되므로
+서버 쪽 한계를 보려면 0으로 설정해 제한 해제)
+"""
+
+import json
+import os
+import sys
+import time
+from typing import Dict, List
+
+from .claude_summarizer import AsyncClaudeSummarizer
+from .local_api_server import LocalClaudeServer
+from ..utils.rate_limiter import RateLimiter
+
+# 테스트 공고 원문 (길이가 다른 3종을 돌려가며 사용)
+SAMPLE_OVERVIEWS = [
+    """1. 사업목적
+AI 기술의 해외 우수 인재를 국내로 유치하여 AI 분야의 기술 경쟁력을 강화
+2. 지원내용
+연구개발비, 정착지원금, 연구환경 조성비 등 종합 지원
+3. 지원규모
+총 100억원, 개인당 최대 5억원을 3년간 지원 (10명 내외 선정)
+4. 신청대상
+AI 분야 박사학위 소지자 또는 동등 경력자로 해외 거주 경험이 있는 자""",
+    """□ 추진배경
+탄소중립 실현을 위한 수소 생산·저장 핵심기술 확보 필요
+□ 사업내용
+수전해 스택 고효율화, 액화수소 저장용기 국산화 기술개발
+□ 지원예산
+총 45억원 (과제당 연 15억원 이내, 3개 과제 선정)
+□ 지원기간
+2025.07.01 ~ 2027.12.31 (30개월)
+□ 신청자격
+중소·중견기업 주관, 대학·출연연 공동연구 필수""",
+    """사업개요
+지역 제조 중소기업의 스마트공장 고도화를 위해 디지털 트윈 기반 공정 최적화 솔루션 개발을 지원합니다.
+지원대상은 지역 소재 중소기업과 대학 컨소시엄이며, 과제당 최대 3억원, 총 20개 과제를 선정합니다.
+연구기간은 2년 이내이며 기업 매칭 비율 25% 이상이 필요합니다.
+주요특징으로 현장 실증 결과를 기반으로 한 후속 사업화 연계 지원이 있습니다.""" * 3
+]
+
+
+def make_items(count: int) -> List[Dict]:
+    """부하 테스트용 공고 목록 (본문이 모두 달라 캐시에 걸리지 않도록 번호를 붙임)"""
+    return [
+        {
+            "business_overview": f"{SAMPLE_OVERVIEWS[i % len(SAMPLE_OVERVIEWS)]}\n(공고번호 {i + 1})",
+            "announcement_title": f"부하 테스트 공고 {i + 1}"
+        }
+        for i in range(count)
+    ]
+
+
+def run_level(base_url: str, items: List[Dict], concurrency: int) -> Dict:
+    """동시 실행 수 하나로 전체 공고 요약 후 처리량 계산"""
+    summarizer = AsyncClaudeSummarizer(
+        api_key="local", base_url=base_url, max_concurrency=concurrency,
+        rate_limiter=RateLimiter.from_env()
+    )
+    start_time = time.perf_counter()
+    results = summarizer.summarize_many_sync(items)
+    elapsed = time.perf_counter() - start_time
+
+    succeeded = [result for result in results if result.get("success")]
+    attempts = [result.get("metadata", {}).get("attempts", 1) for result in succeeded]
+    repaired = sum(1 for result in succeeded if result.get("metadata", {}).get("repaired_fields"))
+    return {
+        "동시실행": concurrency,
+        "공고": len(items),
+        "성공": len(succeeded),
+        "소요시간": round(elapsed, 1),
+        "공고/분": round(len(succeeded) / elapsed * 60, 1) if elapsed else 0.0,
+        "평균시도": round(sum(attempts) / len(attempts), 2) if attempts else 0.0,
+        "빈항목보완": repaired
+    }
+
+
+def main():
+    """동시 실행 수별 처리량 측정"""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    levels = [int(level) for level in (sys.argv[2] if len(sys.argv) > 2 else "1,2,4,8,16").split(",")]
+
+    print("🧪 요약기 부하 테스트")
+    print("=" * 50)
+
+    os.environ.setdefault("LOCAL_API_PORT", "0")
+    report = []
+    for concurrency in levels:
+        # 동시 실행 수마다 새 서버 (한도 버킷/통계 초기화)
+        with LocalClaudeServer.from_env() as server:
+            print(f"\n▶ 동시 실행 {concurrency} ({server.base_url})")
+            row = run_level(server.base_url, make_items(count), concurrency)
+            row["서버"] = server.get_stats()
+        report.append(row)
+        print(f"   {row['공고/분']} 공고/분 (성공 {row['성공']}/{row['공고']}, {row['소요시간']}초, "
+              f"429 {row['서버']['429']}회, 529 {row['서버']['529']}회, 최대 동시 {row['서버']['최대동시요청']})")
+
+    print(f"\n{'='*50}")
+    print("📊 동시 실행 수별 처리량")
+    print(f"{'동시실행':>8} {'공고/분':>10} {'성공':>8} {'평균시도':>8}")
+    for row in report:
+        print(f"{row['동시실행']:>8} {row['공고/분']:>10} {row['성공']:>8} {row['평균시도']:>8}")
+
+    report_file = os.getenv("LOAD_TEST_REPORT", "output/summarizer_load_test.json")
+    os.makedirs(os.path.dirname(report_file) or ".", exist_ok=True)
+    with open(report_file, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n💾 결과 저장: {report_file}")
+
+
+if __name__ == "__main__":
+    main()
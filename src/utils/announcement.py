@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+공고 레코드 모델
+크롤링 결과(한글 키 dict)를 받는 시점에 roRndUid, 접수일, 마감일, 현황을 한 번만 해석해 두고
+정렬/중복 제거는 미리 계산한 정수 키로 처리
+- 기존 JSON 형식(한글 키 dict)과 서로 변환 가능 (모르는 키는 extra로 보존)
+- __slots__로 레코드당 메모리 절감
+"""
+
+import re
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional
+
+_UID_PATTERN = re.compile(r'roRndUid=(\d+)')
+
+# 날짜를 해석할 수 없을 때의 정렬 키 (가장 오래된 날짜로 취급)
+UNKNOWN_DATE = 0
+
+# 한글 키 -> 속성 이름
+FIELD_MAP = {
+    "현황": "status",
+    "공고명": "title",
+    "상세_URL": "detail_url",
+    "부처명": "ministry",
+    "접수일": "start_date",
+    "마감일": "end_date",
+}
+
+
+def extract_uid(url: str) -> str:
+    """상세_URL에서 roRndUid 추출 (없으면 빈 문자열)"""
+    match = _UID_PATTERN.search(url or "")
+    return match.group(1) if match else ""
+
+
+def parse_date(date_str: str) -> Optional[date]:
+    """'YYYY.MM.DD' 형식 날짜 해석 (실패 시 None)"""
+    try:
+        year, month, day = (date_str or "").strip().split(".")
+        return date(int(year), int(month), int(day))
+    except (ValueError, TypeError):
+        return None
+
+
+@lru_cache(maxsize=8192)
+def date_sort_key(date_str: str) -> int:
+    """정렬용 날짜 키 (date.toordinal, 해석 실패 시 UNKNOWN_DATE, 같은 날짜 문자열은 캐시)"""
+    parsed = parse_date(date_str)
+    return parsed.toordinal() if parsed else UNKNOWN_DATE
+
+
+class Announcement:
+    """공고 1건 (uid/날짜 키는 생성 시 한 번만 계산)"""
+
+    __slots__ = ("uid", "status", "title", "detail_url", "ministry", "start_date", "end_date",
+                 "start_key", "end_key", "extra")
+
+    def __init__(self, title: str = "", detail_url: str = "", ministry: str = "", status: str = "",
+                 start_date: str = "", end_date: str = "", extra: Optional[Dict] = None):
+        self.status = (status or "").strip()
+        self.title = title or ""
+        self.detail_url = detail_url or ""
+        self.ministry = ministry or ""
+        self.start_date = start_date or ""
+        self.end_date = end_date or ""
+        self.extra = extra or {}
+        self.uid = extract_uid(self.detail_url)
+        self.start_key = date_sort_key(self.start_date)
+        self.end_key = date_sort_key(self.end_date)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Announcement":
+        """기존 JSON 형식 dict에서 생성"""
+        extra = {key: value for key, value in data.items() if key not in FIELD_MAP}
+        return cls(data.get("공고명", ""), data.get("상세_URL", ""), data.get("부처명", ""), data.get("현황", ""),
+                   data.get("접수일", ""), data.get("마감일", ""), extra)
+
+    def to_dict(self) -> Dict:
+        """기존 JSON 형식 dict로 변환 (현황/공고명/상세_URL/부처명/접수일/마감일 + extra)"""
+        data = {key: getattr(self, attr) for key, attr in FIELD_MAP.items()}
+        data.update(self.extra)
+        return data
+
+    @property
+    def deadline(self) -> Optional[date]:
+        return date.fromordinal(self.end_key) if self.end_key else None
+
+    def days_left(self, today: Optional[date] = None) -> Optional[int]:
+        """마감까지 남은 일수 (마감일을 모르면 None, 지났으면 음수)"""
+        if not self.end_key:
+            return None
+        return self.end_key - (today or date.today()).toordinal()
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Announcement):
+            return NotImplemented
+        return self.uid == other.uid if self.uid and other.uid else self.to_dict() == other.to_dict()
+
+    def __hash__(self) -> int:
+        return hash(self.uid or self.detail_url)
+
+    def __repr__(self) -> str:
+        return f"Announcement(uid={self.uid!r}, title={self.title[:30]!r}, 접수일={self.start_date!r}, 마감일={self.end_date!r})"
+
+
+def sort_latest_first(announcements: Iterable[Announcement]) -> List[Announcement]:
+    """접수일 기준 내림차순 정렬 (해석할 수 없는 날짜는 맨 뒤)"""
+    return sorted(announcements, key=lambda announcement: announcement.start_key, reverse=True)
+
+
+def dedupe(announcements: Iterable[Announcement]) -> List[Announcement]:
+    """roRndUid 기준 중복 제거 (먼저 나온 항목 유지, uid가 없는 항목은 그대로)"""
+    seen, result = set(), []
+    for announcement in announcements:
+        if announcement.uid:
+            if announcement.uid in seen:
+                continue
+            seen.add(announcement.uid)
+        result.append(announcement)
+    return result
+
+
+if __name__ == "__main__":
+    # 테스트 코드
+    import random
+    import sys
+    import time
+
+    print("🧪 공고 레코드 테스트")
+    print("=" * 50)
+
+    sample = {"현황": "접수중", "공고명": "(AI) 일반형 공동연구", "부처명": "과학기술정보통신부",
+              "접수일": "2025.09.01", "마감일": "2025.09.23", "D_day": "D-5",
+              "상세_URL": "https://www.ntis.go.kr/rndgate/eg/un/ra/view.do?roRndUid=1247708&flag=rndList"}
+    record = Announcement.from_dict(sample)
+    print(f"{record} → 남은 일수 {record.days_left(date(2025, 9, 18))}, 왕복 변환 일치: {record.to_dict() == sample}")
+
+    # 10만 건 정렬 + 중복 제거: 매번 dict에서 strptime/정규식으로 해석하는 기존 방식과 비교
+    random.seed(0)
+    rows = []
+    for i in range(100_000):
+        uid = 1_000_000 + random.randrange(80_000)
+        start = date(2024, 1, 1).toordinal() + random.randrange(700)
+        rows.append({"현황": "접수중", "공고명": f"합성 공고 {i}", "부처명": "테스트부처",
+                     "접수일": date.fromordinal(start).strftime("%Y.%m.%d"),
+                     "마감일": date.fromordinal(start + 30).strftime("%Y.%m.%d"),
+                     "상세_URL": f"https://www.ntis.go.kr/rndgate/eg/un/ra/view.do?roRndUid={uid}&flag=rndList"})
+
+    def legacy_date(date_str):
+        try:
+            return datetime.strptime(date_str, "%Y.%m.%d")
+        except ValueError:
+            return datetime.min
+
+    start_time = time.perf_counter()
+    legacy_sorted = sorted(rows, key=lambda x: legacy_date(x["접수일"]), reverse=True)
+    legacy_seen, legacy_unique = set(), []
+    for row in legacy_sorted:
+        uid = re.search(r'roRndUid=(\d+)', row["상세_URL"]).group(1)
+        if uid not in legacy_seen:
+            legacy_seen.add(uid)
+            legacy_unique.append(row)
+    legacy_elapsed = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    records = [Announcement.from_dict(row) for row in rows]
+    ingest_elapsed = time.perf_counter() - start_time
+    start_time = time.perf_counter()
+    unique = dedupe(sort_latest_first(records))
+    typed_elapsed = time.perf_counter() - start_time
+
+    print(f"\n10만 건 (고유 uid {len(unique):,}개, 결과 일치: {[r.uid for r in unique] == [extract_uid(r['상세_URL']) for r in legacy_unique]})")
+    print(f"  dict + strptime/정규식 매번 해석: {legacy_elapsed * 1000:.0f}ms")
+    print(f"  Announcement 생성(1회 해석): {ingest_elapsed * 1000:.0f}ms, 정렬+중복 제거: {typed_elapsed * 1000:.0f}ms")
+    print(f"  레코드 크기: Announcement {sys.getsizeof(records[0])}B (dict {sys.getsizeof(rows[0])}B)")
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+메모리 공고 저장소 (색인 포함)
+관리 JSON 파일을 프로세스당 한 번만 읽어 roRndUid 사전과 접수일/마감일 정렬 색인을 만들어 두고
+변경된 공고는 모아서 한 번에 파일로 기록
+- 조회/표시: uid 사전으로 O(1)
+- 기간 조회("7일 안에 마감"): 정렬 색인 이진 탐색으로 O(log n)
+"""
+
+import bisect
+import json
+import os
+import threading
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .announcement import Announcement, UNKNOWN_DATE
+
+
+class AnnouncementRepository:
+    """roRndUid 색인 + 접수일/마감일 정렬 색인을 가진 메모리 공고 저장소"""
+
+    _instances = {}  # 파일 경로 -> 저장소 (프로세스당 한 번만 로드)
+    _instances_lock = threading.Lock()
+
+    def __init__(self, json_file_path: str = "output/ntis_managed_data.json", flush_every: int = 50):
+        """
+        초기화 (파일은 처음 사용할 때 로드)
+
+        Args:
+            json_file_path: 관리 데이터 JSON 파일 ({"announcements": [...], 그 외 메타데이터})
+            flush_every: 변경된 공고가 이만큼 쌓이면 자동으로 파일에 기록 (0이면 flush() 호출 때만)
+        """
+        self.json_file_path = json_file_path
+        self.flush_every = flush_every
+        self.meta = {}                               # announcements 외의 최상위 키
+        self._by_uid: Dict[str, Announcement] = {}
+        self._order: List[str] = []                  # 파일에 저장된 순서
+        self._start_index: List[Tuple[int, str]] = []  # (접수일 키, uid) 정렬
+        self._end_index: List[Tuple[int, str]] = []    # (마감일 키, uid) 정렬
+        self._dirty = set()
+        self._loaded = False
+        self._lock = threading.RLock()
+
+    @classmethod
+    def shared(cls, json_file_path: str = "output/ntis_managed_data.json") -> "AnnouncementRepository":
+        """경로별 공유 인스턴스 (같은 프로세스에서는 파일을 다시 읽지 않음)"""
+        path = os.path.abspath(json_file_path)
+        with cls._instances_lock:
+            if path not in cls._instances:
+                cls._instances[path] = cls(json_file_path)
+            return cls._instances[path]
+
+    # ====== 로드 / 기록 ======
+
+    def load(self):
+        """저장된 파일 로드 (프로세스당 한 번)"""
+        with self._lock:
+            if self._loaded:
+                return
+            self._loaded = True
+            if not os.path.exists(self.json_file_path):
+                return
+            try:
+                with open(self.json_file_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except Exception as e:
+                print(f"⚠️ 관리 데이터 로드 실패: {str(e)}")
+                return
+            self.meta = {key: value for key, value in data.items() if key != "announcements"}
+            self._bulk_load(Announcement.from_dict(item) for item in data.get("announcements", []))
+            print(f"📂 관리 데이터 로드: {len(self._by_uid)}개")
+
+    def flush(self) -> bool:
+        """변경 사항이 있으면 파일로 기록 (임시 파일 작성 후 교체)"""
+        with self._lock:
+            if not self._dirty:
+                return False
+            data = self.to_data()
+            os.makedirs(os.path.dirname(self.json_file_path) or ".", exist_ok=True)
+            temp_file = f"{self.json_file_path}.tmp"
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            os.replace(temp_file, self.json_file_path)
+            flushed = len(self._dirty)
+            self._dirty.clear()
+            print(f"💾 관리 데이터 저장: {len(self._by_uid)}개 (변경 {flushed}개)")
+            return True
+
+    def _changed(self, uid: str):
+        """변경 표시 후 쌓인 변경이 많으면 한 번에 기록"""
+        self._dirty.add(uid)
+        if self.flush_every and len(self._dirty) >= self.flush_every:
+            self.flush()
+
+    # ====== 색인 ======
+
+    def _put(self, announcement: Announcement):
+        """사전/정렬 색인에 추가 또는 교체 (잠금 안에서 호출)"""
+        uid = announcement.uid or announcement.detail_url
+        previous = self._by_uid.get(uid)
+        if previous is not None:
+            self._unindex(uid, previous)
+        else:
+            self._order.append(uid)
+        self._by_uid[uid] = announcement
+        bisect.insort(self._start_index, (announcement.start_key, uid))
+        bisect.insort(self._end_index, (announcement.end_key, uid))
+        return uid
+
+    def _bulk_load(self, announcements: Iterable[Announcement]):
+        """비어 있는 저장소에 한꺼번에 넣고 정렬 색인은 마지막에 한 번만 정렬 (잠금 안에서 호출)"""
+        for announcement in announcements:
+            uid = announcement.uid or announcement.detail_url
+            if uid not in self._by_uid:
+                self._order.append(uid)
+            self._by_uid[uid] = announcement
+        self._start_index = sorted((announcement.start_key, uid) for uid, announcement in self._by_uid.items())
+        self._end_index = sorted((announcement.end_key, uid) for uid, announcement in self._by_uid.items())
+
+    def _unindex(self, uid: str, announcement: Announcement):
+        for index, key in ((self._start_index, announcement.start_key), (self._end_index, announcement.end_key)):
+            position = bisect.bisect_left(index, (key, uid))
+            if position < len(index) and index[position] == (key, uid):
+                del index[position]
+
+    # ====== 변경 ======
+
+    def upsert(self, item) -> str:
+        """공고 추가/교체 (dict 또는 Announcement), 저장소 키(uid) 반환"""
+        announcement = item if isinstance(item, Announcement) else Announcement.from_dict(item)
+        self.load()
+        with self._lock:
+            uid = self._put(announcement)
+            self._changed(uid)
+            return uid
+
+    def upsert_many(self, items: Iterable) -> List[str]:
+        return [self.upsert(item) for item in items]
+
+    def update(self, uid: str, fields: Dict) -> bool:
+        """공고 일부 필드 갱신 (한글 키 기준, 없는 공고면 False)"""
+        self.load()
+        with self._lock:
+            announcement = self._by_uid.get(uid)
+            if announcement is None:
+                return False
+            self._put(Announcement.from_dict({**announcement.to_dict(), **fields}))
+            self._changed(uid)
+            return True
+
+    def mark_detailed(self, uid: str, detail_data: Dict) -> bool:
+        """상세 크롤링 완료 표시"""
+        return self.update(uid, {
+            "is_detailed": True,
+            "detail_data": detail_data,
+            "detail_crawled_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        })
+
+    def remove(self, uid: str) -> bool:
+        self.load()
+        with self._lock:
+            announcement = self._by_uid.pop(uid, None)
+            if announcement is None:
+                return False
+            self._unindex(uid, announcement)
+            self._order.remove(uid)
+            self._changed(uid)
+            return True
+
+    def replace_all(self, items: Iterable, meta: Optional[Dict] = None):
+        """전체 목록 교체 (표시용 목록을 새로 정한 경우)"""
+        self.load()
+        with self._lock:
+            self._by_uid.clear()
+            self._order.clear()
+            self._bulk_load(item if isinstance(item, Announcement) else Announcement.from_dict(item) for item in items)
+            if meta is not None:
+                self.meta = dict(meta)
+            self._dirty.update(self._by_uid)
+            self._dirty.add("")  # 빈 목록으로 바뀐 경우도 기록되도록
+
+    # ====== 조회 ======
+
+    def get(self, uid: str) -> Optional[Announcement]:
+        self.load()
+        return self._by_uid.get(uid)
+
+    def __contains__(self, uid: str) -> bool:
+        self.load()
+        return uid in self._by_uid
+
+    def __len__(self) -> int:
+        self.load()
+        return len(self._by_uid)
+
+    def all(self) -> List[Announcement]:
+        """저장 순서대로 전체 공고"""
+        self.load()
+        with self._lock:
+            return [self._by_uid[uid] for uid in self._order]
+
+    def _range(self, index: List[Tuple[int, str]], start: Optional[date], end: Optional[date]) -> List[Announcement]:
+        low = (start.toordinal() if start else UNKNOWN_DATE + 1, "")
+        high = ((end.toordinal() + 1) if end else float("inf"), "")
+        with self._lock:
+            return [self._by_uid[uid] for _, uid in index[bisect.bisect_left(index, low):bisect.bisect_left(index, high)]]
+
+    def received_between(self, start: Optional[date] = None, end: Optional[date] = None) -> List[Announcement]:
+        """접수일이 [start, end] 범위인 공고 (접수일 오름차순, 날짜 모르는 공고 제외)"""
+        self.load()
+        return self._range(self._start_index, start, end)
+
+    def closing_between(self, start: Optional[date] = None, end: Optional[date] = None) -> List[Announcement]:
+        """마감일이 [start, end] 범위인 공고 (마감일 오름차순, 날짜 모르는 공고 제외)"""
+        self.load()
+        return self._range(self._end_index, start, end)
+
+    def closing_within(self, days: int, today: Optional[date] = None) -> List[Announcement]:
+        """오늘부터 days일 안에 마감되는 공고"""
+        today = today or date.today()
+        return self.closing_between(today, date.fromordinal(today.toordinal() + days))
+
+    def latest(self, limit: int = 30) -> List[Announcement]:
+        """접수일 최신순 상위 공고 (날짜 모르는 공고는 맨 뒤)"""
+        self.load()
+        with self._lock:
+            return [self._by_uid[uid] for _, uid in reversed(self._start_index[-limit:])] if limit else []
+
+    def to_data(self) -> Dict:
+        """관리 데이터 JSON 형식 ({메타데이터..., "announcements": [...]})"""
+        self.load()
+        with self._lock:
+            announcements = [self._by_uid[uid].to_dict() for uid in self._order]
+        return {**self.meta, "total_count": len(announcements), "announcements": announcements}
+
+
+if __name__ == "__main__":
+    # 테스트 코드
+    import random
+    import tempfile
+    import time
+
+    print("🧪 공고 저장소 색인 테스트")
+    print("=" * 50)
+
+    json_file = os.path.join(tempfile.mkdtemp(), "managed.json")
+    repository = AnnouncementRepository(json_file, flush_every=0)
+
+    random.seed(0)
+    today = date(2025, 9, 18)
+    rows = []
+    for i in range(50_000):
+        start = today.toordinal() - random.randrange(365)
+        rows.append({"현황": "접수중", "공고명": f"합성 공고 {i}", "부처명": "테스트부처",
+                     "접수일": date.fromordinal(start).strftime("%Y.%m.%d"),
+                     "마감일": date.fromordinal(start + random.randrange(10, 60)).strftime("%Y.%m.%d"),
+                     "상세_URL": f"https://www.ntis.go.kr/rndgate/eg/un/ra/view.do?roRndUid={1_000_000 + i}&flag=rndList"})
+
+    start_time = time.perf_counter()
+    repository.replace_all(rows, meta={"search_keyword": "테스트"})
+    print(f"5만 건 색인: {(time.perf_counter() - start_time) * 1000:.0f}ms")
+
+    start_time = time.perf_counter()
+    for i in range(1000):
+        repository.mark_detailed(str(1_000_000 + random.randrange(50_000)), {"page": i})
+    print(f"상세 완료 표시 1,000건: {(time.perf_counter() - start_time) * 1000:.0f}ms")
+
+    start_time = time.perf_counter()
+    closing = repository.closing_within(7, today=today)
+    elapsed = time.perf_counter() - start_time
+    expected = sum(1 for row in rows if 0 <= Announcement.from_dict(row).end_key - today.toordinal() <= 7)
+    print(f"7일 안에 마감: {len(closing)}건 (전수 조사 {expected}건), {elapsed * 1000:.1f}ms")
+    print(f"최신 공고: {repository.latest(2)}")
+
+    repository.flush()
+    reloaded = AnnouncementRepository(json_file)
+    print(f"재로드: {len(reloaded)}건, 상세 완료 {sum(1 for a in reloaded.all() if a.extra.get('is_detailed'))}건")
@@ -0,0 +1,659 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+공고 저장소 (SQLite, WAL 모드)
+old_data.json / new_data.json / data/announcements_db.json을 하나의 내장 DB로 대체
+- 테이블: announcements, crawl_runs, attachments, parse_results, summaries
+- 인덱스: roRndUid(기본키), 접수일, 마감일, 현황
+- 모든 쓰기는 행 단위 upsert (바뀐 공고만 기록)
+- 처음 열 때 DB가 비어 있으면 기존 JSON 파일을 가져옴
+- 공고별 처리 단계(crawled → downloaded → parsed → summarized → reported → emailed)를 단계마다 기록하여
+  중단된 실행은 마지막으로 끝난 단계부터 이어서 처리
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .announcement import extract_uid
+
+# 공고 dict 키 → 컬럼 (그 외 키는 extra 컬럼에 JSON으로 보관)
+ANNOUNCEMENT_COLUMNS = {
+    "공고명": "title",
+    "부처명": "ministry",
+    "현황": "status",
+    "접수일": "start_date",
+    "마감일": "end_date",
+    "상세_URL": "detail_url"
+}
+
+# 요약 결과 키 (summaries 테이블에 보관, 공고 dict에는 합쳐서 반환)
+SUMMARY_KEYS = ("ai_요약", "ai_메타데이터", "요약_처리시간")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS announcements (
+    ro_rnd_uid TEXT PRIMARY KEY,
+    title TEXT NOT NULL DEFAULT '',
+    ministry TEXT NOT NULL DEFAULT '',
+    status TEXT NOT NULL DEFAULT '',
+    start_date TEXT NOT NULL DEFAULT '',
+    end_date TEXT NOT NULL DEFAULT '',
+    detail_url TEXT NOT NULL DEFAULT '',
+    extra TEXT NOT NULL DEFAULT '{}',
+    crawl_run INTEGER,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_announcements_start_date ON announcements(start_date);
+CREATE INDEX IF NOT EXISTS idx_announcements_end_date ON announcements(end_date);
+CREATE INDEX IF NOT EXISTS idx_announcements_status ON announcements(status);
+CREATE INDEX IF NOT EXISTS idx_announcements_crawl_run ON announcements(crawl_run);
+
+CREATE TABLE IF NOT EXISTS crawl_runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    keyword TEXT NOT NULL DEFAULT '',
+    crawled_at TEXT NOT NULL,
+    crawled_count INTEGER NOT NULL DEFAULT 0,
+    new_count INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS attachments (
+    ro_rnd_uid TEXT NOT NULL REFERENCES announcements(ro_rnd_uid) ON DELETE CASCADE,
+    file_name TEXT NOT NULL DEFAULT '',
+    file_path TEXT,
+    status TEXT NOT NULL DEFAULT '',
+    error TEXT,
+    downloaded_at TEXT NOT NULL,
+    PRIMARY KEY (ro_rnd_uid, file_name)
+);
+
+CREATE TABLE IF NOT EXISTS parse_results (
+    ro_rnd_uid TEXT PRIMARY KEY REFERENCES announcements(ro_rnd_uid) ON DELETE CASCADE,
+    success INTEGER NOT NULL,
+    parsed_file TEXT,
+    full_text_length INTEGER NOT NULL DEFAULT 0,
+    front_text TEXT,
+    error TEXT,
+    parsed_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS summaries (
+    ro_rnd_uid TEXT PRIMARY KEY REFERENCES announcements(ro_rnd_uid) ON DELETE CASCADE,
+    summary TEXT NOT NULL,
+    metadata TEXT NOT NULL DEFAULT '{}',
+    model TEXT NOT NULL DEFAULT '',
+    engine TEXT NOT NULL DEFAULT '',
+    input_tokens INTEGER NOT NULL DEFAULT 0,
+    output_tokens INTEGER NOT NULL DEFAULT 0,
+    processed_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS item_states (
+    ro_rnd_uid TEXT PRIMARY KEY REFERENCES announcements(ro_rnd_uid) ON DELETE CASCADE,
+    stage TEXT NOT NULL,
+    failed_stage TEXT,
+    error TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    updated_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_item_states_stage ON item_states(stage);
+"""
+
+# 공고별 처리 단계 (앞에서부터 순서대로 진행, 각 단계가 끝날 때마다 기록)
+STAGES = ("crawled", "downloaded", "parsed", "summarized", "reported", "emailed")
+
+
+def _now() -> str:
+    return datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
+
+
+class AnnouncementStore:
+    """공고/첨부파일/파싱/요약 결과 SQLite 저장소"""
+
+    def __init__(self, db_path: str = "output/ntis.db"):
+        """
+        초기화
+
+        Args:
+            db_path: DB 파일 경로 (":memory:"이면 메모리 DB)
+        """
+        self.db_path = db_path
+        if db_path != ":memory:":
+            os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        # 요약 작업 스레드에서도 쓰므로 연결 하나를 잠금으로 보호
+        self.conn = sqlite3.connect(db_path, check_same_thread=False, timeout=30)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self.conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls, import_legacy: bool = True) -> "AnnouncementStore":
+        """환경변수(NTIS_DB_PATH)로 생성 (DB가 비어 있으면 기존 JSON 파일 가져오기)"""
+        store = cls(db_path=os.getenv("NTIS_DB_PATH", "output/ntis.db"))
+        if import_legacy:
+            store.import_legacy()
+        return store
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+    # ====== 공고 ======
+
+    def _split_fields(self, announcement: Dict) -> Tuple[Dict, Dict]:
+        """공고 dict를 (컬럼 값, extra) 로 분리 (요약 결과 키는 제외)"""
+        columns = {column: announcement.get(key) or "" for key, column in ANNOUNCEMENT_COLUMNS.items()}
+        extra = {
+            key: value for key, value in announcement.items()
+            if key not in ANNOUNCEMENT_COLUMNS and key not in SUMMARY_KEYS
+        }
+        return columns, extra
+
+    def upsert_announcements(self, announcements: Iterable[Dict], crawl_run: Optional[int] = None) -> List[str]:
+        """
+        공고 목록 upsert (기존 공고는 목록 필드/extra만 갱신, 처음 발견한 실행 번호는 유지)
+
+        Args:
+            announcements: 공고 dict 목록 (상세_URL의 roRndUid가 키)
+            crawl_run: 신규로 발견된 크롤링 실행 번호 (이미 있는 공고에는 적용하지 않음)
+
+        Returns:
+            저장된 roRndUid 목록
+        """
+        rows = []
+        for announcement in announcements:
+            uid = extract_uid(announcement.get("상세_URL", ""))
+            if not uid:
+                continue
+            columns, extra = self._split_fields(announcement)
+            rows.append((uid, columns, extra))
+        if not rows:
+            return []
+
+        now = _now()
+        with self._lock, self.conn:
+            existing = self._extras([uid for uid, _, _ in rows])
+            for uid, columns, extra in rows:
+                merged = {**existing.get(uid, {}), **extra}
+                self.conn.execute(
+                    """
+                    INSERT INTO announcements (ro_rnd_uid, title, ministry, status, start_date, end_date,
+                                               detail_url, extra, crawl_run, first_seen, last_seen)
+                    VALUES (:uid, :title, :ministry, :status, :start_date, :end_date, :detail_url, :extra,
+                            :crawl_run, :now, :now)
+                    ON CONFLICT(ro_rnd_uid) DO UPDATE SET
+                        title = excluded.title, ministry = excluded.ministry, status = excluded.status,
+                        start_date = excluded.start_date, end_date = excluded.end_date,
+                        detail_url = excluded.detail_url, extra = excluded.extra, last_seen = excluded.last_seen
+                    """,
+                    {"uid": uid, **columns, "extra": json.dumps(merged, ensure_ascii=False),
+                     "crawl_run": crawl_run, "now": now}
+                )
+        return [uid for uid, _, _ in rows]
+
+    def _extras(self, uids: List[str]) -> Dict[str, Dict]:
+        """기존 extra 값 조회 (잠금 안에서 호출)"""
+        extras = {}
+        for start in range(0, len(uids), 500):
+            chunk = uids[start:start + 500]
+            cursor = self.conn.execute(
+                f"SELECT ro_rnd_uid, extra FROM announcements WHERE ro_rnd_uid IN ({','.join('?' * len(chunk))})", chunk
+            )
+            extras.update({row["ro_rnd_uid"]: json.loads(row["extra"] or "{}") for row in cursor})
+        return extras
+
+    def update_fields(self, uid: str, fields: Dict):
+        """공고 1건의 extra 필드 갱신 (처리상태, 첨부파일명 등)"""
+        if not uid or not fields:
+            return
+        with self._lock, self.conn:
+            current = self._extras([uid]).get(uid)
+            if current is None:
+                return
+            current.update(fields)
+            self.conn.execute("UPDATE announcements SET extra = ? WHERE ro_rnd_uid = ?",
+                              (json.dumps(current, ensure_ascii=False), uid))
+
+    def known_uids(self, uids: Iterable[str]) -> Set[str]:
+        """저장소에 이미 있는 roRndUid"""
+        uids = [uid for uid in uids if uid]
+        with self._lock:
+            return set(self._extras(uids))
+
+    def _query(self, where: str = "", params: tuple = (), order: str = "", limit: Optional[int] = None) -> List[Dict]:
+        sql = """
+            SELECT a.*, s.summary, s.metadata, s.processed_at
+            FROM announcements a LEFT JOIN summaries s ON s.ro_rnd_uid = a.ro_rnd_uid
+        """
+        if where:
+            sql += f" WHERE {where}"
+        if order:
+            sql += f" ORDER BY {order}"
+        if limit:
+            sql += f" LIMIT {int(limit)}"
+        with self._lock:
+            rows = self.conn.execute(sql, params).fetchall()
+        return [self._to_dict(row) for row in rows]
+
+    def _to_dict(self, row: sqlite3.Row) -> Dict:
+        """DB 행 → new_data.json 항목과 같은 형태의 공고 dict"""
+        announcement = {key: row[column] for key, column in ANNOUNCEMENT_COLUMNS.items()}
+        announcement.update(json.loads(row["extra"] or "{}"))
+        if row["summary"]:
+            announcement["ai_요약"] = json.loads(row["summary"])
+            announcement["요약_처리시간"] = row["processed_at"]
+            metadata = json.loads(row["metadata"] or "{}")
+            if metadata:
+                announcement["ai_메타데이터"] = metadata
+        return announcement
+
+    def get_announcement(self, uid: str) -> Optional[Dict]:
+        """공고 1건 조회 (요약 포함)"""
+        rows = self._query("a.ro_rnd_uid = ?", (uid,))
+        return rows[0] if rows else None
+
+    def recent_announcements(self, limit: int = 30) -> List[Dict]:
+        """접수일 최신순 공고 (기존 old_data.json의 30개 목록)"""
+        return self._query(order="a.start_date DESC, a.ro_rnd_uid DESC", limit=limit)
+
+    def find_announcements(self, status: Optional[str] = None, deadline_from: Optional[str] = None,
+                           deadline_to: Optional[str] = None, limit: Optional[int] = None) -> List[Dict]:
+        """현황/마감일 범위로 공고 조회 (날짜는 "YYYY.MM.DD")"""
+        conditions, params = [], []
+        if status:
+            conditions.append("a.status = ?")
+            params.append(status)
+        if deadline_from:
+            conditions.append("a.end_date >= ?")
+            params.append(deadline_from)
+        if deadline_to:
+            conditions.append("a.end_date <= ?")
+            params.append(deadline_to)
+        return self._query(" AND ".join(conditions), tuple(params), order="a.end_date", limit=limit)
+
+    # ====== 크롤링 실행 ======
+
+    def record_crawl_run(self, keyword: str, crawled: List[Dict], new_items: List[Dict]) -> int:
+        """
+        크롤링 1회 기록: 목록 전체 upsert + 신규 공고에 실행 번호 지정
+
+        Returns:
+            실행 번호
+        """
+        with self._lock, self.conn:
+            cursor = self.conn.execute(
+                "INSERT INTO crawl_runs (keyword, crawled_at, crawled_count, new_count) VALUES (?, ?, ?, ?)",
+                (keyword, _now(), len(crawled), len(new_items))
+            )
+            run_id = cursor.lastrowid
+        self.upsert_announcements(crawled)
+        new_uids = [extract_uid(item.get("상세_URL", "")) for item in new_items]
+        self.mark_new(new_uids, run_id)
+        self.reset_stage(new_uids)
+        return run_id
+
+    def mark_new(self, uids: Iterable[str], crawl_run: Optional[int] = None):
+        """공고를 크롤링 실행의 신규 공고로 표시 (기본: 마지막 실행)"""
+        crawl_run = crawl_run or self.latest_run_id()
+        if crawl_run is None:
+            return
+        with self._lock, self.conn:
+            self.conn.executemany("UPDATE announcements SET crawl_run = ? WHERE ro_rnd_uid = ?",
+                                  [(crawl_run, uid) for uid in uids if uid])
+
+    def latest_run_id(self) -> Optional[int]:
+        with self._lock:
+            row = self.conn.execute("SELECT MAX(id) AS id FROM crawl_runs").fetchone()
+        return row["id"] if row else None
+
+    def new_announcements(self, crawl_run: Optional[int] = None) -> List[Dict]:
+        """크롤링 실행에서 신규로 발견된 공고 (기본: 마지막 실행, 기존 new_data.json)"""
+        crawl_run = crawl_run or self.latest_run_id()
+        if crawl_run is None:
+            return []
+        return self._query("a.crawl_run = ?", (crawl_run,), order="a.rowid")
+
+    def count_new(self, crawl_run: Optional[int] = None) -> int:
+        """마지막 크롤링 실행의 신규 공고 수"""
+        crawl_run = crawl_run or self.latest_run_id()
+        if crawl_run is None:
+            return 0
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM announcements WHERE crawl_run = ?", (crawl_run,)).fetchone()[0]
+
+    # ====== 첨부파일 / 파싱 / 요약 ======
+
+    def upsert_attachment(self, uid: str, file_path: Optional[str], status: str, error: Optional[str] = None,
+                          file_name: Optional[str] = None):
+        """첨부파일 다운로드 결과 기록"""
+        if not uid:
+            return
+        file_name = file_name if file_name is not None else (os.path.basename(file_path) if file_path else "")
+        with self._lock, self.conn:
+            self.conn.execute(
+                """
+                INSERT INTO attachments (ro_rnd_uid, file_name, file_path, status, error, downloaded_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(ro_rnd_uid, file_name) DO UPDATE SET
+                    file_path = excluded.file_path, status = excluded.status,
+                    error = excluded.error, downloaded_at = excluded.downloaded_at
+                """,
+                (uid, file_name, file_path, status, error, _now())
+            )
+
+    def get_attachment(self, uid: str) -> Optional[Dict]:
+        """가장 최근에 성공한 첨부파일 다운로드 기록"""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT * FROM attachments WHERE ro_rnd_uid = ? AND status = 'success' ORDER BY downloaded_at DESC LIMIT 1",
+                (uid,)
+            ).fetchone()
+        return dict(row) if row else None
+
+    def upsert_parse_result(self, uid: str, parse_result: Dict):
+        """파싱 결과 기록 (parse_downloaded_file 반환값)"""
+        if not uid:
+            return
+        with self._lock, self.conn:
+            self.conn.execute(
+                """
+                INSERT INTO parse_results (ro_rnd_uid, success, parsed_file, full_text_length, front_text, error, parsed_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(ro_rnd_uid) DO UPDATE SET
+                    success = excluded.success, parsed_file = excluded.parsed_file,
+                    full_text_length = excluded.full_text_length, front_text = excluded.front_text,
+                    error = excluded.error, parsed_at = excluded.parsed_at
+                """,
+                (uid, int(bool(parse_result.get("success"))), parse_result.get("parsed_file"),
+                 len(parse_result.get("full_text") or ""), parse_result.get("front_text"),
+                 parse_result.get("error"), _now())
+            )
+
+    def get_parse_result(self, uid: str) -> Optional[Dict]:
+        with self._lock:
+            row = self.conn.execute("SELECT * FROM parse_results WHERE ro_rnd_uid = ?", (uid,)).fetchone()
+        return dict(row) if row else None
+
+    def upsert_summary(self, uid: str, summary: Dict, metadata: Optional[Dict] = None,
+                       processed_at: Optional[str] = None):
+        """요약 결과 기록"""
+        if not uid or not summary:
+            return
+        metadata = metadata or {}
+        with self._lock, self.conn:
+            self.conn.execute(
+                """
+                INSERT INTO summaries (ro_rnd_uid, summary, metadata, model, engine, input_tokens, output_tokens, processed_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(ro_rnd_uid) DO UPDATE SET
+                    summary = excluded.summary, metadata = excluded.metadata, model = excluded.model,
+                    engine = excluded.engine, input_tokens = excluded.input_tokens,
+                    output_tokens = excluded.output_tokens, processed_at = excluded.processed_at
+                """,
+                (uid, json.dumps(summary, ensure_ascii=False), json.dumps(metadata, ensure_ascii=False),
+                 metadata.get("model", ""), metadata.get("engine", "claude"),
+                 metadata.get("input_tokens", 0) or 0, metadata.get("output_tokens", 0) or 0,
+                 processed_at or _now())
+            )
+
+    def save_announcement(self, announcement: Dict):
+        """
+        공고 dict 1건 저장 (목록 필드/extra + ai_요약이 있으면 요약까지 저장하고 summarized 단계로)
+        로컬 추출 요약(engine "local")은 임시 결과이므로 단계를 올리지 않고 요약 실패로 남겨
+        다음 실행/--retry-failed에서 Claude로 다시 요약
+        """
+        uids = self.upsert_announcements([announcement])
+        if not uids or not announcement.get("ai_요약"):
+            return
+        metadata = announcement.get("ai_메타데이터") or {}
+        self.upsert_summary(uids[0], announcement["ai_요약"], metadata, announcement.get("요약_처리시간"))
+        if metadata.get("engine") != "local":
+            self.set_stage(uids[0], "summarized")
+            return
+        with self._lock:
+            state = self._stages(uids).get(uids[0], {})
+        if state.get("failed_stage") != "summarized":
+            reason = metadata.get("fallback_reason") or "Claude 요약 없음"
+            self.mark_failed(uids[0], "summarized", f"로컬 추출 요약만 있음 ({reason})")
+
+    # ====== 처리 단계 ======
+
+    def reset_stage(self, uids: Iterable[str]):
+        """처리 단계를 crawled로 초기화 (신규로 발견된 공고)"""
+        now = _now()
+        with self._lock, self.conn:
+            self.conn.executemany(
+                """
+                INSERT INTO item_states (ro_rnd_uid, stage, failed_stage, error, attempts, updated_at)
+                VALUES (?, 'crawled', NULL, NULL, 0, ?)
+                ON CONFLICT(ro_rnd_uid) DO UPDATE SET
+                    stage = 'crawled', failed_stage = NULL, error = NULL, attempts = 0, updated_at = excluded.updated_at
+                """,
+                [(uid, now) for uid in uids if uid]
+            )
+
+    def set_stage(self, uids, stage: str):
+        """
+        단계 완료 기록 (이미 더 뒤 단계까지 끝난 공고는 그대로 두고, 실패 기록은 지움)
+
+        Args:
+            uids: roRndUid 또는 그 목록
+            stage: STAGES 중 하나
+        """
+        if isinstance(uids, str):
+            uids = [uids]
+        order = STAGES.index(stage)
+        now = _now()
+        with self._lock, self.conn:
+            current = self._stages([uid for uid in uids if uid])
+            rows = [(uid, stage, now) for uid in uids
+                    if uid and STAGES.index(current.get(uid, {}).get("stage", "crawled")) <= order]
+            self.conn.executemany(
+                """
+                INSERT INTO item_states (ro_rnd_uid, stage, failed_stage, error, attempts, updated_at)
+                VALUES (?, ?, NULL, NULL, 0, ?)
+                ON CONFLICT(ro_rnd_uid) DO UPDATE SET
+                    stage = excluded.stage, failed_stage = NULL, error = NULL, attempts = 0,
+                    updated_at = excluded.updated_at
+                """,
+                rows
+            )
+
+    def mark_failed(self, uid: str, stage: str, error: str):
+        """단계 실패 기록 (완료 단계는 그대로, 시도 횟수 증가)"""
+        if not uid:
+            return
+        with self._lock, self.conn:
+            self.conn.execute(
+                """
+                INSERT INTO item_states (ro_rnd_uid, stage, failed_stage, error, attempts, updated_at)
+                VALUES (?, 'crawled', ?, ?, 1, ?)
+                ON CONFLICT(ro_rnd_uid) DO UPDATE SET
+                    failed_stage = excluded.failed_stage, error = excluded.error,
+                    attempts = item_states.attempts + 1, updated_at = excluded.updated_at
+                """,
+                (uid, stage, (error or "")[:500], _now())
+            )
+
+    def _stages(self, uids: List[str]) -> Dict[str, Dict]:
+        """처리 단계 조회 (잠금 안에서 호출)"""
+        states = {}
+        for start in range(0, len(uids), 500):
+            chunk = uids[start:start + 500]
+            cursor = self.conn.execute(
+                f"SELECT * FROM item_states WHERE ro_rnd_uid IN ({','.join('?' * len(chunk))})", chunk
+            )
+            states.update({row["ro_rnd_uid"]: dict(row) for row in cursor})
+        return states
+
+    def get_states(self, uids: Iterable[str]) -> Dict[str, Dict]:
+        """roRndUid별 {"stage", "failed_stage", "error", "attempts", "updated_at"} (기록 없으면 빠짐)"""
+        with self._lock:
+            return self._stages([uid for uid in uids if uid])
+
+    def stage_reached(self, uid: str, stage: str) -> bool:
+        """stage 단계까지 끝났는지 여부"""
+        state = self.get_states([uid]).get(uid)
+        return bool(state) and STAGES.index(state["stage"]) >= STAGES.index(stage)
+
+    def failed_announcements(self, crawl_run: Optional[int] = None) -> List[Dict]:
+        """크롤링 실행(기본: 마지막)에서 실패 기록이 남아 있는 공고"""
+        crawl_run = crawl_run or self.latest_run_id()
+        if crawl_run is None:
+            return []
+        return self._query(
+            "a.crawl_run = ? AND a.ro_rnd_uid IN (SELECT ro_rnd_uid FROM item_states WHERE error IS NOT NULL)",
+            (crawl_run,), order="a.rowid"
+        )
+
+    def stage_counts(self, crawl_run: Optional[int] = None) -> Dict[str, int]:
+        """크롤링 실행(기본: 마지막)의 단계별 공고 수와 실패 수"""
+        crawl_run = crawl_run or self.latest_run_id()
+        with self._lock:
+            rows = self.conn.execute(
+                """
+                SELECT COALESCE(st.stage, 'crawled') AS stage, COUNT(*) AS total, COUNT(st.error) AS failed
+                FROM announcements a LEFT JOIN item_states st ON st.ro_rnd_uid = a.ro_rnd_uid
+                WHERE a.crawl_run = ? GROUP BY 1
+                """,
+                (crawl_run,)
+            ).fetchall()
+        counts = {stage: 0 for stage in STAGES}
+        counts["실패"] = 0
+        for row in rows:
+            counts[row["stage"]] = row["total"]
+            counts["실패"] += row["failed"]
+        return counts
+
+    def relevance_corpus(self, limit: int = 5000, exclude_crawl_run: Optional[int] = None) -> List[Dict]:
+        """
+        관련도 모델 학습용 과거 공고 (최근 본 순)
+
+        Returns:
+            [{"uid", "title", "ministry", "front_text", "kept": 요약까지 처리된 공고 여부}]
+        """
+        with self._lock:
+            rows = self.conn.execute(
+                """
+                SELECT a.ro_rnd_uid AS uid, a.title, a.ministry, COALESCE(p.front_text, '') AS front_text,
+                       s.ro_rnd_uid IS NOT NULL AS kept
+                FROM announcements a
+                LEFT JOIN parse_results p ON p.ro_rnd_uid = a.ro_rnd_uid AND p.success = 1
+                LEFT JOIN summaries s ON s.ro_rnd_uid = a.ro_rnd_uid
+                WHERE a.crawl_run IS NOT ? OR a.crawl_run IS NULL
+                ORDER BY a.last_seen DESC, a.rowid DESC LIMIT ?
+                """,
+                (exclude_crawl_run, int(limit))
+            ).fetchall()
+        return [dict(row, kept=bool(row["kept"])) for row in rows]
+
+    # ====== 기존 JSON 가져오기 ======
+
+    def is_empty(self) -> bool:
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM announcements").fetchone()[0] == 0
+
+    def import_legacy(self, old_data_file: str = "output/old_data.json", new_data_file: str = "output/new_data.json",
+                      db_file: str = "data/announcements_db.json") -> Dict:
+        """
+        DB가 비어 있으면 기존 JSON 파일 가져오기
+        - old_data.json: 30개 목록
+        - data/announcements_db.json: roRndUid별 기본정보/사업개요/메타정보 (요약 항목이 채워진 것만 요약으로)
+        - new_data.json: 마지막 신규 공고 (가져오기 실행 번호로 표시, ai_요약 포함)
+        """
+        counts = {"old_data": 0, "announcements_db": 0, "new_data": 0}
+        if not self.is_empty():
+            return counts
+
+        def load(path):
+            if not os.path.exists(path):
+                return None
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except Exception as e:
+                print(f"⚠️ {path} 가져오기 실패: {str(e)}")
+                return None
+
+        old_data = load(old_data_file) or []
+        counts["old_data"] = len(self.upsert_announcements(old_data))
+
+        for uid, record in ((load(db_file) or {}).get("announcements") or {}).items():
+            info = record.get("기본정보", {})
+            announcement = {
+                "공고명": info.get("공고명", ""),
+                "부처명": info.get("부처명", ""),
+                "현황": info.get("현황", ""),
+                "접수일": info.get("접수일", ""),
+                "마감일": info.get("마감일", ""),
+                "상세_URL": info.get("링크", ""),
+                "D_day": info.get("D-day", ""),
+                "순번": info.get("순번")
+            }
+            if not self.upsert_announcements([announcement]):
+                continue
+            counts["announcements_db"] += 1
+            content = record.get("content_summary") or {}
+            fields = {key: content.get(key, "") for key in ("사업목적", "지원내용", "지원규모", "신청대상", "주요특징")}
+            if any(fields.values()):
+                self.upsert_summary(uid, {**fields, "전체요약": content.get("전체요약", "")},
+                                    {"source": "announcements_db"}, record.get("processing_date"))
+
+        new_data = load(new_data_file) or []
+        if new_data:
+            run_id = self.record_crawl_run("기존 new_data.json 가져오기", new_data, new_data)
+            for announcement in new_data:
+                self.save_announcement(announcement)
+                if announcement.get("ai_요약"):
+                    self.set_stage(extract_uid(announcement.get("상세_URL", "")), "summarized")
+            counts["new_data"] = self.count_new(run_id)
+
+        if any(counts.values()):
+            print(f"📥 기존 JSON 데이터 가져오기 완료: {counts}")
+        return counts
+
+    def get_stats(self) -> Dict:
+        """테이블별 행 수"""
+        with self._lock:
+            return {
+                table: self.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                for table in ("announcements", "crawl_runs", "attachments", "parse_results", "summaries", "item_states")
+            }
+
+
+if __name__ == "__main__":
+    # 테스트 코드
+    import tempfile
+
+    print("🧪 공고 저장소 테스트")
+    print("=" * 50)
+
+    store = AnnouncementStore(os.path.join(tempfile.mkdtemp(), "ntis.db"))
+    crawled = [
+        {"현황": "접수중", "공고명": "(AI) 일반형 공동연구", "부처명": "과학기술정보통신부", "접수일": "2025.09.08",
+         "마감일": "2025.09.23", "상세_URL": "https://www.ntis.go.kr/rndgate/eg/un/ra/view.do?roRndUid=1247708&flag=rndList"},
+        {"현황": "마감", "공고명": "AI 해외인재 유치지원", "부처명": "과학기술정보통신부", "접수일": "2025.08.11",
+         "마감일": "2025.09.09", "상세_URL": "https://www.ntis.go.kr/rndgate/eg/un/ra/view.do?roRndUid=1246080&flag=rndList"}
+    ]
+    run_id = store.record_crawl_run("AI", crawled, crawled[:1])
+    store.upsert_attachment("1247708", "output/downloaded_files/공고문.hwp", "success")
+    store.upsert_parse_result("1247708", {"success": True, "full_text": "본문" * 100, "front_text": "사업개요 ..."})
+    store.upsert_summary("1247708", {"사업목적": "국제공동연구 지원", "전체요약": "..."},
+                         {"model": "claude-3-haiku-20240307", "input_tokens": 3185, "output_tokens": 337})
+    store.update_fields("1247708", {"처리상태": "완료"})
+    store.set_stage("1247708", "summarized")
+    store.mark_failed("1247708", "reported", "엑셀 저장 실패")
+    store.set_stage("1247708", "downloaded")  # 이미 지난 단계는 되돌리지 않음
+
+    print(f"신규 공고: {[a['공고명'] for a in store.new_announcements()]} (실행 {run_id})")
+    print(f"요약 포함: {store.new_announcements()[0].get('ai_요약')}")
+    print(f"최근 목록: {[a['접수일'] for a in store.recent_announcements(30)]}")
+    print(f"접수중: {len(store.find_announcements(status='접수중'))}건")
+    print(f"처리 단계: {store.stage_counts()}, 실패 공고: {[a['공고명'] for a in store.failed_announcements()]}")
+    print(f"통계: {store.get_stats()}")
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+기존 공고 변경 추적
+이미 알고 있는 공고가 다시 크롤링되면 저장된 값과 필드별로 비교해 변경 이벤트를 남김
+(현황 변경: 접수중 → 마감, 마감일 연장/단축, 공고명 정정 등)
+- 비교는 필드별 해시로: 행 해시가 같으면 바로 건너뛰고, 다를 때만 어떤 필드가 바뀌었는지 확인
+- 변경 로그와 해시는 공고 저장소와 같은 DB 파일의 change_log / field_hashes 테이블에 보관
+- 다운로드/요약은 다시 하지 않음 (목록 필드만 비교)
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from .announcement import date_sort_key, extract_uid
+
+# 비교할 목록 필드 (한글 키 -> 공고 저장소 컬럼)
+TRACKED_FIELDS = {
+    "현황": "status",
+    "마감일": "end_date",
+    "접수일": "start_date",
+    "공고명": "title",
+    "부처명": "ministry",
+}
+
+# 필드별 변경 이벤트 종류
+CHANGE_TYPES = {
+    "현황": "status_changed",
+    "마감일": "deadline_changed",
+    "공고명": "title_corrected",
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS field_hashes (
+    ro_rnd_uid TEXT PRIMARY KEY,
+    row_hash TEXT NOT NULL,
+    field_hashes TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS change_log (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    ro_rnd_uid TEXT NOT NULL,
+    crawl_run INTEGER,
+    change_type TEXT NOT NULL,
+    field TEXT NOT NULL,
+    old_value TEXT,
+    new_value TEXT,
+    detail TEXT,
+    detected_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_change_log_uid ON change_log(ro_rnd_uid);
+CREATE INDEX IF NOT EXISTS idx_change_log_detected ON change_log(detected_at);
+"""
+
+
+def _hash(value: str) -> str:
+    return hashlib.blake2b((value or "").strip().encode("utf-8"), digest_size=8).hexdigest()
+
+
+def field_hashes(announcement: Dict) -> Dict[str, str]:
+    """추적 필드별 해시"""
+    return {key: _hash(announcement.get(key, "")) for key in TRACKED_FIELDS}
+
+
+def row_hash(hashes: Dict[str, str]) -> str:
+    """필드 해시를 합친 행 해시 (하나라도 바뀌면 달라짐)"""
+    return _hash("|".join(hashes[key] for key in TRACKED_FIELDS))
+
+
+def describe_change(field: str, old: str, new: str) -> str:
+    """변경 내용 설명"""
+    if field == "마감일":
+        old_key, new_key = date_sort_key(old), date_sort_key(new)
+        if old_key and new_key:
+            days = new_key - old_key
+            return f"마감일 {days}일 연장" if days > 0 else f"마감일 {-days}일 단축"
+    return f"{field}: {old} → {new}"
+
+
+class ChangeTracker:
+    """필드 해시 기반 공고 변경 감지 + 변경 로그"""
+
+    def __init__(self, db_path: str = "output/ntis.db"):
+        """
+        초기화
+
+        Args:
+            db_path: 공고 저장소와 같은 DB 파일
+        """
+        self.db_path = db_path
+        if db_path != ":memory:":
+            os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self.conn = sqlite3.connect(db_path, check_same_thread=False, timeout=30)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "ChangeTracker":
+        """환경변수(NTIS_DB_PATH)로 생성"""
+        return cls(db_path=os.getenv("NTIS_DB_PATH", "output/ntis.db"))
+
+    def _stored_hashes(self, uids: List[str]) -> Dict[str, Dict]:
+        """저장된 해시 조회 (해시가 없으면 공고 저장소에 남아 있는 값으로 계산)"""
+        stored = {}
+        for start in range(0, len(uids), 500):
+            chunk = uids[start:start + 500]
+            placeholders = ','.join('?' * len(chunk))
+            for row in self.conn.execute(
+                f"SELECT ro_rnd_uid, row_hash, field_hashes FROM field_hashes WHERE ro_rnd_uid IN ({placeholders})", chunk
+            ):
+                stored[row["ro_rnd_uid"]] = {"row_hash": row["row_hash"], "fields": json.loads(row["field_hashes"])}
+
+            missing = [uid for uid in chunk if uid not in stored]
+            if missing and self._has_store():
+                columns = ", ".join(f"{column} AS \"{key}\"" for key, column in TRACKED_FIELDS.items())
+                for row in self.conn.execute(
+                    f"SELECT ro_rnd_uid, {columns} FROM announcements WHERE ro_rnd_uid IN ({','.join('?' * len(missing))})",
+                    missing
+                ):
+                    hashes = field_hashes(dict(row))
+                    stored[row["ro_rnd_uid"]] = {"row_hash": row_hash(hashes), "fields": hashes}
+        return stored
+
+    def _has_store(self) -> bool:
+        return self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'announcements'"
+        ).fetchone() is not None
+
+    def _stored_values(self, uid: str) -> Dict:
+        """공고 저장소에 남아 있는 변경 전 값"""
+        if not self._has_store():
+            return {}
+        columns = ", ".join(f"{column} AS \"{key}\"" for key, column in TRACKED_FIELDS.items())
+        row = self.conn.execute(f"SELECT {columns} FROM announcements WHERE ro_rnd_uid = ?", (uid,)).fetchone()
+        return dict(row) if row else {}
+
+    def detect(self, crawled: Iterable[Dict]) -> Dict:
+        """
+        크롤링 결과를 저장된 값과 비교 (공고 저장소에 반영하기 전에 호출)
+
+        Returns:
+            {"events": [{"uid", "type", "field", "old", "new", "detail", "공고명"}],
+             "hashes": {uid: {"row_hash", "fields"}}, "compared": 비교한 기존 공고 수, "unchanged": 변경 없는 수}
+        """
+        rows = [(extract_uid(item.get("상세_URL", "")), item) for item in crawled]
+        rows = [(uid, item) for uid, item in rows if uid]
+        with self._lock:
+            stored = self._stored_hashes(list(dict.fromkeys(uid for uid, _ in rows)))
+
+            events, hashes, compared, unchanged = [], {}, 0, 0
+            for uid, item in rows:
+                current = field_hashes(item)
+                current_row = row_hash(current)
+                hashes[uid] = {"row_hash": current_row, "fields": current}
+                previous = stored.get(uid)
+                if previous is None:
+                    continue
+                compared += 1
+                if previous["row_hash"] == current_row:
+                    unchanged += 1
+                    continue
+
+                old_values = self._stored_values(uid)
+                for key in TRACKED_FIELDS:
+                    if previous["fields"].get(key) == current[key]:
+                        continue
+                    old, new = old_values.get(key, ""), item.get(key, "")
+                    events.append({
+                        "uid": uid,
+                        "type": CHANGE_TYPES.get(key, "field_changed"),
+                        "field": key,
+                        "old": old,
+                        "new": new,
+                        "detail": describe_change(key, old, new),
+                        "공고명": item.get("공고명", "")
+                    })
+                # 같은 실행에서 같은 공고가 다시 나오면 방금 본 값과 비교
+                stored[uid] = hashes[uid]
+        return {"events": events, "hashes": hashes, "compared": compared, "unchanged": unchanged}
+
+    def commit(self, detection: Dict, crawl_run: Optional[int] = None) -> int:
+        """감지 결과를 변경 로그에 기록하고 해시 갱신, 기록한 이벤트 수 반환"""
+        now = datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
+        with self._lock, self.conn:
+            self.conn.executemany(
+                """
+                INSERT INTO change_log (ro_rnd_uid, crawl_run, change_type, field, old_value, new_value, detail, detected_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                [(event["uid"], crawl_run, event["type"], event["field"], event["old"], event["new"],
+                  event["detail"], now) for event in detection["events"]]
+            )
+            self.conn.executemany(
+                """
+                INSERT INTO field_hashes (ro_rnd_uid, row_hash, field_hashes, updated_at) VALUES (?, ?, ?, ?)
+                ON CONFLICT(ro_rnd_uid) DO UPDATE SET
+                    row_hash = excluded.row_hash, field_hashes = excluded.field_hashes, updated_at = excluded.updated_at
+                """,
+                [(uid, value["row_hash"], json.dumps(value["fields"]), now) for uid, value in detection["hashes"].items()]
+            )
+        return len(detection["events"])
+
+    def recent_changes(self, limit: int = 100, crawl_run: Optional[int] = None,
+                       change_type: Optional[str] = None) -> List[Dict]:
+        """최근 변경 이벤트 (최신순)"""
+        clauses, params = [], []
+        if crawl_run is not None:
+            clauses.append("crawl_run = ?")
+            params.append(crawl_run)
+        if change_type:
+            clauses.append("change_type = ?")
+            params.append(change_type)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            rows = self.conn.execute(
+                f"SELECT * FROM change_log {where} ORDER BY id DESC LIMIT ?", (*params, limit)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def history(self, uid: str) -> List[Dict]:
+        """공고 1건의 변경 이력 (오래된 순)"""
+        with self._lock:
+            rows = self.conn.execute("SELECT * FROM change_log WHERE ro_rnd_uid = ? ORDER BY id", (uid,)).fetchall()
+        return [dict(row) for row in rows]
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+
+if __name__ == "__main__":
+    # 테스트 코드
+    import tempfile
+    import time
+
+    from .announcement_store import AnnouncementStore
+
+    print("🧪 공고 변경 추적 테스트")
+    print("=" * 50)
+
+    db_path = os.path.join(tempfile.mkdtemp(), "ntis.db")
+    store = AnnouncementStore(db_path)
+    url = "https://www.ntis.go.kr/rndgate/eg/un/ra/view.do?roRndUid={}&flag=rndList"
+    first = [
+        {"현황": "접수중", "공고명": "(AI) 일반형 공동연구", "부처명": "과학기술정보통신부",
+         "접수일": "2025.09.01", "마감일": "2025.09.23", "상세_URL": url.format(1247708)},
+        {"현황": "접수중", "공고명": "2025년 수소 핵심기술 개발", "부처명": "산업통상자원부",
+         "접수일": "2025.08.20", "마감일": "2025.09.09", "상세_URL": url.format(1246080)},
+    ]
+    store.record_crawl_run("AI", first, first)  # 해시 없이 저장된 기존 공고
+
+    tracker = ChangeTracker(db_path)
+    second = [dict(first[0], 마감일="2025.09.30"), dict(first[1], 현황="마감", 공고명="2025년 수소 핵심기술 개발 (정정)")]
+    detection = tracker.detect(second)
+    run_id = store.record_crawl_run("AI", second, [])
+    tracker.commit(detection, crawl_run=run_id)
+    for event in detection["events"]:
+        print(f"   [{event['type']}] {event['공고명'][:20]} - {event['detail']}")
+    print(f"다시 비교: {len(tracker.detect(second)['events'])}건 변경")
+
+    rows = [dict(first[0], 상세_URL=url.format(2_000_000 + i), 마감일=f"2025.10.{i % 28 + 1:02d}") for i in range(20000)]
+    tracker.commit(tracker.detect(rows))
+    rows[::100] = [dict(row, 현황="마감") for row in rows[::100]]
+    start = time.perf_counter()
+    detection = tracker.detect(rows)
+    print(f"2만 건 비교: {(time.perf_counter() - start) * 1000:.0f}ms (변경 {len(detection['events'])}건, 변경 없음 {detection['unchanged']}건)")
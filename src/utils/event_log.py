@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+추가 전용 이벤트 로그 (스냅샷 + JSONL)
+상태 파일 전체를 매번 다시 쓰는 대신 변경분만 한 줄씩 덧붙이고, 읽을 때는 스냅샷에 로그를 재생해 현재 상태를 만듦
+- 쓰기: 변경 1건 = JSONL 1줄 (fsync는 N건 또는 일정 시간마다 묶어서)
+- 읽기: 스냅샷 상태 + 스냅샷 이후 이벤트 (마지막 줄이 쓰다 만 줄이면 무시)
+- 압축: 로그가 길어지면 백그라운드에서 스냅샷 작성(임시 파일 후 교체) 뒤 반영된 이벤트를 로그에서 제거
+이벤트마다 일련번호(seq)를 붙이고 스냅샷에 마지막 번호를 남기므로, 압축 도중 중단되어도 이벤트가 두 번 반영되지 않음
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+# 스냅샷 파일 안에서 일련번호를 담는 키 (이 키가 없으면 예전 형식의 통째 JSON으로 보고 그대로 상태로 사용)
+SNAPSHOT_SEQ_KEY = "_event_log_seq"
+
+
+class EventLog:
+    """스냅샷 파일 + 추가 전용 JSONL 로그"""
+
+    def __init__(self, snapshot_file: str, fsync_every: int = 64, fsync_interval: float = 1.0,
+                 compact_every: int = 1000):
+        """
+        초기화
+
+        Args:
+            snapshot_file: 스냅샷(현재 상태) 파일, 로그는 같은 위치의 .log.jsonl 파일
+            fsync_every: 이만큼 이벤트가 쌓이면 fsync (1이면 매 이벤트)
+            fsync_interval: 마지막 fsync 후 이 시간(초)이 지나면 다음 이벤트에서 fsync
+            compact_every: 스냅샷 이후 이벤트가 이만큼 쌓이면 압축 필요
+        """
+        self.snapshot_file = snapshot_file
+        self.log_file = f"{os.path.splitext(snapshot_file)[0]}.log.jsonl"
+        self.fsync_every = max(1, fsync_every)
+        self.fsync_interval = fsync_interval
+        self.compact_every = compact_every
+
+        self.seq = None             # 마지막으로 기록한 이벤트 번호 (read() 또는 첫 append 때 결정)
+        self.snapshot_seq = 0       # 스냅샷에 반영된 마지막 이벤트 번호
+        self._handle = None
+        self._pending = 0           # fsync되지 않은 이벤트 수
+        self._last_sync = time.monotonic()
+        self._lock = threading.Lock()
+        self._compactor = None
+        self.stats = {"이벤트": 0, "fsync": 0, "압축": 0}
+        atexit.register(self.close)
+
+    @classmethod
+    def from_env(cls, snapshot_file: str) -> "EventLog":
+        """환경변수(EVENT_LOG_FSYNC_EVERY, EVENT_LOG_FSYNC_INTERVAL, EVENT_LOG_COMPACT_EVERY)로 생성"""
+        return cls(
+            snapshot_file,
+            fsync_every=int(os.getenv("EVENT_LOG_FSYNC_EVERY", "64")),
+            fsync_interval=float(os.getenv("EVENT_LOG_FSYNC_INTERVAL", "1.0")),
+            compact_every=int(os.getenv("EVENT_LOG_COMPACT_EVERY", "1000"))
+        )
+
+    # ====== 읽기 ======
+
+    def _read_snapshot(self) -> Tuple[Optional[object], int]:
+        if not os.path.exists(self.snapshot_file):
+            return None, 0
+        with open(self.snapshot_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if isinstance(data, dict) and SNAPSHOT_SEQ_KEY in data:
+            return data.get("state"), data[SNAPSHOT_SEQ_KEY]
+        return data, 0
+
+    def _read_events(self, after_seq: int) -> List[Dict]:
+        events = []
+        if not os.path.exists(self.log_file):
+            return events
+        with open(self.log_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    event = json.loads(line)
+                except json.JSONDecodeError:
+                    # 기록 중 중단된 마지막 줄
+                    continue
+                if event.get("seq", 0) > after_seq:
+                    events.append(event)
+        return events
+
+    def read(self) -> Tuple[Optional[object], List[Dict]]:
+        """
+        스냅샷 상태와 그 이후 이벤트 목록 반환
+
+        Returns:
+            (스냅샷 상태 또는 None, [{"seq", "op", ...}, ...])
+        """
+        with self._lock:
+            state, snapshot_seq = self._read_snapshot()
+            events = self._read_events(snapshot_seq)
+            self.snapshot_seq = snapshot_seq
+            self.seq = max([snapshot_seq] + [event["seq"] for event in events])
+            return state, events
+
+    # ====== 쓰기 ======
+
+    def append(self, event: Dict) -> int:
+        """이벤트 1건 추가 후 일련번호 반환 (호출 측 잠금 안에서 부르면 상태 변경 순서와 로그 순서가 같음)"""
+        with self._lock:
+            if self.seq is None:
+                _, snapshot_seq = self._read_snapshot()
+                self.snapshot_seq = snapshot_seq
+                self.seq = max([snapshot_seq] + [e["seq"] for e in self._read_events(snapshot_seq)])
+            if self._handle is None:
+                os.makedirs(os.path.dirname(self.log_file) or ".", exist_ok=True)
+                torn = False
+                if os.path.exists(self.log_file) and os.path.getsize(self.log_file) > 0:
+                    with open(self.log_file, 'rb') as f:
+                        f.seek(-1, os.SEEK_END)
+                        torn = f.read(1) != b"\n"
+                self._handle = open(self.log_file, 'a', encoding='utf-8')
+                if torn:
+                    # 쓰다 만 마지막 줄 뒤에 이어 쓰지 않도록 줄바꿈 보정
+                    self._handle.write("\n")
+            self.seq += 1
+            self._handle.write(json.dumps({"seq": self.seq, **event}, ensure_ascii=False) + "\n")
+            self._handle.flush()
+            self._pending += 1
+            self.stats["이벤트"] += 1
+            if self._pending >= self.fsync_every or time.monotonic() - self._last_sync >= self.fsync_interval:
+                self._fsync()
+            return self.seq
+
+    def _fsync(self):
+        if self._handle is not None and self._pending:
+            os.fsync(self._handle.fileno())
+            self.stats["fsync"] += 1
+        self._pending = 0
+        self._last_sync = time.monotonic()
+
+    def sync(self):
+        """쌓인 이벤트를 디스크에 확정"""
+        with self._lock:
+            self._fsync()
+
+    @property
+    def needs_compaction(self) -> bool:
+        return self.seq is not None and self.seq - self.snapshot_seq >= self.compact_every
+
+    # ====== 압축 ======
+
+    def compact(self, snapshot_fn: Callable[[], Tuple[object, int]]):
+        """
+        스냅샷 작성 후 반영된 이벤트를 로그에서 제거
+
+        Args:
+            snapshot_fn: (현재 상태, 그 상태에 반영된 마지막 seq)를 돌려주는 함수
+                         (호출 측 잠금 안에서 상태 복사와 self.seq 읽기를 함께 해야 함)
+        """
+        state, seq = snapshot_fn()
+        os.makedirs(os.path.dirname(self.snapshot_file) or ".", exist_ok=True)
+        temp_file = f"{self.snapshot_file}.tmp"
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump({SNAPSHOT_SEQ_KEY: seq, "state": state}, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_file, self.snapshot_file)
+
+        # 스냅샷 이후에 들어온 이벤트만 남긴 로그로 교체 (교체하는 동안 추가는 대기)
+        with self._lock:
+            self._fsync()
+            remaining = self._read_events(seq)
+            temp_log = f"{self.log_file}.tmp"
+            with open(temp_log, 'w', encoding='utf-8') as f:
+                for event in remaining:
+                    f.write(json.dumps(event, ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+            os.replace(temp_log, self.log_file)
+            self.snapshot_seq = seq
+            self.stats["압축"] += 1
+
+    def compact_async(self, snapshot_fn: Callable[[], Tuple[object, int]]):
+        """백그라운드 스레드에서 압축 (이미 진행 중이면 건너뜀)"""
+        with self._lock:
+            if self._compactor is not None and self._compactor.is_alive():
+                return
+            self._compactor = threading.Thread(target=self._compact_quietly, args=(snapshot_fn,), daemon=True)
+            self._compactor.start()
+
+    def _compact_quietly(self, snapshot_fn):
+        try:
+            self.compact(snapshot_fn)
+        except Exception as e:
+            print(f"⚠️ 로그 압축 실패 ({self.snapshot_file}): {str(e)}")
+
+    def wait_compaction(self):
+        compactor = self._compactor
+        if compactor is not None:
+            compactor.join()
+
+    def close(self):
+        """진행 중인 압축을 기다리고 로그 파일 닫기"""
+        self.wait_compaction()
+        with self._lock:
+            self._fsync()
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+
+    def get_stats(self) -> Dict:
+        return {"로그_이벤트": (self.seq or 0) - self.snapshot_seq, **self.stats}
+
+
+if __name__ == "__main__":
+    # 테스트 코드
+    import tempfile
+
+    print("🧪 이벤트 로그 테스트")
+    print("=" * 50)
+
+    snapshot_file = os.path.join(tempfile.mkdtemp(), "state.json")
+    state_lock = threading.Lock()
+    counters = {}
+    log = EventLog(snapshot_file, fsync_every=100, compact_every=5000)
+
+    def snapshot():
+        with state_lock:
+            return dict(counters), log.seq
+
+    start = time.perf_counter()
+    for i in range(20000):
+        with state_lock:
+            key = f"k{i % 500}"
+            counters[key] = counters.get(key, 0) + 1
+            log.append({"op": "incr", "key": key})
+        if log.needs_compaction:
+            log.compact_async(snapshot)
+    log.close()
+    elapsed = time.perf_counter() - start
+    print(f"2만 건 추가: {elapsed:.2f}초 ({elapsed / 20000 * 1e6:.0f}µs/건), {log.get_stats()}")
+
+    # 쓰다 만 줄이 있어도 재생 가능
+    with open(log.log_file, 'a', encoding='utf-8') as f:
+        f.write('{"seq": 99999999, "op": "in')
+    reopened = EventLog(snapshot_file)
+    state, events = reopened.read()
+    rebuilt = dict(state or {})
+    for event in events:
+        rebuilt[event["key"]] = rebuilt.get(event["key"], 0) + 1
+    print(f"재생 결과 일치: {rebuilt == counters} (스냅샷 {len(state or {})}키 + 이벤트 {len(events)}건)")
+
+    reopened.append({"op": "incr", "key": "k0"})
+    reopened.close()
+    print(f"중단된 줄 뒤 추가 후 이벤트: {len(EventLog(snapshot_file).read()[1])}건")
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+공고문 유사 중복 탐지 인덱스 (MinHash + LSH)
+재공고/정정공고/세부트랙 공고처럼 본문이 거의 같은 공고를 찾아 기존 요약을 재사용
+- 공백을 제거한 글자 n-gram(shingle) 집합의 MinHash 서명으로 Jaccard 유사도 추정
+- 서명을 band 단위로 버킷에 넣어 후보만 비교 (이력이 늘어나도 조회 비용이 거의 일정)
+- 본문이 비슷해도 금액이 바뀌었거나 요약에 적힌 날짜가 본문에서 사라진 정정공고는 이전 요약을 쓰지 않음
+"""
+
+import json
+import os
+import random
+import re
+import threading
+import zlib
+from datetime import datetime
+from typing import Dict, List, Optional
+
+# MinHash 해시 함수 계수용 메르센 소수 (2^61 - 1)
+_MERSENNE_PRIME = (1 << 61) - 1
+
+# 요약 재사용 전에 비교하는 금액/날짜 표현
+_AMOUNT_PATTERN = re.compile(r'\d[\d,]*(?:\.\d+)?\s*(?:조|억|천만|백만|만)?\s*원')
+_DATE_PATTERN = re.compile(r'\d{4}\s*[.\-년]\s*\d{1,2}\s*[.\-월]\s*\d{1,2}')
+
+
+def extract_amounts(text: str) -> List[str]:
+    """금액 표현 목록 (공백 제거, 중복 제거 후 정렬)"""
+    return sorted({re.sub(r'\s+', '', match) for match in _AMOUNT_PATTERN.findall(text or "")})
+
+
+def extract_dates(text: str) -> List[str]:
+    """날짜 표현 목록 (숫자만 남겨 2025.09.01과 2025년 9월 1일을 같게 취급)"""
+    return sorted({"-".join(str(int(part)) for part in re.findall(r'\d+', match))
+                   for match in _DATE_PATTERN.findall(text or "")})
+
+
+class NearDuplicateIndex:
+    """MinHash/LSH 기반 유사 공고 인덱스"""
+
+    def __init__(self, index_file: str = "output/near_duplicate_index.json", num_perm: int = 128,
+                 bands: int = 32, threshold: float = 0.85, shingle_size: int = 5):
+        """
+        초기화
+
+        Args:
+            index_file: 인덱스 저장 파일
+            num_perm: MinHash 서명 길이
+            bands: LSH band 수 (num_perm은 bands의 배수여야 함)
+            threshold: 요약을 재사용할 최소 추정 Jaccard 유사도
+            shingle_size: 글자 n-gram 크기
+        """
+        if num_perm % bands != 0:
+            raise ValueError("num_perm은 bands의 배수여야 합니다")
+
+        self.index_file = index_file
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+
+        # 실행마다 같은 서명이 나오도록 고정 시드로 해시 계수 생성
+        rng = random.Random(20250905)
+        self._perms = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+            for _ in range(num_perm)
+        ]
+
+        self.entries = {}  # uid -> {"signature", "amounts", "title", "summary", "metadata", "added_at"}
+        self.buckets = {}  # band 키 -> [uid, ...]
+        self._loaded = False
+        self._dirty = False
+        self._lock = threading.RLock()
+
+    def _shingles(self, text: str) -> set:
+        """공백 제거 후 글자 n-gram 해시 집합"""
+        compact = re.sub(r'\s+', '', text or "")
+        size = self.shingle_size
+        if len(compact) < size:
+            return {zlib.crc32(compact.encode('utf-8'))} if compact else set()
+        return {
+            zlib.crc32(compact[i:i + size].encode('utf-8'))
+            for i in range(len(compact) - size + 1)
+        }
+
+    def signature(self, text: str) -> List[int]:
+        """MinHash 서명 계산"""
+        hashes = self._shingles(text)
+        if not hashes:
+            return []
+        return [
+            min((a * h + b) % _MERSENNE_PRIME for h in hashes)
+            for a, b in self._perms
+        ]
+
+    def _band_keys(self, signature: List[int]) -> List[str]:
+        """서명을 band로 나눈 버킷 키 목록"""
+        keys = []
+        for band in range(self.bands):
+            chunk = signature[band * self.rows:(band + 1) * self.rows]
+            keys.append(f"{band}:{zlib.crc32(repr(chunk).encode('ascii')):08x}")
+        return keys
+
+    @staticmethod
+    def estimate_similarity(sig_a: List[int], sig_b: List[int]) -> float:
+        """두 서명의 추정 Jaccard 유사도"""
+        if not sig_a or len(sig_a) != len(sig_b):
+            return 0.0
+        return sum(1 for a, b in zip(sig_a, sig_b) if a == b) / len(sig_a)
+
+    def load(self):
+        """저장된 인덱스 로드 (프로세스당 한 번)"""
+        with self._lock:
+            if self._loaded:
+                return
+            self._loaded = True
+            if not os.path.exists(self.index_file):
+                return
+            try:
+                with open(self.index_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except Exception as e:
+                print(f"⚠️ 유사 공고 인덱스 로드 실패: {str(e)}")
+                return
+            if data.get("num_perm") != self.num_perm or data.get("shingle_size") != self.shingle_size:
+                print("⚠️ 유사 공고 인덱스 설정이 달라 새로 만듭니다.")
+                return
+            for uid, entry in data.get("entries", {}).items():
+                self._insert(uid, entry)
+            print(f"📂 유사 공고 인덱스 로드: {len(self.entries)}건")
+
+    def save(self):
+        """변경된 인덱스를 파일로 저장 (임시 파일 작성 후 교체)"""
+        with self._lock:
+            if not self._dirty:
+                return
+            os.makedirs(os.path.dirname(self.index_file) or ".", exist_ok=True)
+            temp_file = f"{self.index_file}.tmp"
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump({
+                    "num_perm": self.num_perm,
+                    "shingle_size": self.shingle_size,
+                    "entries": self.entries
+                }, f, ensure_ascii=False)
+            os.replace(temp_file, self.index_file)
+            self._dirty = False
+            print(f"💾 유사 공고 인덱스 저장: {len(self.entries)}건")
+
+    def _insert(self, uid: str, entry: Dict):
+        """메모리 인덱스에 항목 추가 (기존 버킷 정리 포함)"""
+        if uid in self.entries:
+            for key in self._band_keys(self.entries[uid]["signature"]):
+                bucket = self.buckets.get(key, [])
+                if uid in bucket:
+                    bucket.remove(uid)
+        self.entries[uid] = entry
+        for key in self._band_keys(entry["signature"]):
+            self.buckets.setdefault(key, []).append(uid)
+
+    def add(self, uid: str, text: str, summary: Dict, title: str = "", metadata: Optional[Dict] = None):
+        """요약이 끝난 공고를 인덱스에 추가"""
+        signature = self.signature(text)
+        if not uid or not signature:
+            return
+        self.load()
+        with self._lock:
+            self._insert(uid, {
+                "signature": signature,
+                "amounts": extract_amounts(text),
+                "title": title,
+                "summary": summary,
+                "metadata": metadata or {},
+                "added_at": datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
+            })
+            self._dirty = True
+
+    @staticmethod
+    def _facts_match(entry: Dict, amounts: List[str], dates: set) -> bool:
+        """기존 요약을 그대로 써도 되는지 (본문 금액이 같고, 요약에 적힌 날짜가 새 본문에도 있음)"""
+        if entry.get("amounts") != amounts:
+            return False
+        summary_text = " ".join(str(value) for value in (entry.get("summary") or {}).values())
+        return set(extract_dates(summary_text)) <= dates
+
+    def find_similar(self, text: str, exclude_uid: str = "") -> Optional[Dict]:
+        """
+        임계값 이상으로 유사한 기존 공고 중 가장 비슷한 것 반환
+        본문 금액이 다르거나 요약에 적힌 날짜가 본문에 없는 공고(정정공고 등), 금액 기록이 없는 이전 버전 항목은 제외
+
+        Returns:
+            {"uid", "similarity", "title", "summary", "metadata"} 또는 None
+        """
+        signature = self.signature(text)
+        if not signature:
+            return None
+        amounts = extract_amounts(text)
+        dates = set(extract_dates(text))
+        self.load()
+
+        with self._lock:
+            candidates = set()
+            for key in self._band_keys(signature):
+                candidates.update(self.buckets.get(key, []))
+            candidates.discard(exclude_uid)
+
+            best_uid, best_similarity = None, 0.0
+            for uid in candidates:
+                similarity = self.estimate_similarity(signature, self.entries[uid]["signature"])
+                if similarity < self.threshold or similarity <= best_similarity:
+                    continue
+                if not self._facts_match(self.entries[uid], amounts, dates):
+                    print(f"   ↪️ 유사 공고(UID {uid})와 금액/날짜가 달라 요약 재사용 안 함")
+                    continue
+                best_uid, best_similarity = uid, similarity
+
+            if best_uid is None or best_similarity < self.threshold:
+                return None
+
+            entry = self.entries[best_uid]
+            return {
+                "uid": best_uid,
+                "similarity": best_similarity,
+                "title": entry.get("title", ""),
+                "summary": entry["summary"],
+                "metadata": entry.get("metadata", {})
+            }
+
+
+if __name__ == "__main__":
+    # 테스트 코드
+    import tempfile
+    import time
+
+    print("🧪 유사 공고 인덱스 테스트")
+    print("=" * 50)
+
+    base = "\n".join(
+        f"{i}. 본 사업은 AI 기술의 해외 우수 인재를 국내로 유치하여 {i}번째 분야의 기술 경쟁력을 강화하고자 하며, "
+        f"연구개발비 {i * 3}억원과 정착지원금 {i}천만원을 지원합니다."
+        for i in range(1, 21)
+    )
+    reissued = base.replace("20번째 분야", "20번째 세부 분야") + "\n※ 재공고: 접수기간 2025.09.01 ~ 2025.09.30"
+    unrelated = ("스마트팩토리 고도화를 위한 제조 데이터 플랫폼 구축 사업으로 중소기업의 공정 데이터 수집과 "
+                 "분석 인프라를 지원합니다. 과제당 연 3억원 내외, 2년간 지원합니다. ")
+
+    index = NearDuplicateIndex(index_file=os.path.join(tempfile.mkdtemp(), "index.json"))
+    index.add("1246080", base, {"사업목적": "AI 해외인재 유치"}, title="최고급 AI 해외인재 유치지원 사업")
+
+    # 관련 없는 공고 다수 추가 (조회 비용 확인용)
+    for i in range(200):
+        index.add(str(i), f"세부과제 {i}번: " + unrelated * (i % 7 + 1), {"사업목적": f"기타 {i}"})
+
+    started = time.perf_counter()
+    match = index.find_similar(reissued, exclude_uid="9999999")
+    elapsed = (time.perf_counter() - started) * 1000
+    if match:
+        print(f"재공고 → {match['uid']} (유사도 {match['similarity']:.2f}, {elapsed:.1f}ms)")
+    new_program = ("양자컴퓨팅 소자 원천기술 개발 사업으로 초전도 큐비트 제작 공정과 오류정정 알고리즘 연구를 "
+                   "지원합니다. 대학 및 출연연 대상, 과제당 연 10억원.")
+    print(f"무관한 공고 → {index.find_similar(new_program)}")
+    corrected = reissued.replace("연구개발비 60억원", "연구개발비 45억원")
+    print(f"금액 정정 공고 → {index.find_similar(corrected)}")
+
+    index.save()
+    reloaded = NearDuplicateIndex(index_file=index.index_file)
+    print(f"재로드 후 조회: {reloaded.find_similar(reissued)['uid']}")
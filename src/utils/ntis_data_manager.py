@@ -1,22 +1,27 @@
 """
 NTIS 공고 데이터 관리자
-- 30개 고정 크기 유지
-- 새로운 데이터와 기존 데이터 비교
+- 표시용 목록은 30개 고정 크기 유지
+- 신규 판정은 기간 제한 없는 처리 이력 색인(SeenUidIndex) 기준
 - 상세 크롤링 상태 관리
+- 관리 데이터는 프로세스당 한 번만 읽는 메모리 저장소(AnnouncementRepository)로 조회/갱신
 """
 
-import json
-import os
-import re
 from datetime import datetime
 from typing import List, Dict, Optional, Tuple
 
+from .announcement import date_sort_key, extract_uid
+from .announcement_repository import AnnouncementRepository
+from .seen_index import SeenUidIndex
+
 class NTISDataManager:
     """NTIS 공고 데이터를 관리하는 클래스"""
     
-    def __init__(self, json_file_path: str = "output/ntis_managed_data.json"):
+    def __init__(self, json_file_path: str = "output/ntis_managed_data.json",
+                 seen_index: Optional[SeenUidIndex] = None):
         self.json_file_path = json_file_path
-        self.max_items = 30  # 최대 30개 유지
+        self.max_items = 30  # 표시용 목록 최대 30개 유지
+        self.seen_index = seen_index if seen_index is not None else SeenUidIndex.from_env()  # 처리 이력 (30개 목록과 별개)
+        self.repository = AnnouncementRepository.shared(json_file_path)  # uid/날짜 색인 (파일은 한 번만 로드)
         self.data_structure = {
             "last_updated": "",
             "search_keyword": "",
@@ -24,46 +29,21 @@ class NTISDataManager:
             "announcements": []
         }
     
-    def extract_uid_from_url(self, url: str) -> str:
-        """상세_URL에서 roRndUid 추출"""
-        try:
-            # roRndUid=숫자 패턴 찾기
-            match = re.search(r'roRndUid=(\d+)', url)
-            if match:
-                return match.group(1)
-            else:
-                return ""
-        except Exception:
-            return ""
-    
     def load_existing_data(self) -> Dict:
-        """기존 JSON 데이터 로드"""
-        try:
-            if os.path.exists(self.json_file_path):
-                with open(self.json_file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    print(f"✅ 기존 데이터 로드: {len(data.get('announcements', []))}개")
-                    return data
-            else:
-                print("📄 기존 데이터 없음, 새로 시작")
-                return self.data_structure.copy()
-        except Exception as e:
-            print(f"❌ 데이터 로드 실패: {str(e)}")
-            return self.data_structure.copy()
+        """기존 데이터 (메모리 저장소 기준, 파일은 처음 한 번만 읽음)"""
+        if not len(self.repository):
+            return {**self.data_structure, **self.repository.meta, "announcements": []}
+        return self.repository.to_data()
     
     def save_data(self, data: Dict) -> bool:
-        """데이터를 JSON 파일로 저장"""
+        """데이터를 저장소에 반영하고 JSON 파일로 저장"""
         try:
-            # output 폴더 생성
-            os.makedirs(os.path.dirname(self.json_file_path), exist_ok=True)
-            
             # 타임스탬프 업데이트
             data["last_updated"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             
-            with open(self.json_file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-            
-            print(f"💾 데이터 저장 완료: {self.json_file_path}")
+            meta = {key: value for key, value in data.items() if key != "announcements"}
+            self.repository.replace_all(data.get("announcements", []), meta=meta)
+            self.repository.flush()
             return True
         except Exception as e:
             print(f"❌ 데이터 저장 실패: {str(e)}")
@@ -73,18 +53,8 @@ class NTISDataManager:
         """새 데이터와 기존 데이터를 비교하여 신규 항목 찾기"""
         print(f"\n🔍 데이터 비교 시작 (키워드: {keyword})")
         
-        # 기존 데이터 로드
-        existing_data = self.load_existing_data()
-        existing_announcements = existing_data.get("announcements", [])
-        
-        # 기존 공고 UID들 추출 (roRndUid 기준)
-        existing_uids = set()
-        for item in existing_announcements:
-            uid = self.extract_uid_from_url(item.get("상세_URL", ""))
-            if uid:
-                existing_uids.add(uid)
-        
-        print(f"   📊 기존 데이터: {len(existing_uids)}개")
+        # 기존 공고는 저장소의 uid 색인으로 바로 확인 (파일 재로드 없음)
+        print(f"   📊 기존 데이터: {len(self.repository)}개 (처리 이력 {len(self.seen_index)}개)")
         print(f"   📊 새 데이터: {len(new_crawled_data)}개")
         
         # 신규 항목과 기존 항목 분류
@@ -92,7 +62,7 @@ class NTISDataManager:
         existing_items = []
         
         for item in new_crawled_data:
-            item_uid = self.extract_uid_from_url(item.get("상세_URL", ""))
+            item_uid = extract_uid(item.get("상세_URL", ""))
             
             # 데이터 구조 표준화
             standardized_item = {
@@ -109,7 +79,8 @@ class NTISDataManager:
                 "detail_data": {}
             }
             
-            if item_uid and item_uid not in existing_uids:
+            # 30개 목록에서 밀려난 공고라도 처리 이력에 있으면 기존 항목
+            if item_uid and item_uid not in self.repository and item_uid not in self.seen_index:
                 new_items.append(standardized_item)
                 print(f"   🆕 신규 발견: [UID:{item_uid}] {item.get('공고명', '')[:50]}...")
             else:
@@ -123,24 +94,18 @@ class NTISDataManager:
         """새 항목을 추가하고 30개로 제한하여 데이터 업데이트"""
         print(f"\n📝 데이터 업데이트 시작")
         
-        # 기존 데이터 로드
-        existing_data = self.load_existing_data()
-        
         # 전체 현재 항목들을 최신 순으로 정렬 (접수일 기준 내림차순)
         try:
-            # 접수일 형태: "2025.09.08" -> datetime 객체로 변환하여 정렬
-            def parse_date(date_str):
-                try:
-                    return datetime.strptime(date_str, "%Y.%m.%d")
-                except:
-                    return datetime.min  # 파싱 실패시 가장 오래된 날짜로 처리
-            
-            all_current_items.sort(key=lambda x: parse_date(x.get("접수일", "")), reverse=True)
+            # 접수일 형태: "2025.09.08" (파싱 실패시 가장 오래된 날짜로 처리)
+            all_current_items.sort(key=lambda x: date_sort_key(x.get("접수일", "")), reverse=True)
             print(f"   📅 접수일 기준 정렬 완료 (최신순)")
         except Exception as e:
             print(f"   ⚠️ 접수일 정렬 실패, 원본 순서 유지: {str(e)}")
             # 접수일 정렬이 실패하면 원본 순서 유지
         
+        # 처리 이력에는 목록에서 밀려날 항목까지 모두 기록
+        self.seen_index.add_many(extract_uid(item.get("상세_URL", "")) for item in all_current_items)
+        
         # 최신 30개만 유지
         final_items = all_current_items[:self.max_items]
         
@@ -176,17 +141,37 @@ class NTISDataManager:
         return items_to_crawl
     
     def mark_as_detailed(self, data: Dict, 순번: str, detail_data: Dict) -> Dict:
-        """특정 항목을 상세 크롤링 완료로 마크"""
+        """
+        특정 항목을 상세 크롤링 완료로 마크 (넘겨받은 data와 저장소를 함께 갱신, 파일 저장은 모아서 한 번에)
+        순번에는 data 항목의 순번 또는 roRndUid를 넘길 수 있음 (순번이면 그 항목의 상세_URL로 uid 확인)
+        """
+        detailed_fields = {
+            "is_detailed": True,
+            "detail_data": detail_data,
+            "detail_crawled_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        }
+        
+        uid = 순번
+        marked = None
         for item in data.get("announcements", []):
-            if item.get("순번") == 순번:
-                item["is_detailed"] = True
-                item["detail_data"] = detail_data
-                item["detail_crawled_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                print(f"✅ 상세 크롤링 완료 마크: [{순번}] {item.get('공고명', '')[:30]}...")
+            item_uid = extract_uid(item.get("상세_URL", ""))
+            if (item.get("순번") and item.get("순번") == 순번) or item_uid == 순번:
+                # 이후 save_data(data)가 저장소를 data로 교체해도 마크가 남도록 data도 직접 갱신
+                item.update(detailed_fields)
+                uid = item_uid or 순번
+                marked = item.get("공고명", "")
                 break
         
+        if self.repository.update(uid, detailed_fields):
+            marked = self.repository.get(uid).title
+        if marked is not None:
+            print(f"✅ 상세 크롤링 완료 마크: [UID:{uid}] {marked[:30]}...")
         return data
     
+    def closing_soon(self, days: int = 7) -> List[Dict]:
+        """days일 안에 마감되는 공고 (마감일 색인 범위 조회)"""
+        return [announcement.to_dict() for announcement in self.repository.closing_within(days)]
+    
     def get_summary(self, data: Dict) -> Dict:
         """데이터 요약 정보 반환"""
         announcements = data.get("announcements", [])
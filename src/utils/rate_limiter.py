@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+API 요청 속도 제한기
+분당 요청 수(RPM), 분당 입력/출력 토큰 수(ITPM/OTPM)를 토큰 버킷으로 관리
+스레드(동기)와 asyncio(비동기) 양쪽에서 같은 인스턴스를 공유할 수 있음
+"""
+
+import asyncio
+import os
+import random
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """분당 허용량 기반 토큰 버킷 (선예약 방식)"""
+
+    def __init__(self, capacity_per_minute: float):
+        """
+        초기화
+
+        Args:
+            capacity_per_minute: 분당 허용량 (0 이하이면 제한 없음)
+        """
+        self.capacity = float(capacity_per_minute)
+        self.rate = self.capacity / 60.0  # 초당 충전량
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+
+    @property
+    def unlimited(self) -> bool:
+        return self.capacity <= 0
+
+    def _refill(self, now: float):
+        """경과 시간만큼 충전"""
+        elapsed = now - self.updated_at
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.updated_at = now
+
+    def reserve(self, amount: float, now: float) -> float:
+        """
+        amount만큼 선차감하고 사용 가능해질 때까지 기다려야 할 시간(초) 반환
+        잔량이 부족하면 음수(부채)로 두어 먼저 예약한 요청부터 순서대로 통과시킴
+        """
+        if self.unlimited or amount <= 0:
+            return 0.0
+        self._refill(now)
+        # 한 번에 용량보다 큰 요청은 용량만큼만 차감 (영원히 통과 못 하는 것 방지)
+        self.tokens -= min(amount, self.capacity)
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.rate
+
+    def refund(self, amount: float, now: float):
+        """예약량과 실제 사용량의 차이 반환 (음수면 추가 차감)"""
+        if self.unlimited:
+            return
+        self._refill(now)
+        self.tokens = min(self.capacity, self.tokens + amount)
+
+
+class RateLimiter:
+    """RPM / 입력 TPM / 출력 TPM 버킷 묶음"""
+
+    def __init__(self, requests_per_minute: float = 50, input_tokens_per_minute: float = 50000,
+                 output_tokens_per_minute: float = 10000):
+        self.requests = TokenBucket(requests_per_minute)
+        self.input_tokens = TokenBucket(input_tokens_per_minute)
+        self.output_tokens = TokenBucket(output_tokens_per_minute)
+        self.blocked_until = 0.0  # retry-after 등으로 전체 일시정지된 시각
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "RateLimiter":
+        """환경변수(ANTHROPIC_RPM, ANTHROPIC_ITPM, ANTHROPIC_OTPM)로 생성"""
+        return cls(
+            requests_per_minute=float(os.getenv("ANTHROPIC_RPM", "50")),
+            input_tokens_per_minute=float(os.getenv("ANTHROPIC_ITPM", "50000")),
+            output_tokens_per_minute=float(os.getenv("ANTHROPIC_OTPM", "10000"))
+        )
+
+    def reserve(self, input_tokens: int, output_tokens: int) -> float:
+        """요청 1건을 예약하고 대기해야 할 시간(초) 반환"""
+        with self._lock:
+            now = time.monotonic()
+            wait = max(
+                self.requests.reserve(1, now),
+                self.input_tokens.reserve(input_tokens, now),
+                self.output_tokens.reserve(output_tokens, now)
+            )
+            return max(wait, self.blocked_until - now)
+
+    def acquire(self, input_tokens: int, output_tokens: int) -> float:
+        """동기 대기 후 통과 (실제 대기한 시간 반환)"""
+        wait = self.reserve(input_tokens, output_tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, input_tokens: int, output_tokens: int) -> float:
+        """비동기 대기 후 통과 (실제 대기한 시간 반환)"""
+        wait = self.reserve(input_tokens, output_tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def settle(self, reserved_input: int, reserved_output: int, actual_input: int, actual_output: int):
+        """응답의 usage로 예약량 보정"""
+        with self._lock:
+            now = time.monotonic()
+            self.input_tokens.refund(reserved_input - actual_input, now)
+            self.output_tokens.refund(reserved_output - actual_output, now)
+
+    def pause(self, seconds: float):
+        """429 응답 등으로 모든 요청을 seconds초 동안 멈춤"""
+        with self._lock:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+
+
+def backoff_delay(attempt: int, retry_after: Optional[float] = None, base: float = 1.0,
+                  max_delay: float = 60.0) -> float:
+    """
+    지수 백오프 + 지터 대기 시간 계산
+
+    Args:
+        attempt: 0부터 시작하는 재시도 횟수
+        retry_after: 서버가 알려준 retry-after 초 (있으면 최소 대기 시간으로 사용)
+    """
+    delay = min(max_delay, base * (2 ** attempt))
+    if retry_after is not None:
+        delay = max(delay, retry_after)
+    # 동시에 막힌 요청들이 한꺼번에 재시도하지 않도록 0~25% 지터 추가
+    return delay + random.uniform(0, delay * 0.25)
+
+
+if __name__ == "__main__":
+    # 테스트 코드
+    print("🧪 속도 제한기 테스트")
+    print("=" * 50)
+
+    limiter = RateLimiter(requests_per_minute=600, input_tokens_per_minute=60000, output_tokens_per_minute=0)
+
+    waits = [limiter.reserve(2000, 500) for _ in range(40)]
+    print(f"40건 예약 (분당 60,000 입력 토큰, 건당 2,000): 마지막 요청 대기 {waits[-1]:.1f}초")
+
+    paused = RateLimiter()
+    paused.pause(5)
+    print(f"pause(5) 이후 예약 대기: {paused.reserve(1, 1):.1f}초")
+
+    print(f"백오프 예시: {[round(backoff_delay(i), 1) for i in range(5)]}")
+    print(f"retry-after=10 백오프: {backoff_delay(0, retry_after=10):.1f}초")
@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+공고 관련도 순위 (로컬 TF-IDF 모델)
+과거 공고(공고명/부처명/파싱된 본문 앞부분)로 TF-IDF를 학습하고
+설정 키워드 + 요약까지 처리했던 공고로 만든 관심 프로필과의 코사인 유사도로 새 공고 순위를 매김
+- 특징어: 한글은 글자 bigram, 영문/숫자는 단어 (로컬 요약기와 같은 방식)
+- 새 공고 점수는 희소 행렬(행 번호/열 번호/값 배열) 연산으로 한 번에 계산 → 1만 건도 1초 안쪽
+- 과거 공고에 없던 특징어도 코사인 분모에는 포함 (프로필 가중치는 0)
+
+사용 예:
+    python -m src.utils.relevance_ranker output/new_data.json  (공고 저장소로 학습하고 JSON 파일의 공고 순위 출력)
+"""
+
+import os
+import re
+import sys
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+_TOKEN_PATTERN = re.compile(r'[가-힣]+|[A-Za-z]+|\d+')
+
+
+def features(text: str) -> List[str]:
+    """특징어 (한글은 글자 bigram, 영문/숫자는 소문자 단어)"""
+    result = []
+    for token in _TOKEN_PATTERN.findall(text or ""):
+        if '가' <= token[0] <= '힣':
+            result.extend(token[i:i + 2] for i in range(max(1, len(token) - 1)))
+        else:
+            result.append(token.lower())
+    return result
+
+
+def announcement_text(announcement: Dict, text_chars: int = 1000) -> str:
+    """모델 입력 문장 (공고명 + 부처명 + 본문 앞부분, 공고 dict/학습용 행 모두 지원)"""
+    title = announcement.get("공고명", announcement.get("title", ""))
+    ministry = announcement.get("부처명", announcement.get("ministry", ""))
+    front_text = (announcement.get("front_text") or "")[:text_chars]
+    return f"{title} {ministry} {front_text}"
+
+
+class RelevanceRanker:
+    """과거 공고 TF-IDF + 관심 프로필 코사인 유사도 기반 순위 모델"""
+
+    def __init__(self, keywords: Optional[Dict[str, List[str]]] = None, weights: Optional[Dict[str, float]] = None,
+                 keyword_weight: float = 0.5, top_k: int = 0, text_chars: int = 1000):
+        """
+        초기화
+
+        Args:
+            keywords: {"primary": [...], "secondary": [...], "tertiary": [...]} (exclude는 사용하지 않음)
+            weights: 분류별 키워드 가중치 (기본 primary 3, secondary 2, tertiary 1)
+            keyword_weight: 관심 프로필에서 키워드 쪽 비중 (나머지는 과거에 처리한 공고 평균)
+            top_k: 비싼 처리(다운로드/파싱/요약)를 할 상위 공고 수 (0이면 제한 없음)
+            text_chars: 학습에 쓸 본문 앞부분 글자 수
+        """
+        self.keywords = keywords or {}
+        self.weights = weights or {"primary": 3.0, "secondary": 2.0, "tertiary": 1.0}
+        self.keyword_weight = keyword_weight
+        self.top_k = top_k
+        self.text_chars = text_chars
+        self.vocab: Dict[str, int] = {}
+        self.document_count = 0
+        self.kept_count = 0
+        self.idf = np.zeros(0)
+        self.profile = np.zeros(0)
+
+    @classmethod
+    def from_env(cls, keywords: Optional[Dict[str, List[str]]] = None) -> "RelevanceRanker":
+        """
+        환경변수로 생성 (키워드는 설정 문서에서)
+        RELEVANCE_TOP_K, RELEVANCE_KEYWORD_WEIGHT, RELEVANCE_TEXT_CHARS, TRIAGE_WEIGHTS("3,2,1")
+        """
+        if keywords is None:
+            from .config_reader import get_search_keywords
+            keywords = get_search_keywords()
+        primary, secondary, tertiary = (float(w) for w in os.getenv("TRIAGE_WEIGHTS", "3,2,1").split(","))
+        return cls(
+            keywords,
+            weights={"primary": primary, "secondary": secondary, "tertiary": tertiary},
+            keyword_weight=float(os.getenv("RELEVANCE_KEYWORD_WEIGHT", "0.5")),
+            top_k=int(os.getenv("RELEVANCE_TOP_K", "0")),
+            text_chars=int(os.getenv("RELEVANCE_TEXT_CHARS", "1000"))
+        )
+
+    # ====== 학습 ======
+
+    def _sparse(self, texts: List[str], vocab: Dict[str, int]):
+        """
+        문장 목록 → 희소 TF 행렬 (행 번호, 열 번호, 등장 횟수 배열)
+        vocab에 없는 특징어는 vocab 뒤에 새 번호를 붙임 (vocab을 직접 늘림)
+        """
+        rows, columns = [], []
+        for row, text in enumerate(texts):
+            indices = [vocab.setdefault(feature, len(vocab)) for feature in features(text)]
+            columns.extend(indices)
+            rows.extend([row] * len(indices))
+        if not columns:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros(0)
+
+        # 같은 (행, 열)은 하나로 합쳐 등장 횟수로
+        width = len(vocab)
+        keys, counts = np.unique(np.asarray(rows, dtype=np.int64) * width + np.asarray(columns, dtype=np.int64),
+                                 return_counts=True)
+        return keys // width, keys % width, counts.astype(np.float64)
+
+    def _unit_rows(self, rows: np.ndarray, columns: np.ndarray, values: np.ndarray, count: int) -> np.ndarray:
+        """행별 L2 정규화한 값"""
+        norms = np.sqrt(np.bincount(rows, weights=values ** 2, minlength=count))
+        norms[norms == 0] = 1.0
+        return values / norms[rows]
+
+    def fit(self, history: Iterable[Dict]) -> "RelevanceRanker":
+        """
+        과거 공고로 IDF와 관심 프로필 학습
+
+        Args:
+            history: 공고 저장소 relevance_corpus() 행 또는 공고 dict ("kept"가 참이면 관심 공고로 사용)
+        """
+        history = list(history)
+        self.vocab = {}
+        rows, columns, counts = self._sparse([announcement_text(item, self.text_chars) for item in history], self.vocab)
+
+        # 키워드 특징어도 사전에 넣어 과거 공고에 없던 키워드도 프로필에 반영
+        # (같은 키워드가 여러 분류에 있으면 가장 큰 가중치 하나만)
+        keyword_weights = {}
+        for category, weight in self.weights.items():
+            for keyword in self.keywords.get(category, []):
+                indices = tuple(self.vocab.setdefault(feature, len(self.vocab)) for feature in features(keyword))
+                if indices:
+                    keyword_weights[indices] = max(weight, keyword_weights.get(indices, 0.0))
+
+        self.document_count = len(history)
+        document_freq = np.bincount(columns, minlength=len(self.vocab))
+        self.idf = np.log((1 + self.document_count) / (1 + document_freq)) + 1.0
+
+        # 키워드마다 정규화한 TF-IDF 벡터에 가중치를 곱해 합산 (글자 수가 많은 키워드가 더 커지지 않도록)
+        keyword_profile = np.zeros(len(self.vocab))
+        for indices, weight in keyword_weights.items():
+            vector = np.bincount(indices, minlength=len(self.vocab)) * self.idf
+            keyword_profile += weight * vector / np.linalg.norm(vector)
+        if keyword_weights:
+            keyword_profile /= np.linalg.norm(keyword_profile)
+
+        # 과거에 요약까지 처리한 공고의 정규화 TF-IDF 평균
+        kept_profile = np.zeros(len(self.vocab))
+        kept = np.array([bool(item.get("kept")) for item in history], dtype=bool)
+        self.kept_count = int(kept.sum())
+        if self.kept_count and len(rows):
+            values = self._unit_rows(rows, columns, counts * self.idf[columns], self.document_count)
+            mask = kept[rows]
+            kept_profile = np.bincount(columns[mask], weights=values[mask], minlength=len(self.vocab))
+            norm = np.linalg.norm(kept_profile)
+            if norm:
+                kept_profile /= norm
+
+        if not keyword_weights:
+            self.profile = kept_profile
+        elif not self.kept_count:
+            self.profile = keyword_profile
+        else:
+            self.profile = self.keyword_weight * keyword_profile + (1 - self.keyword_weight) * kept_profile
+        norm = np.linalg.norm(self.profile)
+        if norm:
+            self.profile /= norm
+        return self
+
+    @classmethod
+    def from_store(cls, store, keywords: Optional[Dict[str, List[str]]] = None,
+                   limit: int = 5000, exclude_crawl_run: Optional[int] = None) -> "RelevanceRanker":
+        """환경변수 설정으로 만들고 공고 저장소의 과거 공고로 학습"""
+        ranker = cls.from_env(keywords)
+        return ranker.fit(store.relevance_corpus(limit, exclude_crawl_run=exclude_crawl_run))
+
+    # ====== 점수 / 순위 ======
+
+    def score(self, announcements: Iterable[Dict]) -> np.ndarray:
+        """공고별 관심 프로필 코사인 유사도 (0~1)"""
+        texts = [announcement_text(item, self.text_chars) for item in announcements]
+        if not texts:
+            return np.zeros(0)
+        vocab = dict(self.vocab)
+        rows, columns, counts = self._sparse(texts, vocab)
+
+        # 학습 때 없던 특징어: 문서 빈도 0의 IDF, 프로필 가중치 0
+        unseen_idf = np.log(1 + self.document_count) + 1.0
+        idf = np.concatenate([self.idf, np.full(len(vocab) - len(self.idf), unseen_idf)])
+        profile = np.concatenate([self.profile, np.zeros(len(vocab) - len(self.profile))])
+
+        values = self._unit_rows(rows, columns, counts * idf[columns], len(texts))
+        return np.bincount(rows, weights=values * profile[columns], minlength=len(texts))
+
+    def rank(self, announcements: List[Dict]) -> Dict:
+        """
+        공고 순위
+
+        Returns:
+            {"order": [관련도 높은 순 인덱스], "scores": [공고별 점수 (입력 순서)],
+             "selected": [상위 top_k 인덱스 (제한 없으면 전체)], "skipped": [top_k 밖 인덱스]}
+        """
+        scores = self.score(announcements)
+        order = [int(i) for i in np.argsort(-scores, kind="stable")]
+        cut = self.top_k if self.top_k and self.top_k < len(order) else len(order)
+        return {"order": order, "scores": [float(score) for score in scores],
+                "selected": order[:cut], "skipped": order[cut:]}
+
+    def get_stats(self) -> Dict:
+        return {
+            "documents": self.document_count,
+            "kept": self.kept_count,
+            "vocabulary": len(self.vocab),
+            "top_k": self.top_k or "제한 없음"
+        }
+
+
+def print_relevance_report(announcements: List[Dict], result: Dict, limit: int = 20):
+    """관련도 순위 출력"""
+    print(f"\n{'='*60}")
+    print("🎯 관련도 순위")
+    print(f"{'='*60}")
+    skipped = set(result["skipped"])
+    for rank, i in enumerate(result["order"][:limit], 1):
+        icon = "⏭️" if i in skipped else "✅"
+        print(f"   {icon} {rank:>3}. [{result['scores'][i]:.3f}] {announcements[i].get('공고명', '')[:45]}")
+    if len(result["order"]) > limit:
+        print(f"   ... 외 {len(result['order']) - limit}개")
+    if skipped:
+        print(f"   ⏭️ 상위 {len(result['selected'])}개만 처리, {len(skipped)}개는 순위 밖")
+
+
+def main():
+    """공고 저장소로 학습하고 JSON 파일의 공고 목록 순위 출력"""
+    import json
+
+    from .announcement_store import AnnouncementStore
+
+    with open(sys.argv[1], 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    announcements = data.get("announcements", []) if isinstance(data, dict) else data
+
+    ranker = RelevanceRanker.from_store(AnnouncementStore.from_env(import_legacy=False))
+    print(f"📊 관련도 모델: {ranker.get_stats()}")
+    print_relevance_report(announcements, ranker.rank(announcements))
+
+
+if __name__ == "__main__" and len(sys.argv) > 1:
+    main()
+elif __name__ == "__main__":
+    # 테스트 코드
+    import random
+    import time
+
+    print("🧪 공고 관련도 순위 테스트")
+    print("=" * 50)
+
+    keywords = {"primary": ["AI", "스마트팩토리"], "secondary": ["빅데이터", "IoT", "클라우드"],
+                "tertiary": ["디지털트윈", "메타버스"], "exclude": ["마감"]}
+    history = [
+        {"title": "2025년 AI 반도체 설계 기술개발", "ministry": "과학기술정보통신부",
+         "front_text": "인공지능 반도체 설계 및 학습 가속기 개발 지원", "kept": True},
+        {"title": "제조 현장 디지털트윈 실증 지원", "ministry": "산업통상자원부",
+         "front_text": "스마트공장 데이터 기반 디지털트윈 구축 및 실증", "kept": True},
+        {"title": "해양 생태계 장기 모니터링", "ministry": "해양수산부",
+         "front_text": "연안 해양 생태계 조사 및 자료 구축", "kept": False},
+        {"title": "농촌 인력 양성 사업", "ministry": "농림축산식품부", "front_text": "", "kept": False},
+    ]
+    ranker = RelevanceRanker(keywords).fit(history)
+    print(f"모델: {ranker.get_stats()}")
+
+    samples = [
+        {"공고명": "해양 쓰레기 수거 기술개발", "부처명": "해양수산부"},
+        {"공고명": "AI 기반 스마트팩토리 고도화", "부처명": "중소벤처기업부"},
+        {"공고명": "반도체 설계 인력 양성", "부처명": "과학기술정보통신부"},
+        {"공고명": "클라우드 보안 기술개발", "부처명": "과학기술정보통신부"},
+        {"공고명": "전통시장 활성화 지원", "부처명": "중소벤처기업부"},
+    ]
+    ranker.top_k = 3
+    print_relevance_report(samples, ranker.rank(samples))
+
+    # 과거 공고 5천 건 학습 + 새 공고 1만 건 점수
+    random.seed(0)
+    words = ["AI", "반도체", "디지털트윈", "해양", "바이오", "수소", "클라우드", "인력양성", "실증", "플랫폼",
+             "소재", "부품", "장비", "농업", "스마트팩토리", "데이터", "보안", "표준화", "국제협력", "탄소중립"]
+    ministries = ["과학기술정보통신부", "산업통상자원부", "해양수산부", "중소벤처기업부", "환경부"]
+
+    def synthetic(i, with_text):
+        title = f"2025년 {' '.join(random.sample(words, 3))} 기술개발 {i}"
+        row = {"title": title, "ministry": random.choice(ministries), "kept": random.random() < 0.2}
+        if with_text:
+            row["front_text"] = " ".join(random.sample(words, 10)) * 10
+        return row
+
+    history = [synthetic(i, True) for i in range(5000)]
+    start = time.perf_counter()
+    ranker = RelevanceRanker(keywords).fit(history)
+    print(f"\n과거 공고 5,000건 학습: {(time.perf_counter() - start) * 1000:.0f}ms ({ranker.get_stats()})")
+
+    candidates = [{"공고명": row["title"], "부처명": row["ministry"]} for row in (synthetic(i, False) for i in range(10000))]
+    start = time.perf_counter()
+    result = ranker.rank(candidates)
+    print(f"새 공고 1만 건 점수/순위: {(time.perf_counter() - start) * 1000:.0f}ms")
+    print(f"1위: [{result['scores'][result['order'][0]]:.3f}] {candidates[result['order'][0]]['공고명']}")
@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+공고 본문 전문 검색 색인 (SQLite FTS5)
+파서가 추출한 전체 본문(full_text)을 공고별로 보관하고 한국어에 맞게 글자 2-gram으로 색인
+- 색인: 글자/숫자 연속 구간을 2글자씩 겹쳐 자른 토큰 ("디지털트윈" → 디지 지털 털트 트윈)
+- 검색: 검색어도 같은 방식으로 잘라 연속 구문으로 조회 → 띄어쓰기/조사와 상관없이 부분 일치
+- 순위: bm25 (공고명 가중치 높게), 본문 발췌에 검색어 강조
+- 지원 규모(억원)는 본문에서 한 번 추출해 두고 검색 조건으로 사용 ("10억 이상")
+
+사용 예:
+    python -m src.utils.search_index 디지털트윈 --min-budget 10
+"""
+
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+import unicodedata
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+_RUN_PATTERN = re.compile(r'[^\W_]+')
+
+# 금액 표현 (숫자 + 단위 + 원) → 억원 환산
+_AMOUNT_PATTERN = re.compile(r'(\d[\d,]*(?:\.\d+)?)\s*(조|억|천만|백만|만)?\s*원')
+_UNIT_IN_EOK = {"조": 10000.0, "억": 1.0, "천만": 0.1, "백만": 0.01, "만": 0.0001, None: 1e-8}
+# 사업 전체 규모를 말하는 줄에 있는 금액을 우선 사용
+_BUDGET_LINE_PATTERN = re.compile(r'총|예산|사업비|지원규모|지원 규모|지원금|정부출연금|출연금')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    ro_rnd_uid TEXT NOT NULL UNIQUE,
+    title TEXT,
+    ministry TEXT,
+    deadline TEXT,
+    budget_eok REAL,
+    body TEXT,
+    indexed_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_documents_budget ON documents(budget_eok);
+CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts USING fts5(title_tokens, body_tokens, tokenize = 'unicode61');
+"""
+
+
+def _normalize(text: str) -> str:
+    return unicodedata.normalize("NFKC", text or "").lower()
+
+
+def bigram_tokens(text: str) -> str:
+    """색인/검색용 2-gram 토큰 문자열 (공백 구분)"""
+    tokens = []
+    for run in _RUN_PATTERN.findall(_normalize(text)):
+        if len(run) == 1:
+            tokens.append(run)
+        else:
+            tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+    return " ".join(tokens)
+
+
+def extract_budget(text: str) -> Optional[float]:
+    """
+    본문에서 지원 규모(억원) 추출
+    총/예산/사업비 등이 있는 줄의 금액 중 가장 큰 값, 그런 줄이 없으면 본문 전체에서 가장 큰 값
+    """
+    best_labeled, best_any = None, None
+    for line in (text or "").split("\n"):
+        for number, unit in _AMOUNT_PATTERN.findall(line):
+            try:
+                amount = float(number.replace(",", "")) * _UNIT_IN_EOK[unit or None]
+            except ValueError:
+                continue
+            best_any = amount if best_any is None else max(best_any, amount)
+            if _BUDGET_LINE_PATTERN.search(line):
+                best_labeled = amount if best_labeled is None else max(best_labeled, amount)
+    result = best_labeled if best_labeled is not None else best_any
+    return round(result, 4) if result is not None else None
+
+
+def _query_terms(query: str) -> Tuple[List[str], List[str]]:
+    """검색어를 포함/제외 단어로 분리 ("-단어"는 제외)"""
+    include, exclude = [], []
+    for term in (query or "").split():
+        target = exclude if term.startswith("-") and len(term) > 1 else include
+        cleaned = term[1:] if target is exclude else term
+        if _RUN_PATTERN.search(_normalize(cleaned)):
+            target.append(cleaned)
+    return include, exclude
+
+
+def _match_expression(term: str) -> str:
+    """단어 1개 → FTS5 구문 (글자 구간마다 2-gram 연속 구문, 한 글자는 접두어 검색)"""
+    phrases = []
+    for run in _RUN_PATTERN.findall(_normalize(term)):
+        if len(run) == 1:
+            phrases.append(f'"{run}"*')
+        else:
+            phrases.append('"' + " ".join(run[i:i + 2] for i in range(len(run) - 1)) + '"')
+    return " AND ".join(phrases)
+
+
+def make_snippet(text: str, terms: List[str], width: int = 80, markers: Tuple[str, str] = ("[", "]")) -> str:
+    """첫 일치 위치 주변 본문 발췌 (검색어 강조)"""
+    text = re.sub(r'\s+', ' ', text or "").strip()
+    if not text:
+        return ""
+    patterns = [re.escape(_normalize(term)) for term in terms if term]
+    matcher = re.compile("|".join(patterns), re.IGNORECASE) if patterns else None
+    first = matcher.search(unicodedata.normalize("NFKC", text)) if matcher else None
+
+    start = max(0, first.start() - width // 3) if first else 0
+    end = min(len(text), start + width)
+    excerpt = text[start:end]
+    if matcher:
+        excerpt = matcher.sub(lambda m: f"{markers[0]}{m.group(0)}{markers[1]}", excerpt)
+    return f"{'…' if start > 0 else ''}{excerpt}{'…' if end < len(text) else ''}"
+
+
+class SearchIndex:
+    """공고 본문 전문 검색 색인"""
+
+    def __init__(self, db_path: str = "output/ntis_search.db"):
+        """
+        초기화
+
+        Args:
+            db_path: 색인 DB 파일 (본문이 커서 공고 저장소와 분리)
+        """
+        self.db_path = db_path
+        if db_path != ":memory:":
+            os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self.conn = sqlite3.connect(db_path, check_same_thread=False, timeout=30)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "SearchIndex":
+        """환경변수(SEARCH_INDEX_PATH)로 생성"""
+        return cls(db_path=os.getenv("SEARCH_INDEX_PATH", "output/ntis_search.db"))
+
+    def add(self, uid: str, announcement: Dict, full_text: str, commit: bool = True):
+        """
+        공고 1건 색인 (같은 uid는 교체)
+
+        Args:
+            uid: roRndUid
+            announcement: 공고 dict (공고명/부처명/마감일 사용)
+            full_text: 파서가 추출한 전체 본문
+            commit: False면 add_many처럼 호출 측에서 한 번에 커밋
+        """
+        if not uid or not full_text:
+            return
+        title = announcement.get("공고명", "")
+        with self._lock:
+            row = self.conn.execute("SELECT id FROM documents WHERE ro_rnd_uid = ?", (uid,)).fetchone()
+            if row:
+                self.conn.execute("DELETE FROM documents_fts WHERE rowid = ?", (row["id"],))
+                self.conn.execute("DELETE FROM documents WHERE id = ?", (row["id"],))
+            cursor = self.conn.execute(
+                """
+                INSERT INTO documents (ro_rnd_uid, title, ministry, deadline, budget_eok, body, indexed_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                (uid, title, announcement.get("부처명", ""), announcement.get("마감일", ""),
+                 extract_budget(full_text), full_text, datetime.now().strftime("%Y-%m-%dT%H:%M:%S"))
+            )
+            self.conn.execute(
+                "INSERT INTO documents_fts (rowid, title_tokens, body_tokens) VALUES (?, ?, ?)",
+                (cursor.lastrowid, bigram_tokens(title), bigram_tokens(full_text))
+            )
+            if commit:
+                self.conn.commit()
+
+    def add_many(self, documents: List[Tuple[str, Dict, str]]):
+        """여러 건 색인 후 한 번에 커밋 ([(uid, announcement, full_text), ...])"""
+        for uid, announcement, full_text in documents:
+            self.add(uid, announcement, full_text, commit=False)
+        with self._lock:
+            self.conn.commit()
+
+    def search(self, query: str, min_budget: Optional[float] = None, max_budget: Optional[float] = None,
+               deadline_from: Optional[str] = None, limit: int = 20, snippet_width: int = 80) -> List[Dict]:
+        """
+        본문/공고명 검색
+
+        Args:
+            query: 검색어 (공백으로 구분한 단어는 모두 포함, "-단어"는 제외)
+            min_budget / max_budget: 지원 규모 범위 (억원)
+            deadline_from: 이 날짜(YYYY.MM.DD) 이후 마감 공고만
+            limit: 최대 결과 수
+
+        Returns:
+            [{"uid", "공고명", "부처명", "마감일", "지원규모_억", "score", "snippet"}] (관련도 순)
+        """
+        include, exclude = _query_terms(query)
+        if not include:
+            return []
+        match = " AND ".join(f"({_match_expression(term)})" for term in include)
+        if exclude:
+            match += " NOT " + " NOT ".join(f"({_match_expression(term)})" for term in exclude)
+
+        clauses, params = ["documents_fts MATCH ?"], [match]
+        if min_budget is not None:
+            clauses.append("d.budget_eok >= ?")
+            params.append(min_budget)
+        if max_budget is not None:
+            clauses.append("d.budget_eok <= ?")
+            params.append(max_budget)
+        if deadline_from:
+            clauses.append("d.deadline >= ?")
+            params.append(deadline_from)
+
+        with self._lock:
+            rows = self.conn.execute(
+                f"""
+                SELECT d.ro_rnd_uid, d.title, d.ministry, d.deadline, d.budget_eok, d.body,
+                       bm25(documents_fts, 5.0, 1.0) AS score
+                FROM documents_fts JOIN documents d ON d.id = documents_fts.rowid
+                WHERE {' AND '.join(clauses)}
+                ORDER BY score LIMIT ?
+                """,
+                (*params, limit)
+            ).fetchall()
+
+        return [{
+            "uid": row["ro_rnd_uid"],
+            "공고명": row["title"],
+            "부처명": row["ministry"],
+            "마감일": row["deadline"],
+            "지원규모_억": row["budget_eok"],
+            "score": round(-row["score"], 4),
+            "snippet": make_snippet(row["body"], include, width=snippet_width)
+        } for row in rows]
+
+    def __contains__(self, uid: str) -> bool:
+        with self._lock:
+            return self.conn.execute("SELECT 1 FROM documents WHERE ro_rnd_uid = ?", (uid,)).fetchone() is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+
+    def optimize(self):
+        """FTS 세그먼트 병합 (대량 색인 후)"""
+        with self._lock:
+            self.conn.execute("INSERT INTO documents_fts (documents_fts) VALUES ('optimize')")
+            self.conn.commit()
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+
+def main():
+    """명령행 검색: python -m src.utils.search_index 검색어 [--min-budget 억] [--limit N]"""
+    args = sys.argv[1:]
+    options = {}
+    for name in ("--min-budget", "--max-budget", "--limit", "--deadline-from"):
+        if name in args:
+            position = args.index(name)
+            options[name] = args[position + 1]
+            del args[position:position + 2]
+    query = " ".join(args)
+    if not query:
+        print(main.__doc__)
+        return
+
+    index = SearchIndex.from_env()
+    start = time.perf_counter()
+    results = index.search(
+        query,
+        min_budget=float(options["--min-budget"]) if "--min-budget" in options else None,
+        max_budget=float(options["--max-budget"]) if "--max-budget" in options else None,
+        deadline_from=options.get("--deadline-from"),
+        limit=int(options.get("--limit", "20"))
+    )
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"🔍 '{query}': {len(results)}건 ({elapsed:.1f}ms, 색인 {len(index):,}건)")
+    for rank, result in enumerate(results, 1):
+        budget = f"{result['지원규모_억']:g}억" if result["지원규모_억"] is not None else "규모 미상"
+        print(f"{rank:>3}. [{result['uid']}] {result['공고명'][:50]} ({result['부처명']}, 마감 {result['마감일']}, {budget})")
+        print(f"     {result['snippet']}")
+
+
+if __name__ == "__main__" and len(sys.argv) > 1:
+    main()
+elif __name__ == "__main__":
+    # 테스트 코드
+    import random
+    import tempfile
+
+    print("🧪 전문 검색 색인 테스트")
+    print("=" * 50)
+
+    index = SearchIndex(os.path.join(tempfile.mkdtemp(), "search.db"))
+    print(f"토큰: {bigram_tokens('디지털트윈 기반 AI 2025년')}")
+    print(f"지원 규모: {extract_budget('□ 지원예산' + chr(10) + '총 45억원 (과제당 연 15억원 이내)' + chr(10) + '매출 1,000억원 이하 기업')}억")
+
+    random.seed(0)
+    topics = ["디지털트윈 기반 공정 최적화", "수소 생산 저장 핵심기술", "인공지능 반도체 설계", "스마트팜 데이터 플랫폼",
+              "탄소중립 소재 부품", "바이오 헬스 임상", "양자 컴퓨팅 기초연구", "자율주행 센서 융합"]
+    filler = "본 사업은 국가 연구개발 역량 강화를 위하여 산학연 협력 과제를 지원합니다. "
+    documents = []
+    for i in range(30000):
+        topic = topics[i % len(topics)]
+        budget = random.choice([3, 5, 8, 12, 20, 45, 100])
+        body = (f"1. 사업목적\n{topic} 분야의 기술 경쟁력을 강화\n2. 지원규모\n총 {budget}억원, 과제당 {budget / 5:g}억원 이내\n"
+                + filler * random.randint(5, 30))
+        documents.append((str(1_000_000 + i), {"공고명": f"2025년도 {topic} 사업 {i}", "부처명": "테스트부처",
+                                               "마감일": "2025.10.31"}, body))
+    start = time.perf_counter()
+    index.add_many(documents)
+    index.optimize()
+    print(f"3만 건 색인: {time.perf_counter() - start:.1f}초")
+
+    for query, min_budget in (("디지털트윈", 10), ("트윈 공정", None), ("수소 -저장", None), ("반도체", 50)):
+        start = time.perf_counter()
+        results = index.search(query, min_budget=min_budget, limit=3)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"\n🔍 '{query}' (지원규모 ≥ {min_budget}억): {len(results)}건 {elapsed:.1f}ms")
+        for result in results:
+            print(f"   {result['공고명']} ({result['지원규모_억']:g}억, score {result['score']}) {result['snippet'][:60]}")
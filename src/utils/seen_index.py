@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+이미 본 공고(roRndUid) 색인
+표시용 30개 목록과 별개로, 한 번이라도 처리한 공고를 기간 제한 없이 기억
+- 디스크: 공고 저장소 DB의 seen_uids 테이블 (기본키 색인)
+- 메모리: 앞단 Bloom 필터 (없다고 나오면 DB 조회 없이 신규로 판정)
+마감일 연장 등으로 오래된 공고가 다시 검색되어도 신규로 다시 처리하지 않음
+"""
+
+import hashlib
+import math
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Iterable, List
+
+
+class BloomFilter:
+    """비트 배열 기반 Bloom 필터 (이중 해싱으로 k개 위치 계산)"""
+
+    def __init__(self, expected_items: int = 1_000_000, false_positive_rate: float = 0.001):
+        """
+        초기화
+
+        Args:
+            expected_items: 예상 원소 수 (넘으면 오탐률이 올라감)
+            false_positive_rate: 목표 오탐률
+        """
+        self.expected_items = max(1, expected_items)
+        self.false_positive_rate = false_positive_rate
+        self.size = max(8, int(-self.expected_items * math.log(false_positive_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / self.expected_items * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hash_count):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, item: str):
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+
+class SeenUidIndex:
+    """Bloom 필터 + SQLite 색인 기반 처리 이력"""
+
+    def __init__(self, db_path: str = "output/ntis.db", expected_items: int = 1_000_000,
+                 false_positive_rate: float = 0.001):
+        """
+        초기화
+
+        Args:
+            db_path: 색인을 둘 DB 파일 (공고 저장소와 같은 파일)
+            expected_items: Bloom 필터 초기 용량 (이력이 넘어서면 두 배로 다시 만듦)
+            false_positive_rate: Bloom 필터 목표 오탐률
+        """
+        self.db_path = db_path
+        self.false_positive_rate = false_positive_rate
+        if db_path != ":memory:":
+            os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self.conn = sqlite3.connect(db_path, check_same_thread=False, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS seen_uids (ro_rnd_uid TEXT PRIMARY KEY, first_seen TEXT NOT NULL)")
+        self._lock = threading.Lock()
+        self.stats = {"조회": 0, "필터통과": 0, "오탐": 0}
+
+        self._seed_from_store()
+        total = self.conn.execute("SELECT COUNT(*) FROM seen_uids").fetchone()[0]
+        self._build_filter(max(expected_items, total * 2))
+
+    @classmethod
+    def from_env(cls) -> "SeenUidIndex":
+        """환경변수(NTIS_DB_PATH)로 생성"""
+        return cls(db_path=os.getenv("NTIS_DB_PATH", "output/ntis.db"))
+
+    def _seed_from_store(self):
+        """색인이 비어 있으면 공고 저장소에 이미 있는 공고로 채움"""
+        if self.conn.execute("SELECT COUNT(*) FROM seen_uids").fetchone()[0]:
+            return
+        has_store = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'announcements'"
+        ).fetchone()
+        if has_store:
+            with self.conn:
+                self.conn.execute(
+                    "INSERT OR IGNORE INTO seen_uids (ro_rnd_uid, first_seen) SELECT ro_rnd_uid, first_seen FROM announcements"
+                )
+
+    def _build_filter(self, capacity: int):
+        """DB 색인 전체로 Bloom 필터 다시 만들기"""
+        self.bloom = BloomFilter(capacity, self.false_positive_rate)
+        for (uid,) in self.conn.execute("SELECT ro_rnd_uid FROM seen_uids"):
+            self.bloom.add(uid)
+
+    def __contains__(self, uid: str) -> bool:
+        if not uid:
+            return False
+        with self._lock:
+            self.stats["조회"] += 1
+            if uid not in self.bloom:
+                return False
+            self.stats["필터통과"] += 1
+            found = self.conn.execute("SELECT 1 FROM seen_uids WHERE ro_rnd_uid = ?", (uid,)).fetchone() is not None
+            if not found:
+                self.stats["오탐"] += 1
+            return found
+
+    def unseen(self, uids: Iterable[str]) -> List[str]:
+        """처리한 적 없는 roRndUid만 입력 순서대로 반환 (중복 제거)"""
+        result, batch_seen = [], set()
+        for uid in uids:
+            if uid and uid not in batch_seen and uid not in self:
+                result.append(uid)
+            batch_seen.add(uid)
+        return result
+
+    def add_many(self, uids: Iterable[str]) -> int:
+        """처리 이력에 추가하고 새로 추가된 수 반환"""
+        now = datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
+        uids = [uid for uid in dict.fromkeys(uids) if uid]
+        with self._lock, self.conn:
+            before = self.conn.total_changes
+            self.conn.executemany("INSERT OR IGNORE INTO seen_uids (ro_rnd_uid, first_seen) VALUES (?, ?)",
+                                  [(uid, now) for uid in uids])
+            added = self.conn.total_changes - before
+            for uid in uids:
+                self.bloom.add(uid)
+            if self.bloom.count > self.bloom.expected_items:
+                self._build_filter(self.bloom.expected_items * 2)
+        return added
+
+    def add(self, uid: str) -> bool:
+        return self.add_many([uid]) == 1
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM seen_uids").fetchone()[0]
+
+    def get_stats(self) -> dict:
+        """이력 크기와 조회 통계"""
+        return {
+            "이력": len(self),
+            "필터용량": self.bloom.expected_items,
+            "필터크기_KB": len(self.bloom.bits) // 1024,
+            **self.stats
+        }
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+
+if __name__ == "__main__":
+    # 테스트 코드
+    import random
+    import tempfile
+    import time
+
+    print("🧪 처리 이력 색인 테스트")
+    print("=" * 50)
+
+    index = SeenUidIndex(os.path.join(tempfile.mkdtemp(), "ntis.db"), expected_items=200_000)
+    history = [str(1_000_000 + i) for i in range(300_000)]
+    start = time.perf_counter()
+    index.add_many(history)
+    print(f"30만 건 추가: {time.perf_counter() - start:.2f}초 (필터 용량 {index.bloom.expected_items:,})")
+
+    queries = random.sample(history, 1000) + [str(9_000_000 + i) for i in range(10_000)]
+    start = time.perf_counter()
+    new_uids = index.unseen(queries)
+    elapsed = time.perf_counter() - start
+    print(f"1.1만 건 조회: {elapsed * 1000:.0f}ms ({elapsed / len(queries) * 1e6:.1f}µs/건), 신규 {len(new_uids):,}건")
+    print(f"통계: {index.get_stats()}")
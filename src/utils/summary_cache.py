@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AI 요약 결과 디스크 캐시
+(모델, 프롬프트 버전, temperature, 정리된 입력 텍스트) 해시를 키로 요약 결과를 저장
+- 항목별 JSON 파일 (임시 파일 작성 후 교체하여 쓰기 중 손상 방지)
+- TTL 만료 및 최대 항목 수 초과 시 오래 사용하지 않은 항목부터 삭제
+- 같은 실행 안에서 동일 키 요청이 동시에 들어오면 한 번만 계산
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+
+class SummaryCache:
+    """요약 결과 디스크 캐시"""
+
+    def __init__(self, cache_dir: str = "output/summary_cache", ttl_days: float = 90,
+                 max_entries: int = 5000):
+        """
+        초기화
+
+        Args:
+            cache_dir: 캐시 저장 폴더
+            ttl_days: 항목 유효 기간 (일)
+            max_entries: 최대 항목 수 (초과 시 최근 사용 시각이 오래된 항목부터 삭제)
+        """
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_days * 24 * 3600
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entry_count = None  # 첫 저장 시 폴더를 스캔하여 계산
+        self._lock = threading.Lock()
+        self._inflight = {}
+        self._inflight_async = {}
+
+    @classmethod
+    def from_env(cls) -> "SummaryCache":
+        """환경변수(SUMMARY_CACHE_DIR, SUMMARY_CACHE_TTL_DAYS, SUMMARY_CACHE_MAX_ENTRIES)로 생성"""
+        return cls(
+            cache_dir=os.getenv("SUMMARY_CACHE_DIR", "output/summary_cache"),
+            ttl_days=float(os.getenv("SUMMARY_CACHE_TTL_DAYS", "90")),
+            max_entries=int(os.getenv("SUMMARY_CACHE_MAX_ENTRIES", "5000"))
+        )
+
+    @staticmethod
+    def make_key(model: str, prompt_version: str, temperature: float, text: str) -> str:
+        """캐시 키 생성"""
+        raw = json.dumps([model, prompt_version, temperature, text], ensure_ascii=False)
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict]:
+        """캐시 조회 (없거나 만료되면 None)"""
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+
+        if time.time() - entry.get("created_at", 0) > self.ttl_seconds:
+            self._remove(path)
+            self.misses += 1
+            return None
+
+        # 최근 사용 시각 갱신 (크기 초과 시 삭제 순서 기준)
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+        self.hits += 1
+        return entry["value"]
+
+    def put(self, key: str, value: Dict):
+        """캐시 저장"""
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        is_new = not os.path.exists(path)
+
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({"created_at": time.time(), "value": value}, f, ensure_ascii=False)
+        os.replace(temp_path, path)
+
+        with self._lock:
+            if self._entry_count is None:
+                self._entry_count = len(self._list_entries())
+            elif is_new:
+                self._entry_count += 1
+            if self._entry_count > self.max_entries:
+                self._evict()
+
+    def _list_entries(self):
+        """(최근 사용 시각, 경로) 목록"""
+        entries = []
+        if not os.path.exists(self.cache_dir):
+            return entries
+        for shard in os.listdir(self.cache_dir):
+            shard_dir = os.path.join(self.cache_dir, shard)
+            if not os.path.isdir(shard_dir):
+                continue
+            for name in os.listdir(shard_dir):
+                if name.endswith(".json"):
+                    path = os.path.join(shard_dir, name)
+                    try:
+                        entries.append((os.path.getmtime(path), path))
+                    except OSError:
+                        continue
+        return entries
+
+    def _evict(self):
+        """최대 항목 수의 90%가 될 때까지 오래된 항목 삭제 (호출 시 _lock 보유)"""
+        entries = sorted(self._list_entries())
+        target = int(self.max_entries * 0.9)
+        for _, path in entries[:max(0, len(entries) - target)]:
+            self._remove(path)
+        self._entry_count = min(len(entries), target)
+
+    def _remove(self, path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def get_or_compute(self, key: str, compute: Callable[[], Dict],
+                       cacheable: Callable[[Dict], bool] = lambda value: True) -> Tuple[Dict, bool]:
+        """
+        캐시에 있으면 반환, 없으면 계산 후 저장 (동일 키 동시 요청은 한 번만 계산)
+
+        Returns:
+            (결과, 캐시 적중 여부)
+        """
+        cached = self.get(key)
+        if cached is not None:
+            return cached, True
+
+        with self._lock:
+            event = self._inflight.get(key)
+            owner = event is None
+            if owner:
+                event = threading.Event()
+                self._inflight[key] = event
+
+        if not owner:
+            # 같은 입력을 처리 중인 요청이 끝나면 그 결과를 사용
+            event.wait()
+            cached = self.get(key)
+            if cached is not None:
+                return cached, True
+            return compute(), False
+
+        try:
+            value = compute()
+            if cacheable(value):
+                self.put(key, value)
+            return value, False
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            event.set()
+
+    async def get_or_compute_async(self, key: str, compute: Callable[[], Awaitable[Dict]],
+                                   cacheable: Callable[[Dict], bool] = lambda value: True) -> Tuple[Dict, bool]:
+        """get_or_compute의 asyncio 버전"""
+        cached = self.get(key)
+        if cached is not None:
+            return cached, True
+
+        task = self._inflight_async.get(key)
+        owner = task is None
+        if owner:
+            task = asyncio.ensure_future(compute())
+            self._inflight_async[key] = task
+            task.add_done_callback(lambda _: self._inflight_async.pop(key, None))
+
+        value = await task
+        if owner:
+            if cacheable(value):
+                self.put(key, value)
+            return value, False
+        return value, cacheable(value)
+
+    def get_stats(self) -> Dict:
+        """적중률 통계"""
+        total = self.hits + self.misses
+        return {
+            "적중": self.hits,
+            "미적중": self.misses,
+            "적중률": self.hits / total if total else 0.0
+        }
+
+
+if __name__ == "__main__":
+    # 테스트 코드
+    import tempfile
+    from concurrent.futures import ThreadPoolExecutor
+
+    print("🧪 요약 캐시 테스트")
+    print("=" * 50)
+
+    cache = SummaryCache(cache_dir=tempfile.mkdtemp(), max_entries=10)
+    key = SummaryCache.make_key("model", "1", 0.3, "사업개요 원문")
+    calls = []
+
+    def slow_compute():
+        calls.append(1)
+        time.sleep(0.2)
+        return {"success": True, "summary": {"사업목적": "테스트"}}
+
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        outcomes = list(pool.map(lambda _: cache.get_or_compute(key, slow_compute), range(5)))
+    print(f"동시 요청 5건 → 실제 계산 {len(calls)}회, 적중 {sum(hit for _, hit in outcomes)}건")
+
+    started = time.perf_counter()
+    value, hit = cache.get_or_compute(key, slow_compute)
+    print(f"재조회: 적중={hit}, {(time.perf_counter() - started) * 1e6:.0f}µs")
+
+    for i in range(15):
+        cache.put(SummaryCache.make_key("model", "1", 0.3, f"문서 {i}"), {"success": True})
+    print(f"15건 추가 후 항목 수: {len(cache._list_entries())} (최대 10)")
+    print(f"통계: {cache.get_stats()}")
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+요약 이력 저장소
+이전 공고의 사업개요 원문과 요약을 보관하고, 정정공고/다음 연도 공고가 들어오면
+제목과 부처명으로 가장 가까운 이전 공고를 찾아 바뀐 부분만 계산
+"""
+
+import difflib
+import os
+import re
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from .event_log import EventLog
+
+# 제목 비교 시 무시할 표현 (연도, 재공고/정정 표기 등)
+_TITLE_NOISE_PATTERNS = [
+    r'\d{4}\s*년도?',
+    r'\(?\s*(재공고|정정공고|정정|변경공고|추가공고|연장공고)\s*\)?',
+    r'[\[\]\(\)「」『』<>〈〉"\'·ㆍ,]',
+    r'\s+'
+]
+
+
+def normalize_title(title: str) -> str:
+    """연도/재공고 표기/괄호/공백을 제거한 비교용 제목"""
+    normalized = title or ""
+    for pattern in _TITLE_NOISE_PATTERNS:
+        normalized = re.sub(pattern, '', normalized)
+    return normalized.lower()
+
+
+def split_passages(text: str) -> List[str]:
+    """줄/문장 단위로 나눈 비교용 구절 목록"""
+    passages = []
+    for line in (text or "").split('\n'):
+        for sentence in re.split(r'(?<=[.다])\s+', line.strip()):
+            sentence = re.sub(r'\s+', ' ', sentence).strip()
+            if sentence:
+                passages.append(sentence)
+    return passages
+
+
+def compute_text_changes(prior_text: str, new_text: str) -> Dict:
+    """
+    이전 원문 대비 새 원문의 변경 구절 계산
+
+    Returns:
+        {"added": [새로 생기거나 바뀐 구절], "removed": [사라진 구절], "changed_ratio": 0~1}
+    """
+    prior_passages = split_passages(prior_text)
+    new_passages = split_passages(new_text)
+
+    matcher = difflib.SequenceMatcher(a=prior_passages, b=new_passages, autojunk=False)
+    added, removed = [], []
+    for tag, a_start, a_end, b_start, b_end in matcher.get_opcodes():
+        if tag in ("replace", "delete"):
+            removed.extend(prior_passages[a_start:a_end])
+        if tag in ("replace", "insert"):
+            added.extend(new_passages[b_start:b_end])
+
+    new_chars = sum(len(p) for p in new_passages) or 1
+    changed_ratio = min(1.0, sum(len(p) for p in added) / new_chars)
+    return {"added": added, "removed": removed, "changed_ratio": changed_ratio}
+
+
+class SummaryHistory:
+    """이전 공고 원문/요약 저장소"""
+
+    def __init__(self, history_file: str = "output/summary_history.json", title_threshold: float = 0.75):
+        """
+        초기화
+
+        Args:
+            history_file: 이력 스냅샷 파일 (새 기록은 같은 위치의 .log.jsonl에 추가)
+            title_threshold: 같은 사업으로 볼 최소 제목 유사도 (정규화 후 SequenceMatcher 비율)
+        """
+        self.history_file = history_file
+        self.title_threshold = title_threshold
+        self.records = {}  # uid -> {"공고명", "부처명", "front_text", "summary", "updated_at"}
+        self._loaded = False
+        self._lock = threading.RLock()
+        self.log = EventLog.from_env(history_file)
+
+    def load(self):
+        """저장된 이력 로드 (프로세스당 한 번)"""
+        with self._lock:
+            if self._loaded:
+                return
+            self._loaded = True
+            try:
+                records, events = self.log.read()
+            except Exception as e:
+                print(f"⚠️ 요약 이력 로드 실패: {str(e)}")
+                return
+            self.records = records or {}
+            for event in events:
+                if event.get("op") == "put":
+                    self.records[event["uid"]] = event["record"]
+            if self.records:
+                print(f"📂 요약 이력 로드: {len(self.records)}건 (로그 {len(events)}건 재생)")
+
+    def _snapshot(self):
+        """압축용 (이력 전체, 마지막 이벤트 번호)"""
+        with self._lock:
+            return dict(self.records), self.log.seq
+
+    def save(self):
+        """새 기록을 디스크에 확정 (로그가 길어졌으면 스냅샷으로 압축)"""
+        with self._lock:
+            if not self._loaded:
+                return
+            self.log.sync()
+            if self.log.needs_compaction:
+                self.log.compact(self._snapshot)
+                print(f"💾 요약 이력 스냅샷 저장: {len(self.records)}건")
+
+    def record(self, uid: str, title: str, ministry: str, front_text: str, summary: Dict):
+        """요약이 끝난 공고 기록"""
+        if not uid or not front_text:
+            return
+        self.load()
+        with self._lock:
+            self.records[uid] = {
+                "공고명": title,
+                "부처명": ministry,
+                "front_text": front_text,
+                "summary": summary,
+                "updated_at": datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
+            }
+            self.log.append({"op": "put", "uid": uid, "record": self.records[uid]})
+
+    def find_prior(self, title: str, ministry: str, exclude_uid: str = "") -> Optional[Dict]:
+        """
+        같은 부처의 제목이 가장 비슷한 이전 공고 반환
+
+        Returns:
+            {"uid", "title_similarity", "공고명", "부처명", "front_text", "summary"} 또는 None
+        """
+        target = normalize_title(title)
+        if not target:
+            return None
+        self.load()
+
+        best_uid, best_ratio = None, 0.0
+        with self._lock:
+            for uid, record in self.records.items():
+                if uid == exclude_uid or (ministry and record.get("부처명") != ministry):
+                    continue
+                matcher = difflib.SequenceMatcher(a=target, b=normalize_title(record.get("공고명", "")))
+                # 상한 비율로 먼저 걸러서 비싼 ratio() 계산 줄이기
+                if matcher.real_quick_ratio() < self.title_threshold or matcher.quick_ratio() < self.title_threshold:
+                    continue
+                ratio = matcher.ratio()
+                if ratio > best_ratio:
+                    best_uid, best_ratio = uid, ratio
+
+            if best_uid is None or best_ratio < self.title_threshold:
+                return None
+            return dict(self.records[best_uid], uid=best_uid, title_similarity=best_ratio)
+
+
+if __name__ == "__main__":
+    # 테스트 코드
+    import tempfile
+
+    print("🧪 요약 이력 테스트")
+    print("=" * 50)
+
+    history = SummaryHistory(history_file=os.path.join(tempfile.mkdtemp(), "history.json"))
+    prior_text = ("1. 사업목적\n제조 AI 확산을 통해 중소기업 생산성을 높인다.\n"
+                  "2. 지원규모\n총 50억원, 과제당 5억원 내외.\n3. 접수기간\n2024.03.01 ~ 2024.03.31")
+    history.record("1200000", "2024년도 제조 AI 확산 지원사업", "산업통상자원부", prior_text, {"사업목적": "제조 AI 확산"})
+
+    new_title = "2025년도 제조 AI 확산 지원사업 (정정공고)"
+    new_text = prior_text.replace("총 50억원", "총 70억원").replace("2024.03", "2025.03")
+    prior = history.find_prior(new_title, "산업통상자원부")
+    print(f"이전 공고: {prior['공고명']} (제목 유사도 {prior['title_similarity']:.2f})")
+
+    changes = compute_text_changes(prior["front_text"], new_text)
+    print(f"추가/변경: {changes['added']}")
+    print(f"삭제: {changes['removed']}")
+    print(f"변경 비율: {changes['changed_ratio']:.2f}")
+    print(f"다른 부처: {history.find_prior(new_title, '과학기술정보통신부')}")
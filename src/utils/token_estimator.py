@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+토큰 수 추정기
+한글/그 외 문자를 나누어 토큰 수를 추정하고, count_tokens API와 응답 usage로 보정 계수를 학습
+- 입력을 토큰 예산에 맞춰 문장 경계에서 자르기
+- 최근 출력 토큰 분포로 max_tokens 제안
+- 호출별 토큰 통계를 파일로 저장하여 예산 조정에 사용
+"""
+
+import json
+import os
+import re
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+# 한글 음절/자모
+_HANGUL_PATTERN = re.compile(r'[가-힣ᄀ-ᇿ㄰-㆏]')
+
+# 문장 경계 (마침표류 뒤 공백, 명사형 종결 뒤 항목 기호/번호, 줄바꿈)
+_SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?。])\s+|(?<=[음함됨임])\s+(?=[□○●※\-•·]|\d+[.)])|\n+')
+
+
+class TokenEstimator:
+    """문자 종류별 비율 + 학습된 보정 계수 기반 토큰 추정기"""
+
+    def __init__(self, stats_file: Optional[str] = "output/token_stats.json",
+                 hangul_chars_per_token: float = 1.2, other_chars_per_token: float = 3.5,
+                 max_history: int = 500):
+        """
+        초기화
+
+        Args:
+            stats_file: 보정 계수/호출 통계 저장 파일 (None이면 저장하지 않음)
+            hangul_chars_per_token: 보정 전 한글 글자당 토큰 비율
+            other_chars_per_token: 보정 전 그 외 글자당 토큰 비율
+            max_history: 보관할 최근 호출 통계 수
+        """
+        self.stats_file = stats_file
+        self.hangul_chars_per_token = hangul_chars_per_token
+        self.other_chars_per_token = other_chars_per_token
+        self.max_history = max_history
+
+        self.scale = 1.0  # 실제 토큰 수 / 보정 전 추정치 (지수이동평균)
+        self.samples = 0
+        self.calls = []  # 최근 호출 통계
+        self._dirty = False
+        self._lock = threading.Lock()
+        self.load()
+
+    @classmethod
+    def from_env(cls) -> "TokenEstimator":
+        """환경변수(TOKEN_STATS_FILE)로 생성"""
+        return cls(stats_file=os.getenv("TOKEN_STATS_FILE", "output/token_stats.json"))
+
+    def load(self):
+        """저장된 보정 계수와 호출 통계 로드"""
+        if not self.stats_file or not os.path.exists(self.stats_file):
+            return
+        try:
+            with open(self.stats_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.scale = float(data.get("scale", 1.0))
+            self.samples = int(data.get("samples", 0))
+            self.calls = data.get("calls", [])[-self.max_history:]
+        except Exception as e:
+            print(f"⚠️ 토큰 통계 로드 실패: {str(e)}")
+
+    def save(self):
+        """변경된 보정 계수와 호출 통계 저장 (임시 파일 작성 후 교체)"""
+        with self._lock:
+            if not self.stats_file or not self._dirty:
+                return
+            os.makedirs(os.path.dirname(self.stats_file) or ".", exist_ok=True)
+            temp_file = f"{self.stats_file}.tmp"
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump({
+                    "scale": self.scale,
+                    "samples": self.samples,
+                    "calls": self.calls
+                }, f, ensure_ascii=False)
+            os.replace(temp_file, self.stats_file)
+            self._dirty = False
+
+    def raw_estimate(self, text: str) -> float:
+        """보정 전 토큰 수 추정"""
+        if not text:
+            return 0.0
+        hangul = len(_HANGUL_PATTERN.findall(text))
+        return hangul / self.hangul_chars_per_token + (len(text) - hangul) / self.other_chars_per_token
+
+    def estimate(self, text: str) -> int:
+        """보정 계수를 적용한 토큰 수 추정"""
+        return int(self.raw_estimate(text) * self.scale) + 1
+
+    @property
+    def calibrated(self) -> bool:
+        """보정 표본이 충분한지 여부"""
+        return self.samples >= 3
+
+    def observe(self, raw_estimate: float, actual_tokens: int):
+        """실제 토큰 수로 보정 계수 갱신 (초기에는 빠르게, 이후에는 완만하게 반영)"""
+        if raw_estimate <= 0 or actual_tokens <= 0:
+            return
+        with self._lock:
+            ratio = actual_tokens / raw_estimate
+            alpha = max(0.1, 1.0 / (self.samples + 1))
+            self.scale = ratio if self.samples == 0 else (1 - alpha) * self.scale + alpha * ratio
+            self.samples += 1
+            self._dirty = True
+
+    def split_sentences(self, text: str) -> List[str]:
+        """문장 단위 분리 (구분자 뒤 공백 보존 없이 문장만 반환)"""
+        return [sentence for sentence in _SENTENCE_BOUNDARY.split(text or "") if sentence and sentence.strip()]
+
+    def truncate_to_budget(self, text: str, budget_tokens: int) -> Tuple[str, bool]:
+        """
+        토큰 예산 안에 들어가도록 문장 경계에서 자르기
+
+        Returns:
+            (잘린 텍스트, 잘렸는지 여부)
+        """
+        if self.estimate(text) <= budget_tokens:
+            return text, False
+
+        kept = []
+        used = 0
+        for sentence in self.split_sentences(text):
+            cost = self.estimate(sentence + " ")
+            if used + cost > budget_tokens:
+                break
+            kept.append(sentence)
+            used += cost
+
+        if not kept:
+            # 첫 문장부터 예산을 넘으면 글자 수 비율로 자름
+            sentences = self.split_sentences(text)
+            first = sentences[0] if sentences else text
+            ratio = budget_tokens / max(1, self.estimate(first))
+            return first[:max(1, int(len(first) * ratio))], True
+        return " ".join(kept), True
+
+    def suggest_max_tokens(self, default: int = 1000, minimum: int = 300, maximum: int = 2000,
+                           margin: float = 1.3) -> int:
+        """
+        최근 출력 토큰 분포로 max_tokens 제안
+
+        - 표본이 적으면 default
+        - 95백분위 출력 토큰 x margin
+        - 최근 max_tokens에 걸려 잘린 응답이 있으면 그 한도의 1.5배 이상
+        """
+        with self._lock:
+            recent = self.calls[-100:]
+        outputs = sorted(call["output_tokens"] for call in recent if call.get("output_tokens"))
+        if len(outputs) < 5:
+            return default
+
+        p95 = outputs[min(len(outputs) - 1, int(len(outputs) * 0.95))]
+        suggestion = int(p95 * margin) + 50
+        for call in recent[-20:]:
+            if call.get("stop_reason") == "max_tokens":
+                suggestion = max(suggestion, int(call.get("max_tokens", 0) * 1.5))
+        return max(minimum, min(maximum, suggestion))
+
+    def record_call(self, raw_estimate: float, actual_input: int, output_tokens: int, max_tokens: int,
+                    stop_reason: str = "", input_chars: int = 0, truncated: bool = False):
+        """호출 1건의 토큰 통계 기록 및 보정 계수 갱신"""
+        estimated = int(raw_estimate * self.scale) + 1
+        self.observe(raw_estimate, actual_input)
+        with self._lock:
+            self.calls.append({
+                "time": datetime.now().strftime("%Y-%m-%dT%H:%M:%S"),
+                "estimated_input": estimated,
+                "actual_input": actual_input,
+                "output_tokens": output_tokens,
+                "max_tokens": max_tokens,
+                "stop_reason": stop_reason or "",
+                "input_chars": input_chars,
+                "truncated_input": truncated
+            })
+            del self.calls[:-self.max_history]
+            self._dirty = True
+
+    def get_stats(self) -> Dict:
+        """호출 통계 요약"""
+        with self._lock:
+            calls = list(self.calls)
+        if not calls:
+            return {"호출": 0, "보정계수": round(self.scale, 3)}
+
+        errors = [
+            abs(call["estimated_input"] - call["actual_input"]) / call["actual_input"]
+            for call in calls if call.get("actual_input")
+        ]
+        outputs = [call["output_tokens"] for call in calls]
+        usage = [call["output_tokens"] / call["max_tokens"] for call in calls if call.get("max_tokens")]
+        return {
+            "호출": len(calls),
+            "보정계수": round(self.scale, 3),
+            "입력추정_평균오차": round(sum(errors) / len(errors), 3) if errors else 0.0,
+            "평균_입력토큰": int(sum(call["actual_input"] for call in calls) / len(calls)),
+            "평균_출력토큰": int(sum(outputs) / len(outputs)),
+            "max_tokens_평균사용률": round(sum(usage) / len(usage), 3) if usage else 0.0,
+            "출력잘림": sum(1 for call in calls if call.get("stop_reason") == "max_tokens"),
+            "입력잘림": sum(1 for call in calls if call.get("truncated_input"))
+        }
+
+
+if __name__ == "__main__":
+    # 테스트 코드
+    import random
+
+    print("🧪 토큰 추정기 테스트")
+    print("=" * 50)
+
+    estimator = TokenEstimator(stats_file=None)
+    text = ("본 사업은 AI 기술의 해외 우수 인재를 국내로 유치하여 AI 분야의 기술 경쟁력을 강화하고자 합니다. "
+            "지원규모는 총 100억원이며, 개인당 최대 5억원까지 3년간 지원됩니다. ") * 30
+    print(f"보정 전 추정: {estimator.estimate(text):,} 토큰 ({len(text):,}자)")
+
+    # 실제 토큰 수가 추정치의 1.25배라고 가정하고 보정
+    for _ in range(5):
+        raw = estimator.raw_estimate(text)
+        estimator.record_call(raw, int(raw * 1.25), random.randint(350, 600), 1000, "end_turn", len(text))
+    print(f"보정 후 추정: {estimator.estimate(text):,} 토큰 (보정계수 {estimator.scale:.2f})")
+
+    truncated, was_cut = estimator.truncate_to_budget(text, 500)
+    print(f"500 토큰 예산으로 자름: {len(truncated):,}자, 잘림={was_cut}, 끝: ...{truncated[-20:]}")
+    print(f"제안 max_tokens: {estimator.suggest_max_tokens()}")
+    print(f"통계: {estimator.get_stats()}")
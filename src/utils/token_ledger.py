@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+토큰/비용 사용 장부
+요약 결과 metadata의 input_tokens/output_tokens(캐시 적중은 0)를 날짜별로 누적하고
+일/월 한도(토큰, USD)를 넘지 않도록 요청 전 예약을 확인
+- 실행이 바뀌어도 누적되도록 파일에 저장 (요청마다 이벤트 로그에 한 줄 추가, 스냅샷은 주기적으로 압축)
+- 예산 부족으로 다음 실행으로 넘긴 공고 목록도 함께 보관
+"""
+
+import os
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from .event_log import EventLog
+
+
+class TokenLedger:
+    """일/월 토큰·비용 한도 관리 장부"""
+
+    def __init__(self, ledger_file: str = "output/token_ledger.json", daily_tokens: int = 0,
+                 monthly_tokens: int = 0, daily_cost: float = 0.0, monthly_cost: float = 0.0,
+                 keep_days: int = 400):
+        """
+        초기화
+
+        Args:
+            ledger_file: 장부 스냅샷 파일 (변경분은 같은 위치의 .log.jsonl에 추가)
+            daily_tokens: 하루 최대 토큰 수 (입력+출력, 0이면 제한 없음)
+            monthly_tokens: 한 달 최대 토큰 수 (0이면 제한 없음)
+            daily_cost: 하루 최대 비용 USD (0이면 제한 없음)
+            monthly_cost: 한 달 최대 비용 USD (0이면 제한 없음)
+            keep_days: 보관할 일별 기록 수
+        """
+        self.ledger_file = ledger_file
+        self.daily_tokens = daily_tokens
+        self.monthly_tokens = monthly_tokens
+        self.daily_cost = daily_cost
+        self.monthly_cost = monthly_cost
+        self.keep_days = keep_days
+
+        self.days = {}      # "YYYY-MM-DD" -> {"input_tokens", "output_tokens", "cost_usd", "requests"}
+        self.deferred = {}  # roRndUid -> 다음 실행으로 넘긴 공고
+        self.reserved_tokens = 0  # 진행 중인 요청의 예상 토큰
+        self.reserved_cost = 0.0  # 진행 중인 요청의 예상 비용 (USD)
+        self._lock = threading.Lock()
+        self.log = EventLog.from_env(ledger_file)
+        self.load()
+
+    @classmethod
+    def from_env(cls) -> "TokenLedger":
+        """
+        환경변수로 생성
+        TOKEN_LEDGER_FILE, TOKEN_BUDGET_DAILY, TOKEN_BUDGET_MONTHLY, COST_BUDGET_DAILY_USD, COST_BUDGET_MONTHLY_USD
+        """
+        return cls(
+            ledger_file=os.getenv("TOKEN_LEDGER_FILE", "output/token_ledger.json"),
+            daily_tokens=int(os.getenv("TOKEN_BUDGET_DAILY", "0")),
+            monthly_tokens=int(os.getenv("TOKEN_BUDGET_MONTHLY", "0")),
+            daily_cost=float(os.getenv("COST_BUDGET_DAILY_USD", "0")),
+            monthly_cost=float(os.getenv("COST_BUDGET_MONTHLY_USD", "0"))
+        )
+
+    @property
+    def limited(self) -> bool:
+        """한도가 하나라도 설정되어 있는지 여부"""
+        return any(cap > 0 for cap in (self.daily_tokens, self.monthly_tokens, self.daily_cost, self.monthly_cost))
+
+    def load(self):
+        """저장된 장부 로드 (스냅샷 + 이후 변경 이벤트 재생)"""
+        try:
+            data, events = self.log.read()
+        except Exception as e:
+            print(f"⚠️ 토큰 장부 로드 실패: {str(e)}")
+            return
+        data = data or {}
+        self.days = data.get("days", {})
+        self.deferred = data.get("deferred", {})
+        for event in events:
+            self._apply(event)
+
+    def _apply(self, event: Dict):
+        """변경 이벤트 1건 반영 (잠금 안에서 호출)"""
+        op = event.get("op")
+        if op == "usage":
+            usage = self.days.setdefault(event["day"], {"input_tokens": 0, "output_tokens": 0, "cost_usd": 0.0, "requests": 0})
+            usage["input_tokens"] += event.get("input_tokens", 0)
+            usage["output_tokens"] += event.get("output_tokens", 0)
+            usage["cost_usd"] = round(usage["cost_usd"] + event.get("cost_usd", 0.0), 6)
+            usage["requests"] += 1
+        elif op == "defer":
+            self.deferred[event["uid"]] = event["announcement"]
+        elif op == "resolve":
+            self.deferred.pop(event["uid"], None)
+
+    def _append(self, event: Dict):
+        """변경 이벤트 반영 후 로그에 추가 (잠금 안에서 호출, 로그가 길어지면 백그라운드 압축)"""
+        self._apply(event)
+        self.log.append(event)
+        if self.log.needs_compaction:
+            self.log.compact_async(self._snapshot)
+
+    def _snapshot(self):
+        """압축용 (상태, 마지막 이벤트 번호)"""
+        with self._lock:
+            for day in sorted(self.days)[:-self.keep_days]:
+                del self.days[day]
+            return ({"days": {day: dict(usage) for day, usage in self.days.items()}, "deferred": dict(self.deferred)},
+                    self.log.seq)
+
+    def save(self):
+        """장부 스냅샷 저장 (쌓인 이벤트를 스냅샷으로 합치고 로그 비우기)"""
+        if self.log.seq and self.log.seq > self.log.snapshot_seq:
+            self.log.wait_compaction()
+            self.log.compact(self._snapshot)
+
+    def _usage(self, prefix: str) -> Dict:
+        """날짜 접두어("YYYY-MM-DD" 또는 "YYYY-MM")에 해당하는 사용량 합계"""
+        total = {"tokens": 0, "cost_usd": 0.0, "requests": 0}
+        for day, usage in self.days.items():
+            if day.startswith(prefix):
+                total["tokens"] += usage.get("input_tokens", 0) + usage.get("output_tokens", 0)
+                total["cost_usd"] += usage.get("cost_usd", 0.0)
+                total["requests"] += usage.get("requests", 0)
+        return total
+
+    def _remaining(self) -> Dict:
+        """남은 토큰/비용, 진행 중인 예약 제외 (잠금 안에서 호출, 한도가 없으면 None)"""
+        now = datetime.now()
+        today = self._usage(now.strftime("%Y-%m-%d"))
+        month = self._usage(now.strftime("%Y-%m"))
+
+        token_limits = [cap - used["tokens"] - self.reserved_tokens for cap, used in
+                        ((self.daily_tokens, today), (self.monthly_tokens, month)) if cap > 0]
+        cost_limits = [cap - used["cost_usd"] - self.reserved_cost for cap, used in
+                       ((self.daily_cost, today), (self.monthly_cost, month)) if cap > 0]
+        return {
+            "tokens": min(token_limits) if token_limits else None,
+            "cost_usd": min(cost_limits) if cost_limits else None
+        }
+
+    def remaining(self) -> Dict:
+        """남은 토큰/비용 (한도가 없으면 None)"""
+        with self._lock:
+            return self._remaining()
+
+    def try_reserve(self, tokens: int, cost_usd: float = 0.0) -> bool:
+        """
+        예상 토큰/비용만큼 예약 (토큰이든 비용이든 한도를 넘으면 False)
+        확인과 예약을 한 잠금 안에서 하므로 동시에 요청하는 작업자들이 한도를 넘겨 예약하지 않음
+        """
+        if not self.limited:
+            return True
+        with self._lock:
+            left = self._remaining()
+            if left["tokens"] is not None and tokens > left["tokens"]:
+                return False
+            if left["cost_usd"] is not None and (left["cost_usd"] <= 0 or cost_usd > left["cost_usd"]):
+                return False
+            self.reserved_tokens += tokens
+            self.reserved_cost += cost_usd
+            return True
+
+    def _release(self, reserved_tokens: int, reserved_cost: float):
+        """예약 해제 (잠금 안에서 호출)"""
+        self.reserved_tokens = max(0, self.reserved_tokens - reserved_tokens)
+        self.reserved_cost = max(0.0, self.reserved_cost - reserved_cost)
+
+    def record(self, input_tokens: int, output_tokens: int, cost_usd: float = 0.0, reserved_tokens: int = 0,
+               reserved_cost: float = 0.0):
+        """실제 사용량 기록 및 예약 해제 (캐시 적중처럼 토큰 0인 요청도 요청 수에는 포함)"""
+        day = datetime.now().strftime("%Y-%m-%d")
+        with self._lock:
+            self._release(reserved_tokens, reserved_cost)
+            self._append({"op": "usage", "day": day, "input_tokens": input_tokens or 0,
+                          "output_tokens": output_tokens or 0, "cost_usd": cost_usd or 0.0})
+
+    def release(self, reserved_tokens: int, reserved_cost: float = 0.0):
+        """사용하지 않은 예약 해제"""
+        with self._lock:
+            self._release(reserved_tokens, reserved_cost)
+
+    def defer(self, uid: str, announcement: Dict):
+        """예산 부족으로 요약하지 못한 공고를 다음 실행으로 넘김"""
+        if not uid:
+            return
+        with self._lock:
+            self._append({"op": "defer", "uid": uid, "announcement": {
+                key: value for key, value in announcement.items()
+                if key not in ("ai_요약", "ai_메타데이터", "요약_처리시간")
+            }})
+
+    def resolve(self, uid: str):
+        """넘긴 공고가 요약되면 목록에서 제거"""
+        with self._lock:
+            if uid in self.deferred:
+                self._append({"op": "resolve", "uid": uid})
+
+    def deferred_announcements(self) -> List[Dict]:
+        """다음 실행으로 넘겨진 공고 목록"""
+        with self._lock:
+            return list(self.deferred.values())
+
+    def get_stats(self) -> Dict:
+        """오늘/이번 달 사용량과 남은 한도"""
+        now = datetime.now()
+        with self._lock:
+            today = self._usage(now.strftime("%Y-%m-%d"))
+            month = self._usage(now.strftime("%Y-%m"))
+            left = self._remaining()
+        return {
+            "오늘_토큰": today["tokens"],
+            "오늘_비용_USD": round(today["cost_usd"], 4),
+            "이번달_토큰": month["tokens"],
+            "이번달_비용_USD": round(month["cost_usd"], 4),
+            "남은_토큰": left["tokens"],
+            "남은_비용_USD": round(left["cost_usd"], 4) if left["cost_usd"] is not None else None,
+            "이월_공고": len(self.deferred)
+        }
+
+
+def deadline_priority(announcement: Dict, today: Optional[datetime] = None):
+    """
+    예산이 부족할 때 처리 순서 정렬 키 (마감일이 가까운 공고 먼저)
+    이미 마감됐거나 마감일을 알 수 없는 공고는 뒤로
+    """
+    today = (today or datetime.now()).replace(hour=0, minute=0, second=0, microsecond=0)
+    try:
+        deadline = datetime.strptime(announcement.get("마감일", ""), "%Y.%m.%d")
+    except (TypeError, ValueError):
+        return (2, datetime.max)
+    if deadline < today:
+        return (1, today - deadline)
+    return (0, deadline - today)
+
+
+if __name__ == "__main__":
+    # 테스트 코드
+    import tempfile
+
+    print("🧪 토큰 장부 테스트")
+    print("=" * 50)
+
+    ledger_file = os.path.join(tempfile.mkdtemp(), "ledger.json")
+    ledger = TokenLedger(ledger_file=ledger_file, daily_tokens=10000, monthly_cost=1.0)
+
+    for _ in range(3):
+        if ledger.try_reserve(3000, cost_usd=0.002):
+            ledger.record(2500, 400, cost_usd=0.0011, reserved_tokens=3000, reserved_cost=0.002)
+    print(f"3건 기록 후: {ledger.get_stats()}")
+    print(f"3,000 토큰 추가 예약 가능: {ledger.try_reserve(3000)}")
+    print(f"비용 1달러 추가 예약 가능: {ledger.try_reserve(0, cost_usd=1.0)}")
+
+    ledger.defer("1247708", {"공고명": "(AI) 일반형 공동연구", "마감일": "2025.09.23", "ai_요약": {}})
+    ledger.log.close()
+    reloaded = TokenLedger(ledger_file=ledger_file, daily_tokens=10000)
+    print(f"재로드: {reloaded.get_stats()}")
+
+    announcements = [{"공고명": "A", "마감일": "2099.01.10"}, {"공고명": "B", "마감일": "2000.01.01"},
+                     {"공고명": "C", "마감일": "2099.01.02"}, {"공고명": "D", "마감일": ""}]
+    print(f"처리 순서: {[a['공고명'] for a in sorted(announcements, key=deadline_priority)]}")
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+다운로드 전 공고 분류 (triage)
+크롤링 목록만 보고 다운로드/파싱/요약 전에 공고를 걸러내거나 뒤로 미룸
+- 점수: 공고명에 나온 주요/보조/추가 키워드 가중치 합 (ntis-ui-elements.md의 PRIMARY/SECONDARY/TERTIARY_KEYWORDS)
+- 제외: EXCLUDE_KEYWORDS가 현황 또는 공고명에 있으면 제외 (예: 현황 '마감')
+- 마감일: 이미 지났거나 남은 일수가 최소 기준보다 적으면 제외
+- 키워드 점수가 기준 미만이면 제외하지 않고 맨 뒤로 (검색 결과는 본문에서 키워드가 걸린 경우도 있으므로)
+
+사용 예 (실제 처리 없이 절감량만 확인):
+    python hwp_to_json.py --triage-dry-run          (공고 저장소의 마지막 크롤링 신규 공고)
+    python -m src.utils.triage output/new_data.json (JSON 파일의 공고 목록)
+"""
+
+import os
+import sys
+from datetime import date
+from typing import Dict, Iterable, List, Optional
+
+from .announcement import Announcement
+
+KEEP = "keep"
+DEPRIORITIZE = "deprioritize"
+DROP = "drop"
+_DECISION_ORDER = {KEEP: 0, DEPRIORITIZE: 1, DROP: 2}
+
+# 요약 기록이 없을 때 공고 1건 처리에 드는 토큰 추정치 (앞부분 3,000자 입력 + 프롬프트 + 출력)
+DEFAULT_TOKENS_PER_ITEM = 4000
+
+
+class TriageEngine:
+    """키워드 가중치 + 제외어 + 현황/마감일 규칙 기반 공고 분류기"""
+
+    def __init__(self, keywords: Dict[str, List[str]], weights: Optional[Dict[str, float]] = None,
+                 min_score: float = 1.0, min_days_left: int = 0):
+        """
+        초기화
+
+        Args:
+            keywords: {"primary": [...], "secondary": [...], "tertiary": [...], "exclude": [...]}
+            weights: 분류별 가중치 (기본 primary 3, secondary 2, tertiary 1)
+            min_score: 이 점수 미만이면 뒤로 미룸
+            min_days_left: 마감까지 남은 일수가 이보다 적으면 제외 (0이면 오늘 마감까지 처리)
+        """
+        self.weights = weights or {"primary": 3.0, "secondary": 2.0, "tertiary": 1.0}
+        self.min_score = min_score
+        self.min_days_left = min_days_left
+        self.exclude = [keyword.lower() for keyword in keywords.get("exclude", []) if keyword]
+
+        # 같은 키워드가 여러 분류에 있으면 가장 큰 가중치 하나만 (비교는 소문자, 표시는 원래 표기)
+        self.keyword_weights = {}
+        self.keyword_labels = {}
+        for category, weight in self.weights.items():
+            for keyword in keywords.get(category, []):
+                if keyword:
+                    key = keyword.lower()
+                    self.keyword_weights[key] = max(weight, self.keyword_weights.get(key, 0.0))
+                    self.keyword_labels.setdefault(key, keyword)
+
+    @classmethod
+    def from_env(cls, keywords: Optional[Dict[str, List[str]]] = None) -> "TriageEngine":
+        """
+        환경변수로 생성 (키워드는 설정 문서에서)
+        TRIAGE_WEIGHTS("3,2,1"), TRIAGE_MIN_SCORE, TRIAGE_MIN_DAYS_LEFT
+        """
+        if keywords is None:
+            from .config_reader import get_search_keywords
+            keywords = get_search_keywords()
+        primary, secondary, tertiary = (float(w) for w in os.getenv("TRIAGE_WEIGHTS", "3,2,1").split(","))
+        return cls(
+            keywords,
+            weights={"primary": primary, "secondary": secondary, "tertiary": tertiary},
+            min_score=float(os.getenv("TRIAGE_MIN_SCORE", "1")),
+            min_days_left=int(os.getenv("TRIAGE_MIN_DAYS_LEFT", "0"))
+        )
+
+    def evaluate(self, announcement: Dict, today: Optional[date] = None) -> Dict:
+        """
+        공고 1건 분류
+
+        Returns:
+            {"decision": keep/deprioritize/drop, "score", "matched": [키워드], "reasons": [사유], "days_left"}
+        """
+        record = announcement if isinstance(announcement, Announcement) else Announcement.from_dict(announcement)
+        title = record.title.lower()
+        status = record.status.lower()
+
+        matched = [keyword for keyword in self.keyword_weights if keyword in title]
+        score = sum(self.keyword_weights[keyword] for keyword in matched)
+        matched = [self.keyword_labels[keyword] for keyword in matched]
+        days_left = record.days_left(today)
+        reasons = []
+
+        excluded = [keyword for keyword in self.exclude if keyword in status or keyword in title]
+        if excluded:
+            reasons.append(f"제외어: {', '.join(excluded)}")
+        if days_left is not None and days_left < self.min_days_left:
+            reasons.append("마감일 지남" if days_left < 0 else f"마감 {days_left}일 전")
+
+        if reasons:
+            decision = DROP
+        elif score < self.min_score:
+            decision = DEPRIORITIZE
+            reasons.append(f"키워드 점수 {score:g} < {self.min_score:g}")
+        else:
+            decision = KEEP
+        return {"decision": decision, "score": score, "matched": matched, "reasons": reasons, "days_left": days_left}
+
+    def triage(self, announcements: Iterable[Dict], today: Optional[date] = None) -> Dict:
+        """
+        공고 목록 분류
+
+        Returns:
+            {"order": [처리할 공고 인덱스 (keep → deprioritize, 같은 분류 안에서는 점수 높고 마감 가까운 순)],
+             "dropped": [제외 인덱스], "decisions": [공고별 evaluate 결과 (입력 순서)], "counts": {분류: 수}}
+        """
+        announcements = list(announcements)
+        decisions = [self.evaluate(announcement, today) for announcement in announcements]
+
+        def priority(i):
+            decision = decisions[i]
+            days_left = decision["days_left"] if decision["days_left"] is not None else float("inf")
+            return (_DECISION_ORDER[decision["decision"]], -decision["score"], days_left)
+
+        ranked = sorted(range(len(announcements)), key=priority)
+        counts = {KEEP: 0, DEPRIORITIZE: 0, DROP: 0}
+        for decision in decisions:
+            counts[decision["decision"]] += 1
+        return {
+            "order": [i for i in ranked if decisions[i]["decision"] != DROP],
+            "dropped": [i for i in ranked if decisions[i]["decision"] == DROP],
+            "decisions": decisions,
+            "counts": counts
+        }
+
+
+def average_tokens_per_item(token_estimator=None) -> int:
+    """요약 기록(입력+출력 토큰) 평균, 기록이 없으면 기본 추정치"""
+    calls = getattr(token_estimator, "calls", None) or []
+    totals = [call.get("actual_input", 0) + call.get("output_tokens", 0) for call in calls if call.get("actual_input")]
+    return int(sum(totals) / len(totals)) if totals else DEFAULT_TOKENS_PER_ITEM
+
+
+def print_triage_report(announcements: List[Dict], result: Dict, tokens_per_item: int = DEFAULT_TOKENS_PER_ITEM):
+    """분류 결과와 절감량 출력 (dry-run 리포트)"""
+    counts = result["counts"]
+    dropped = len(result["dropped"])
+    print(f"\n{'='*60}")
+    print("🧹 다운로드 전 공고 분류")
+    print(f"{'='*60}")
+    print(f"   처리: {counts[KEEP]}개, 뒤로 미룸: {counts[DEPRIORITIZE]}개, 제외: {counts[DROP]}개 (전체 {len(announcements)}개)")
+    for i in result["order"] + result["dropped"]:
+        decision = result["decisions"][i]
+        icon = {KEEP: "✅", DEPRIORITIZE: "⏬", DROP: "🚫"}[decision["decision"]]
+        detail = ", ".join(decision["reasons"]) or f"키워드 {', '.join(decision['matched'])}"
+        print(f"   {icon} [{decision['score']:g}점] {announcements[i].get('공고명', '')[:45]} - {detail}")
+    print(f"   💡 절감: 다운로드/파싱 {dropped}건, 요약 토큰 약 {dropped * tokens_per_item:,}개 "
+          f"(건당 {tokens_per_item:,} 토큰 기준)")
+
+
+def main():
+    """JSON 파일의 공고 목록을 실제 처리 없이 분류하고 절감량만 출력"""
+    import json
+
+    with open(sys.argv[1], 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    announcements = data.get("announcements", []) if isinstance(data, dict) else data
+
+    from .token_estimator import TokenEstimator
+    engine = TriageEngine.from_env()
+    result = engine.triage(announcements)
+    print_triage_report(announcements, result, average_tokens_per_item(TokenEstimator.from_env()))
+
+
+if __name__ == "__main__" and len(sys.argv) > 1:
+    main()
+elif __name__ == "__main__":
+    # 테스트 코드
+    print("🧪 공고 분류 테스트")
+    print("=" * 50)
+
+    keywords = {"primary": ["AI", "스마트팩토리"], "secondary": ["빅데이터", "IoT", "클라우드"],
+                "tertiary": ["디지털트윈", "메타버스"], "exclude": ["완료", "마감", "종료", "취소"]}
+    engine = TriageEngine(keywords)
+    samples = [
+        {"현황": "접수중", "공고명": "2025년 AI 기반 디지털트윈 실증", "마감일": "2025.10.10"},
+        {"현황": "접수중", "공고명": "클라우드 보안 기술개발", "마감일": "2025.09.30"},
+        {"현황": "마감", "공고명": "(AI) 일반형 공동연구", "마감일": "2025.09.23"},
+        {"현황": "접수중", "공고명": "해양 생태계 조사 연구", "마감일": "2025.10.01"},
+        {"현황": "접수예정", "공고명": "스마트팩토리 고도화 (취소)", "마감일": "2025.10.20"},
+        {"현황": "접수중", "공고명": "메타버스 플랫폼 표준화", "마감일": "2025.09.10"},
+    ]
+    result = engine.triage(samples, today=date(2025, 9, 18))
+    print_triage_report(samples, result)
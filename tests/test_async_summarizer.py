@@ -0,0 +1,137 @@
+"""AsyncClaudeSummarizer 동시 실행 제한/재시도 대기 테스트 (로컬 API 서버 사용)"""
+
+import asyncio
+
+from src.data_processor.claude_summarizer import AsyncClaudeSummarizer
+from src.data_processor.local_api_server import LocalClaudeServer
+from src.data_processor.summarizer_load_test import make_items
+from src.utils.rate_limiter import RateLimiter
+
+
+def unlimited_limiter():
+    return RateLimiter(requests_per_minute=0, input_tokens_per_minute=0, output_tokens_per_minute=0)
+
+
+def test_concurrency_cap_applies_without_explicit_semaphore():
+    with LocalClaudeServer(latency_median=0.1, latency_p95=0.1, seed=1) as server:
+        summarizer = AsyncClaudeSummarizer(api_key="local", base_url=server.base_url, max_concurrency=2,
+                                           rate_limiter=unlimited_limiter())
+
+        async def run(items):
+            # summarize_many를 거치지 않고 공고별로 따로 호출
+            return await asyncio.gather(*(
+                summarizer.summarize_business_overview_async(item["business_overview"], item["announcement_title"])
+                for item in items
+            ))
+
+        results = asyncio.run(run(make_items(6)))
+        # 이벤트 루프가 바뀌어도 다시 사용할 수 있어야 함
+        results += summarizer.summarize_many_sync(make_items(2))
+        stats = server.get_stats()
+
+    assert all(result["success"] for result in results)
+    assert stats["최대동시요청"] <= 2
+
+
+def test_overloaded_pauses_shared_limiter_but_server_error_does_not(monkeypatch):
+    import anthropic
+    import httpx
+
+    summarizer = AsyncClaudeSummarizer(api_key="local", base_url="http://127.0.0.1:9", max_retries=1,
+                                       rate_limiter=unlimited_limiter())
+    paused = []
+    monkeypatch.setattr(summarizer.rate_limiter, "pause", lambda seconds: paused.append(seconds))
+    monkeypatch.setattr("src.data_processor.claude_summarizer.backoff_delay", lambda attempt, retry_after=None: 0.0)
+
+    def failing(status_code):
+        async def create(**request):
+            response = httpx.Response(status_code, request=httpx.Request("POST", "http://127.0.0.1:9/v1/messages"))
+            raise anthropic.APIStatusError("error", response=response, body=None)
+        return create
+
+    monkeypatch.setattr(summarizer.async_client.messages, "create", failing(500))
+    result = asyncio.run(summarizer.summarize_business_overview_async("사업목적: AI 기술개발 지원" * 20, "테스트"))
+    assert not result["success"] and paused == []
+
+    monkeypatch.setattr(summarizer.async_client.messages, "create", failing(529))
+    asyncio.run(summarizer.summarize_business_overview_async("사업목적: AI 기술개발 지원" * 20, "테스트"))
+    assert len(paused) == 2
+
+
+def track_reservations(monkeypatch, limiter):
+    """예약(reserve)과 정리(settle) 호출 수 기록"""
+    calls = {"reserve": 0, "settle": 0}
+    reserve, settle = limiter.reserve, limiter.settle
+
+    def counting_reserve(*args):
+        calls["reserve"] += 1
+        return reserve(*args)
+
+    def counting_settle(*args):
+        calls["settle"] += 1
+        return settle(*args)
+
+    monkeypatch.setattr(limiter, "reserve", counting_reserve)
+    monkeypatch.setattr(limiter, "settle", counting_settle)
+    return calls
+
+
+def api_error(status_code):
+    import anthropic
+    import httpx
+
+    response = httpx.Response(status_code, request=httpx.Request("POST", "http://127.0.0.1:9/v1/messages"))
+    if status_code == 429:
+        return anthropic.RateLimitError("rate limited", response=response, body=None)
+    return anthropic.APIStatusError("error", response=response, body=None)
+
+
+def test_non_retryable_error_settles_async_reservation(monkeypatch):
+    summarizer = AsyncClaudeSummarizer(api_key="local", base_url="http://127.0.0.1:9", max_retries=2,
+                                       rate_limiter=unlimited_limiter())
+    calls = track_reservations(monkeypatch, summarizer.rate_limiter)
+
+    async def create(**request):
+        raise api_error(400)
+
+    monkeypatch.setattr(summarizer.async_client.messages, "create", create)
+    result = asyncio.run(summarizer.summarize_business_overview_async("사업목적: AI 기술개발 지원" * 20, "테스트"))
+    assert not result["success"]
+    assert calls == {"reserve": 1, "settle": 1}
+
+
+def test_sync_errors_settle_reservation(monkeypatch):
+    from src.data_processor.claude_summarizer import ClaudeSummarizer
+
+    summarizer = ClaudeSummarizer(api_key="local")
+    summarizer.cache = None
+    summarizer.rate_limiter = unlimited_limiter()
+    calls = track_reservations(monkeypatch, summarizer.rate_limiter)
+    monkeypatch.setattr(summarizer.rate_limiter, "pause", lambda seconds: None)
+
+    for error in (api_error(429), api_error(400), ValueError("예상하지 못한 오류")):
+        def create(**request):
+            raise error
+        monkeypatch.setattr(summarizer.client.messages, "create", create)
+        assert not summarizer.summarize_business_overview("사업목적: AI 기술개발 지원" * 20, "테스트")["success"]
+    assert calls == {"reserve": 3, "settle": 3}
+
+
+def test_summarize_many_keeps_results_when_one_item_raises(monkeypatch):
+    summarizer = AsyncClaudeSummarizer(api_key="local", base_url="http://127.0.0.1:9",
+                                       rate_limiter=unlimited_limiter())
+
+    async def flaky(business_overview, announcement_title="", semaphore=None):
+        if announcement_title == "오류":
+            raise ValueError("응답 파싱 실패")
+        return {"success": True, "summary": {"사업목적": announcement_title}, "metadata": {}}
+
+    monkeypatch.setattr(summarizer, "summarize_business_overview_async", flaky)
+    results = summarizer.summarize_many_sync([
+        {"business_overview": "본문", "announcement_title": "첫 공고"},
+        {"business_overview": "본문", "announcement_title": "오류"},
+        {"business_overview": "본문", "announcement_title": "셋째 공고"},
+    ])
+
+    assert [result["success"] for result in results] == [True, False, True]
+    assert "응답 파싱 실패" in results[1]["error"]
@@ -0,0 +1,78 @@
+"""BatchSummarizer 제출/재개 테스트 (LocalBatchClient 사용)"""
+
+import os
+
+from src.data_processor.batch_summarizer import BatchSummarizer, LocalBatchClient, make_local_message
+from src.data_processor.claude_summarizer import ClaudeSummarizer
+from src.utils.announcement_store import AnnouncementStore
+from src.utils.token_ledger import TokenLedger
+
+URL = "https://www.ntis.go.kr/rndgate/eg/un/ra/view.do?roRndUid={}&flag=rndList"
+TEXT = "사업목적: 인공지능 기반 제조 혁신 기술개발 및 현장 실증 지원, 총 30억원 규모로 3개 과제 선정"
+RESPONSE = """사업목적: 제조 혁신
+지원내용: AI 모델 개발
+지원규모: 총 30억원
+신청대상: 중소기업
+주요특징: 현장 실증"""
+
+
+def item(uid):
+    return {"uid": uid, "title": f"공고 {uid}", "text": TEXT}
+
+
+def test_run_resumes_unfinished_batch_before_submitting(tmp_path):
+    client = LocalBatchClient(lambda params: make_local_message(RESPONSE, 100, 50), polls_until_done=2)
+    summarizer = ClaudeSummarizer(api_key="")
+    state_file = str(tmp_path / "batch_state.json")
+
+    # 첫 실행: 대기 시간 안에 끝나지 않아 상태 파일만 남음
+    first = BatchSummarizer(summarizer, client, state_file=state_file, poll_interval=1)
+    assert first.run([item("1"), item("2")], timeout=0) == {}
+    assert os.path.exists(state_file)
+
+    store = AnnouncementStore(str(tmp_path / "ntis.db"))
+    store.upsert_announcements([{"공고명": "공고 2", "상세_URL": URL.format(2)}])
+
+    # 다음 실행: 새 배치를 제출하기 전에 이전 배치부터 수집
+    second = BatchSummarizer(summarizer, client, state_file=state_file, poll_interval=0)
+    results = second.run([item("1"), item("3")], store=store)
+
+    assert sorted(results) == ["1", "3"]
+    assert all(result["success"] for result in results.values())
+    assert len(client.batches) == 2
+    assert [request["custom_id"] for request in client.batches["local_batch_2"]["requests"]] == ["3"]
+    # 이번 목록에 없는 공고의 결과는 공고 저장소에 반영
+    assert store.get_announcement("2")["ai_요약"]["지원규모"]
+    assert not os.path.exists(state_file)
+
+
+def test_run_does_not_submit_while_previous_batch_in_progress(tmp_path):
+    client = LocalBatchClient(lambda params: make_local_message(RESPONSE), polls_until_done=10)
+    batch_summarizer = BatchSummarizer(ClaudeSummarizer(api_key=""), client,
+                                       state_file=str(tmp_path / "batch_state.json"), poll_interval=1)
+
+    batch_summarizer.run([item("1")], timeout=0)
+    assert batch_summarizer.run([item("1"), item("2")], timeout=0) == {}
+    assert len(client.batches) == 1
+    assert batch_summarizer.load_state()["batch_id"] == "local_batch_1"
+
+
+def test_collected_usage_is_recorded_in_ledger_including_resume(tmp_path):
+    client = LocalBatchClient(lambda params: make_local_message(RESPONSE, 100, 50), polls_until_done=2)
+    summarizer = ClaudeSummarizer(api_key="")
+    state_file = str(tmp_path / "batch_state.json")
+    ledger = TokenLedger(ledger_file=str(tmp_path / "token_ledger.json"), daily_tokens=100000)
+    store = AnnouncementStore(str(tmp_path / "ntis.db"))
+    store.upsert_announcements([{"공고명": f"공고 {uid}", "상세_URL": URL.format(uid)} for uid in ("1", "2")])
+
+    # 시간 초과로 끝나지 않은 배치는 아직 기록하지 않음
+    first = BatchSummarizer(summarizer, client, state_file=state_file, poll_interval=1, budget_ledger=ledger)
+    assert first.run([item("1"), item("2")], timeout=0) == {}
+    assert ledger.get_stats()["오늘_토큰"] == 0
+
+    # 별도 재개 경로로 수집해도 실제 사용량 기록 (배치 할인 반영)
+    resumed = BatchSummarizer(summarizer, client, state_file=state_file, poll_interval=0, budget_ledger=ledger)
+    assert resumed.resume(store=store) == 2
+    stats = ledger.get_stats()
+    assert stats["오늘_토큰"] == 2 * 150
+    assert stats["오늘_비용_USD"] > 0
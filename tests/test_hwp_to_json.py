@@ -0,0 +1,216 @@
+"""hwp_to_json.main() 파이프라인 테스트 (브라우저 다운로드/파싱은 가짜로 대체, API 키 없이 로컬 요약)"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import hwp_to_json
+from src.utils.announcement import extract_uid
+from src.utils.announcement_store import AnnouncementStore
+from src.utils.search_index import SearchIndex
+from src.utils.token_ledger import TokenLedger
+
+URL = "https://www.ntis.go.kr/rndgate/eg/un/ra/view.do?roRndUid={}&flag=rndList"
+
+FRONT_TEXT = """1. 사업목적
+인공지능 기반 제조 혁신 기술을 개발하고 실증하여 산업 경쟁력을 강화한다.
+2. 지원내용
+AI 모델 개발, 데이터 구축, 현장 실증을 지원한다.
+3. 지원규모
+총 30억원, 과제당 10억원 이내, 3개 과제 선정
+4. 신청대상
+중소기업, 대학, 연구기관 컨소시엄
+"""
+
+
+class FakeDriver:
+    def quit(self):
+        pass
+
+
+def announcement(uid, title="AI 기반 제조 혁신 실증", deadline="2099.12.31", status="접수중"):
+    return {"현황": status, "공고명": title, "부처명": "과학기술정보통신부",
+            "접수일": "2025.09.01", "마감일": deadline, "상세_URL": URL.format(uid)}
+
+
+@pytest.fixture
+def pipeline(tmp_path, monkeypatch):
+    """임시 디렉터리에서 main()을 실행하는 함수 반환 (다운로드된 공고 uid 목록 기록)"""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "ntis-ui-elements.md").write_text(
+        "PRIMARY_KEYWORDS=AI\nSECONDARY_KEYWORDS=디지털트윈\nTERTIARY_KEYWORDS=메타버스\nEXCLUDE_KEYWORDS=마감,취소\n",
+        encoding="utf-8"
+    )
+    monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+    db_path = str(tmp_path / "ntis.db")
+    for key, value in {"NTIS_DB_PATH": db_path, "SEARCH_INDEX": "0", "TRIAGE": "0", "RELEVANCE": "0",
+                       "SUMMARY_PACKING": "0", "PARSE_WORKERS": "1", "SUMMARY_CONCURRENCY": "1"}.items():
+        monkeypatch.setenv(key, value)
+
+    downloaded = []
+
+    def fake_download(driver, url, download_path):
+        os.makedirs(download_path, exist_ok=True)
+        file_path = os.path.join(download_path, f"{len(downloaded)}.hwp")
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write(FRONT_TEXT)
+        downloaded.append(url)
+        return {"status": "success", "file_path": file_path}
+
+    def fake_parse(file_path):
+        with open(file_path, encoding="utf-8") as f:
+            text = f.read()
+        return {"success": True, "full_text": text, "front_text": text, "parsed_file": file_path, "error": None}
+
+    monkeypatch.setattr(hwp_to_json, "setup_chrome_driver", lambda download_path: FakeDriver())
+    monkeypatch.setattr(hwp_to_json, "download_announcement_file", fake_download)
+    monkeypatch.setattr(hwp_to_json, "parse_downloaded_file", fake_parse)
+    monkeypatch.setattr(hwp_to_json, "ProcessPoolExecutor", ThreadPoolExecutor)
+    monkeypatch.setattr(hwp_to_json.time, "sleep", lambda seconds: None)
+
+    def run(announcements, argv=(), env=None):
+        for key, value in (env or {}).items():
+            monkeypatch.setenv(key, value)
+        store = AnnouncementStore(db_path)
+        if announcements:
+            store.record_crawl_run("AI", announcements, announcements)
+        store.close()
+        monkeypatch.setattr(hwp_to_json.sys, "argv", ["hwp_to_json.py", *argv])
+        hwp_to_json.main()
+        return AnnouncementStore(db_path)
+
+    run.downloaded = downloaded
+    run.db_path = db_path
+    return run
+
+
+def test_merge_without_packing_saves_local_summaries(pipeline, capsys):
+    store = pipeline([announcement(1001), announcement(1002, title="디지털트윈 실증")])
+
+    assert "오류 발생" not in capsys.readouterr().out
+    for uid in ("1001", "1002"):
+        saved = store.get_announcement(uid)
+        assert saved["ai_요약"]["사업목적"]
+        assert saved["ai_메타데이터"]["engine"] == "local"
+        # 로컬 추출 요약은 임시 결과: 요약 단계로 올리지 않고 실패로 남김
+        state = store.get_states([uid])[uid]
+        assert state["stage"] == "parsed" and state["failed_stage"] == "summarized"
+    assert [item["공고명"] for item in store.failed_announcements()] == ["AI 기반 제조 혁신 실증", "디지털트윈 실증"]
+
+
+def test_retry_failed_resummarizes_local_fallbacks(pipeline, capsys):
+    pipeline([announcement(1001)])
+    capsys.readouterr()
+
+    # 다음 실행: 로컬 요약만 있는 공고는 건너뛰지 않고 파싱 결과부터 다시 요약
+    store = pipeline([], argv=["--retry-failed"])
+    out = capsys.readouterr().out
+    assert "이전 실행에서 요약 완료" not in out
+    assert "parsed 단계 완료" in out
+    assert len(pipeline.downloaded) == 1
+    assert store.get_announcement("1001")["ai_요약"]["사업목적"]
+
+
+def defer_announcement(item):
+    """이전 실행에서 예산 부족으로 이월된 공고 기록"""
+    ledger = TokenLedger.from_env()
+    ledger.defer(extract_uid(item["상세_URL"]), item)
+    ledger.log.close()
+
+
+def test_triage_dry_run_does_not_write_store(pipeline, capsys):
+    defer_announcement(announcement(2001, title="AI 이월 공고"))
+    store = pipeline([announcement(1001)], argv=["--triage-dry-run"], env={"TRIAGE": "1"})
+
+    assert "이월 공고" in capsys.readouterr().out
+    assert store.get_announcement("2001") is None
+    assert [item["공고명"] for item in store.new_announcements()] == ["AI 기반 제조 혁신 실증"]
+    assert pipeline.downloaded == []
+
+
+def test_triage_dropped_carry_over_is_resolved(pipeline):
+    defer_announcement(announcement(2001, title="AI 이월 공고", deadline="2000.01.01"))
+    store = pipeline([announcement(1001)], env={"TRIAGE": "1"})
+
+    assert store.get_announcement("2001")["처리상태"].startswith("분류 제외")
+    assert TokenLedger.from_env().deferred_announcements() == []
+    assert pipeline.downloaded == [URL.format(1001)]
+
+
+def test_triage_and_relevance_hand_off(pipeline):
+    defer_announcement(announcement(2001, title="전통시장 활성화 지원"))
+    store = pipeline([
+        announcement(1001, title="AI 기반 제조 혁신 실증"),
+        announcement(1002, title="AI 디지털트윈 플랫폼 개발"),
+        announcement(1003, title="해양 생태계 조사"),
+        announcement(1004, title="AI 반도체 설계", status="마감"),
+    ], env={"TRIAGE": "1", "RELEVANCE": "1", "RELEVANCE_TOP_K": "2"})
+
+    # 제외 공고는 처리하지 않고, 뒤로 미룬 공고(키워드 없음)는 상위 K개 안에 들지 않음
+    assert pipeline.downloaded == [URL.format(1002), URL.format(1001)]
+    assert store.get_announcement("1004")["처리상태"].startswith("분류 제외")
+    for uid in ("1003", "2001"):
+        assert store.get_announcement(uid)["처리상태"].startswith("관련도 순위 밖")
+    assert store.get_announcement("1002")["관련도"] > store.get_announcement("1003")["관련도"]
+    assert store.get_announcement("1002")["ai_요약"]
+    # 순위 밖으로 밀린 이월 공고는 다음 실행에서 다시 가져오지 않음
+    assert TokenLedger.from_env().deferred_announcements() == []
+
+
+def test_resume_from_parsed_keeps_full_text_in_search_index(pipeline, tmp_path):
+    index_path = str(tmp_path / "search.db")
+    full_text = FRONT_TEXT + "5. 평가방법\n서면평가 후 발표평가로 최종 선정\n"
+    # 이전 실행에서 파싱까지 끝나고 중단된 상태
+    seed = AnnouncementStore(pipeline.db_path)
+    seed.record_crawl_run("AI", [announcement(1001)], [announcement(1001)])
+    seed.upsert_parse_result("1001", {"success": True, "parsed_file": str(tmp_path / "1001_parsed.txt"),
+                                      "full_text": full_text, "front_text": FRONT_TEXT})
+    seed.set_stage(["1001"], "parsed")
+    seed.close()
+    index = SearchIndex(index_path)
+    index.add("1001", announcement(1001), full_text)
+    index.close()
+
+    store = pipeline([], env={"SEARCH_INDEX": "1", "SEARCH_INDEX_PATH": index_path})
+
+    # 다운로드/파싱 없이 요약부터 이어서 처리하고, 색인된 전체 본문은 앞부분으로 덮어쓰지 않음
+    assert pipeline.downloaded == []
+    assert store.get_announcement("1001")["ai_요약"]["사업목적"]
+    assert [hit["uid"] for hit in SearchIndex(index_path).search("발표평가")] == ["1001"]
+
+
+def test_concurrent_hwp_parses_use_separate_temp_dirs(tmp_path, monkeypatch):
+    import shutil
+    import time
+    from types import SimpleNamespace
+
+    def fake_hwp5html(args, **kwargs):
+        output_dir, hwp_path = args[2], args[3]
+        with open(hwp_path, encoding="utf-8") as f:
+            text = f.read()
+        os.makedirs(output_dir)
+        with open(os.path.join(output_dir, "index.xhtml"), "w", encoding="utf-8") as f:
+            f.write(f"<html><body><p>{text}</p></body></html>")
+        return SimpleNamespace(returncode=0, stderr="")
+
+    def slow_first_copy(src, dst):
+        # 첫 작업자가 임시 폴더를 만든 뒤 복사 전에 멈춘 사이 다른 작업자가 끝나며 정리
+        if src.endswith("0.hwp"):
+            time.sleep(0.3)
+        return shutil.copyfile(src, dst)
+
+    monkeypatch.setattr(hwp_to_json.subprocess, "run", fake_hwp5html)
+    monkeypatch.setattr(hwp_to_json.shutil, "copy2", slow_first_copy)
+    paths = []
+    for i in range(4):
+        path = tmp_path / f"{i}.hwp"
+        path.write_text(f"공고 본문 {i}", encoding="utf-8")
+        paths.append(str(path))
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(hwp_to_json.parse_hwp_to_text, paths))
+
+    assert [result.get("full_text") for result in results] == [f"공고 본문 {i}" for i in range(4)]
+    assert sorted(os.listdir(tmp_path)) == [f"{i}.hwp" for i in range(4)]
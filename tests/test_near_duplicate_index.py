@@ -0,0 +1,36 @@
+"""NearDuplicateIndex 요약 재사용 조건 테스트"""
+
+from src.utils.near_duplicate_index import NearDuplicateIndex
+
+BASE = "\n".join(
+    f"{i}. 본 사업은 AI 기술의 해외 우수 인재를 국내로 유치하여 {i}번째 분야의 기술 경쟁력을 강화하고자 하며, "
+    f"연구개발비 {i * 3}억원과 정착지원금 {i}천만원을 지원합니다."
+    for i in range(1, 21)
+)
+SUMMARY = {"사업목적": "AI 해외인재 유치", "지원규모": "연구개발비 최대 60억원, 지원기간 2025.10.01 ~ 2026.09.30"}
+
+
+def make_index(tmp_path):
+    index = NearDuplicateIndex(index_file=str(tmp_path / "index.json"))
+    index.add("1", BASE + "\n지원기간: 2025.10.01 ~ 2026.09.30", SUMMARY, title="AI 해외인재 유치지원")
+    return index
+
+
+def test_reissue_with_same_amounts_reuses_summary(tmp_path):
+    reissued = BASE + "\n지원기간: 2025. 10. 1 ~ 2026. 9. 30\n※ 재공고: 접수기간 2025.11.01 ~ 2025.11.30"
+    match = make_index(tmp_path).find_similar(reissued, exclude_uid="2")
+    assert match and match["uid"] == "1"
+
+
+def test_corrected_amount_or_date_is_not_reused(tmp_path):
+    index = make_index(tmp_path)
+    amount_changed = BASE.replace("연구개발비 60억원", "연구개발비 45억원") + "\n지원기간: 2025.10.01 ~ 2026.09.30"
+    date_changed = BASE + "\n지원기간: 2025.12.01 ~ 2026.11.30"
+    assert index.find_similar(amount_changed, exclude_uid="2") is None
+    assert index.find_similar(date_changed, exclude_uid="2") is None
+
+
+def test_entries_without_amounts_are_not_reused(tmp_path):
+    index = make_index(tmp_path)
+    del index.entries["1"]["amounts"]
+    assert index.find_similar(BASE + "\n지원기간: 2025.10.01 ~ 2026.09.30", exclude_uid="2") is None
@@ -0,0 +1,49 @@
+"""NTISDataManager.mark_as_detailed 호환성 테스트 (순번/roRndUid 모두 허용)"""
+
+from src.utils.announcement_repository import AnnouncementRepository
+from src.utils.ntis_data_manager import NTISDataManager
+from src.utils.seen_index import SeenUidIndex
+
+URL = "https://www.ntis.go.kr/rndgate/eg/un/ra/view.do?roRndUid={}&flag=rndList"
+
+
+def make_manager(tmp_path):
+    manager = NTISDataManager(json_file_path=str(tmp_path / "managed.json"),
+                              seen_index=SeenUidIndex(db_path=str(tmp_path / "ntis.db")))
+    manager.repository.upsert({"공고명": "AI 공고", "상세_URL": URL.format(100), "접수일": "2025.09.01"})
+    return manager
+
+
+def test_mark_as_detailed_by_uid_or_sequence_number(tmp_path):
+    manager = make_manager(tmp_path)
+    data = {"announcements": [{"순번": "7", "공고명": "AI 공고", "상세_URL": URL.format(100)}]}
+
+    updated = manager.mark_as_detailed(data, "7", {"본문": "상세"})
+    assert updated["announcements"][0]["is_detailed"] is True
+    assert manager.repository.get("100").to_dict()["detail_data"] == {"본문": "상세"}
+
+    assert manager.mark_as_detailed(data, "100", {"본문": "갱신"})["announcements"][0]["detail_data"] == {"본문": "갱신"}
+
+
+def test_mark_as_detailed_updates_data_outside_repository(tmp_path):
+    manager = make_manager(tmp_path)
+    data = {"announcements": [{"순번": "3", "공고명": "다른 공고", "상세_URL": URL.format(200)}]}
+
+    updated = manager.mark_as_detailed(data, "3", {"본문": "상세"})
+    assert updated is data
+    assert data["announcements"][0]["is_detailed"] is True
+
+
+def test_mark_then_save_keeps_detailed_mark(tmp_path):
+    manager = make_manager(tmp_path)
+    data = manager.load_existing_data()
+    data["announcements"][0]["순번"] = "1"
+
+    # 예전 호출 방식: 반환값을 쓰지 않고 넘긴 data를 그대로 저장
+    manager.mark_as_detailed(data, "1", {"본문": "상세"})
+    assert manager.save_data(data)
+
+    assert manager.repository.get("100").to_dict()["is_detailed"] is True
+    # 파일에도 마크가 저장됨
+    reloaded = AnnouncementRepository(manager.json_file_path)
+    assert reloaded.get("100").to_dict()["detail_data"] == {"본문": "상세"}
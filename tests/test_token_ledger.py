@@ -0,0 +1,77 @@
+"""TokenLedger 예약/기록/이월 테스트"""
+
+import threading
+
+from src.data_processor.claude_summarizer import ClaudeSummarizer
+from src.data_processor.model_router import DEFAULT_TIERS, ModelRouter, worst_case_usage
+from src.utils.token_ledger import TokenLedger
+
+
+def make_ledger(tmp_path, **limits):
+    return TokenLedger(ledger_file=str(tmp_path / "token_ledger.json"), **limits)
+
+
+def test_cost_only_cap_blocks_concurrent_reservations(tmp_path):
+    ledger = make_ledger(tmp_path, daily_cost=0.01)
+    granted = []
+
+    def reserve():
+        granted.append(ledger.try_reserve(100, cost_usd=0.004))
+
+    threads = [threading.Thread(target=reserve) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # 토큰 한도가 없어도 예약한 비용 합계가 비용 한도를 넘지 않음
+    assert granted.count(True) == 2
+    assert ledger.remaining()["cost_usd"] <= 0.01 - 0.008 + 1e-9
+
+
+def test_record_and_release_free_reservations(tmp_path):
+    ledger = make_ledger(tmp_path, daily_tokens=10000, daily_cost=0.01)
+    assert ledger.try_reserve(6000, cost_usd=0.006)
+    assert not ledger.try_reserve(6000, cost_usd=0.001)
+    assert not ledger.try_reserve(1000, cost_usd=0.005)
+
+    # 실제 사용량만 남고 예약은 해제
+    ledger.record(2000, 500, cost_usd=0.001, reserved_tokens=6000, reserved_cost=0.006)
+    assert ledger.reserved_tokens == 0 and ledger.reserved_cost == 0
+    left = ledger.remaining()
+    assert left["tokens"] == 7500 and abs(left["cost_usd"] - 0.009) < 1e-9
+
+    assert ledger.try_reserve(7000, cost_usd=0.008)
+    ledger.release(7000, 0.008)
+    assert ledger.try_reserve(7000, cost_usd=0.008)
+
+
+def test_defer_and_resolve_persist_across_reload(tmp_path):
+    ledger = make_ledger(tmp_path, daily_tokens=1000)
+    ledger.defer("1", {"공고명": "이월 1", "마감일": "2099.12.31"})
+    ledger.defer("2", {"공고명": "이월 2", "마감일": "2099.12.31"})
+    ledger.resolve("1")
+    ledger.record(300, 100)
+    ledger.log.close()
+
+    reloaded = make_ledger(tmp_path, daily_tokens=1000)
+    assert [item["공고명"] for item in reloaded.deferred_announcements()] == ["이월 2"]
+    assert reloaded.remaining()["tokens"] == 600
+
+
+def test_worst_case_covers_escalation_and_repair_calls(monkeypatch):
+    summarizer = ClaudeSummarizer(api_key="")
+    # 출력 통계로 max_tokens를 상한까지 늘린 경우
+    monkeypatch.setattr(summarizer, "_output_budget", lambda: summarizer.max_output_tokens)
+    text = "사업목적: 인공지능 기반 제조 혁신 기술개발 및 현장 실증 지원 " * 20
+    single = worst_case_usage(summarizer, text)
+    routed = ModelRouter(summarizer, log_file=None).worst_case_usage(text)
+
+    request = summarizer._build_request(text)
+    request_input = summarizer._estimate_request_tokens(request)
+    # system 프롬프트/도구 정의가 포함된 실제 요청 입력과 실제 max_tokens 기준
+    assert request_input > summarizer._estimate_tokens(text)
+    assert single["tokens"] > 2 * request_input + 2 * summarizer.max_output_tokens
+    # 모델 단계마다 요약/보완 요청, 가장 비싼 모델까지
+    assert routed["tokens"] == len(DEFAULT_TIERS) * single["tokens"]
+    assert routed["cost_usd"] > 3 * single["cost_usd"]